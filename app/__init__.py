@@ -3,5 +3,6 @@ Dash 애플리케이션 패키지
 """
 
 from .layouts.main_layout import create_layout
+from .factory import create_app
 
-__all__ = ['create_layout']
+__all__ = ['create_layout', 'create_app']
@@ -2,36 +2,90 @@
 차트 업데이트 관련 콜백
 """
 
-from dash import Input, Output, State, html
-import pandas as pd
-from app.components.charts import create_timeseries_chart, create_spread_chart
+import json
+import dash
+from dash import Input, Output, State, html, ctx
+import dash_bootstrap_components as dbc
+from app.components.charts import (
+    create_timeseries_chart,
+    create_spread_chart,
+    build_timeseries_figure,
+    build_spread_figure,
+    build_correlation_figure,
+    build_rolling_correlation_figure,
+    build_change_figure,
+    build_box_figure
+)
 from app.components.tables import create_statistics_table, create_spread_statistics_table
-from app.utils.data_utils import normalize_data, calculate_spread, calculate_spread_statistics
+from app.utils.data_utils import (
+    normalize_data,
+    calculate_spread,
+    calculate_spread_statistics,
+    calculate_daily_changes,
+    dataset_items
+)
+from app.utils.shared_datasets import load_dataset_frame
+from app.utils.chart_utils import parse_relayout_range, slice_range
+from app.utils.figure_cache import FigureCache
+from app.utils.range_index import RangeIndex, get_range_index
+from app.utils.spread_matrix import screen_spreads, screener_records
+from app.utils.expression import calculate_expression_spread
+from app.utils.rolling import compute_rolling, overlay_indicators
+from app.utils.correlation import correlation_frame, pair_rolling_correlation
+from app.utils.stats_utils import summary_to_records
+from config import VALIDATE_FIGURES, FIGURE_CACHE_CONFIG, CORRELATION_CONFIG
 
 
-def register_chart_callbacks(app):
+def register_chart_callbacks(app, figure_cache: FigureCache = None):
     """
     차트 관련 콜백 등록
 
     Args:
         app: Dash 앱 인스턴스
+        figure_cache: Figure 캐시 (없으면 FIGURE_CACHE_CONFIG로 생성)
     """
+    if figure_cache is None:
+        figure_cache = FigureCache(FIGURE_CACHE_CONFIG['max_bytes'])
 
-    # 콜백: 시계열 차트
+    # 기본은 검증 없는 딕셔너리 빌더, 디버그 시 graph_objects 빌더
+    if VALIDATE_FIGURES:
+        timeseries_builder, spread_builder = create_timeseries_chart, create_spread_chart
+    else:
+        timeseries_builder, spread_builder = build_timeseries_figure, build_spread_figure
+
+    # 콜백: 시계열 차트 (확대 시 해당 구간만 원본 해상도로 다시 그림)
     @app.callback(
         Output('timeseries-chart', 'figure'),
         [Input('data-store', 'data'),
-         Input('normalize-toggle', 'value')],
+         Input('normalize-toggle', 'value'),
+         Input('overlay-toggle', 'value'),
+         Input('timeseries-chart', 'relayoutData')],
         prevent_initial_call=True
     )
-    def update_timeseries_chart(data_json, normalize):
-        if not data_json:
+    def update_timeseries_chart(dataset, normalize, overlay, relayout_data):
+        if not dataset:
             return {}
 
-        df = pd.read_json(data_json)
+        x_range = None
+        if ctx.triggered_id == 'timeseries-chart':
+            changed, x_range = parse_relayout_range(relayout_data)
+            if not changed:
+                return dash.no_update
 
         # 정규화 옵션
         is_normalized = 'normalize' in (normalize or [])
+        indicators = overlay_indicators(overlay or [])
+
+        # 전체 보기는 같은 데이터셋/옵션이면 캐시된 Figure 사용 (확대 구간은 캐시하지 않음)
+        cache_key = None
+        if x_range is None and dataset.get('key'):
+            cache_key = ('timeseries', dataset['key'], is_normalized, tuple(indicators),
+                         tuple(dataset_items(dataset)))
+            fig = figure_cache.get(cache_key)
+            if fig is not None:
+                return fig
+
+        df = load_dataset_frame(dataset)
 
         # 정규화: 첫 번째 값을 100으로
         if is_normalized:
@@ -39,44 +93,242 @@ def register_chart_callbacks(app):
         else:
             df_plot = df
 
-        return create_timeseries_chart(df_plot, is_normalized)
+        # 오버레이 지표는 전체 구간에서 계산한 뒤 잘라냄 (확대 시작부도 창이 채워진 값)
+        overlays = None
+        if indicators:
+            overlays = {name: slice_range(frame, x_range)
+                        for name, frame in compute_rolling(df_plot, indicators).items()}
+
+        fig = timeseries_builder(slice_range(df_plot, x_range), is_normalized, x_range, overlays)
+        if cache_key is not None:
+            figure_cache.put(cache_key, fig)
+
+        return fig
+
+    # 콜백: 일간 변화량 차트 및 박스플롯 (확대 시 변화량 차트만 다시 그림)
+    @app.callback(
+        [Output('change-chart', 'figure'),
+         Output('box-chart', 'figure')],
+        [Input('data-store', 'data'),
+         Input('change-chart', 'relayoutData')],
+        prevent_initial_call=True
+    )
+    def update_change_charts(dataset, relayout_data):
+        if not dataset:
+            return {}, {}
+
+        x_range = None
+        if ctx.triggered_id == 'change-chart':
+            changed, x_range = parse_relayout_range(relayout_data)
+            if not changed:
+                return dash.no_update, dash.no_update
+
+        cache_key = None
+        if x_range is None and dataset.get('key'):
+            cache_key = ('changes', dataset['key'])
+            cached = figure_cache.get(cache_key)
+            if cached is not None:
+                return cached['change'], cached['box']
+
+        changes = calculate_daily_changes(load_dataset_frame(dataset))
+
+        if x_range is not None:
+            return build_change_figure(slice_range(changes, x_range), x_range), dash.no_update
+
+        change_fig = build_change_figure(changes)
+        box_fig = build_box_figure(changes)
+        if cache_key is not None:
+            figure_cache.put(cache_key, {'change': change_fig, 'box': box_fig})
 
-    # 콜백: 스프레드 차트 및 통계 (자동 업데이트)
+        return change_fig, box_fig
+
+    # 콜백: 스프레드 차트 및 통계 (자동 업데이트, 확대 시 해당 구간 통계)
     @app.callback(
         [Output('spread-chart', 'figure'),
          Output('spread-stats', 'children')],
         [Input('spread-item1', 'value'),
          Input('spread-item2', 'value'),
-         Input('spread-operation', 'value')],
+         Input('spread-operation', 'value'),
+         Input('spread-expression', 'value'),
+         Input('spread-chart', 'relayoutData')],
         State('data-store', 'data'),
         prevent_initial_call=True
     )
-    def update_spread_chart(item1, item2, operation, data_json):
-        if not data_json or not item1 or not item2:
+    def update_spread_chart(item1, item2, operation, expression, relayout_data, dataset):
+        # 수식이 입력되면 항목/연산 대신 수식 사용
+        expression = ' '.join((expression or '').split())
+        if not dataset or (not expression and (not item1 or not item2)):
             return {}, html.Div()
 
-        df = pd.read_json(data_json)
+        x_range = None
+        if ctx.triggered_id == 'spread-chart':
+            changed, x_range = parse_relayout_range(relayout_data)
+            if not changed:
+                return dash.no_update, dash.no_update
+
+        spread_id = ('expression', expression) if expression else (item1, item2, operation)
+
+        # 전체 보기는 같은 데이터셋/항목/연산이면 캐시된 Figure와 통계 사용
+        cache_key = None
+        if x_range is None and dataset.get('key'):
+            cache_key = ('spread', dataset['key']) + spread_id
+            cached = figure_cache.get(cache_key)
+            if cached is not None:
+                stats_table = create_spread_statistics_table(cached['stats'], spread_label=cached['label'])
+                return cached['figure'], stats_table
+
+        df = load_dataset_frame(dataset)
 
         # 스프레드 계산
-        spread, label, yaxis_title = calculate_spread(df, item1, item2, operation)
+        if expression:
+            try:
+                spread, label, yaxis_title = calculate_expression_spread(df, expression)
+            except ValueError as e:
+                return {}, dbc.Alert(str(e), color='warning', className='mt-3')
+        else:
+            spread, label, yaxis_title = calculate_spread(df, item1, item2, operation)
+
+        if x_range is not None:
+            fig = spread_builder(slice_range(spread, x_range), label, yaxis_title, x_range)
+
+            # 확대 구간 통계는 스프레드 인덱스에서 조회
+            index_key = ('spread', dataset['key']) + spread_id if dataset.get('key') else None
+            index = get_range_index(index_key, lambda: RangeIndex(spread.index, spread.to_numpy()))
+            summary = index.summary(*index.locate(*x_range))
+            stats_data = summary_to_records(summary, [label]).get(label, {})
+            return fig, create_spread_statistics_table(stats_data, spread_label=label)
 
         # 차트 생성
-        fig = create_spread_chart(spread, label, yaxis_title)
+        fig = spread_builder(spread, label, yaxis_title)
 
         # 통계 정보 생성
         stats_data = calculate_spread_statistics(spread)
         stats_table = create_spread_statistics_table(stats_data, spread_label=label)
 
+        if cache_key is not None:
+            figure_cache.put(cache_key, {'figure': fig, 'stats': stats_data, 'label': label})
+
         return fig, stats_table
 
-    # 콜백: 통계표
+    # 콜백: 스프레드 스크리너 (전체 항목 쌍)
+    @app.callback(
+        Output('spread-screener', 'data'),
+        [Input('data-store', 'data'),
+         Input('spread-operation', 'value')],
+        prevent_initial_call=True
+    )
+    def update_spread_screener(dataset, operation):
+        if not dataset or len(dataset['series']) < 2:
+            return []
+
+        cache_key = None
+        if dataset.get('key'):
+            cache_key = ('screener', dataset['key'], operation)
+            records = figure_cache.get(cache_key)
+            if records is not None:
+                return records
+
+        records = screener_records(screen_spreads(load_dataset_frame(dataset), operation), operation)
+        if cache_key is not None:
+            figure_cache.put(cache_key, records)
+
+        return records
+
+    # 콜백: 스크리너 행 클릭 시 스프레드 차트 항목 선택
+    @app.callback(
+        [Output('spread-item1', 'value', allow_duplicate=True),
+         Output('spread-item2', 'value', allow_duplicate=True)],
+        Input('spread-screener', 'active_cell'),
+        prevent_initial_call=True
+    )
+    def select_screener_pair(active_cell):
+        if not active_cell or not active_cell.get('row_id'):
+            return dash.no_update, dash.no_update
+
+        item1, item2 = json.loads(active_cell['row_id'])
+        return item1, item2
+
+    # 콜백: 상관관계 히트맵 (데이터셋/계산 대상별 캐시)
+    @app.callback(
+        [Output('correlation-heatmap', 'figure'),
+         Output('correlation-section', 'style')],
+        [Input('data-store', 'data'),
+         Input('correlation-method', 'value')],
+        prevent_initial_call=True
+    )
+    def update_correlation_heatmap(dataset, method):
+        # 2개 이상의 항목이 있을 때만 표시
+        if not dataset or len(dataset['series']) < 2:
+            return {}, {'display': 'none'}
+
+        cache_key = None
+        if dataset.get('key'):
+            cache_key = ('correlation', dataset['key'], method)
+            fig = figure_cache.get(cache_key)
+            if fig is not None:
+                return fig, {'display': 'block'}
+
+        corr, labels = correlation_frame(load_dataset_frame(dataset), method)
+        fig = build_correlation_figure(corr, labels)
+        if cache_key is not None:
+            figure_cache.put(cache_key, fig)
+
+        return fig, {'display': 'block'}
+
+    # 콜백: 롤링 상관계수 (히트맵 셀 클릭 시 해당 쌍, 기본은 처음 두 항목)
+    @app.callback(
+        Output('rolling-correlation-chart', 'figure'),
+        [Input('data-store', 'data'),
+         Input('correlation-method', 'value'),
+         Input('correlation-window', 'value'),
+         Input('correlation-heatmap', 'clickData')],
+        prevent_initial_call=True
+    )
+    def update_rolling_correlation(dataset, method, window, click_data):
+        if not dataset or len(dataset['series']) < 2:
+            return {}
+
+        columns = dataset_items(dataset)
+        item1, item2 = columns[0], columns[1]
+        if click_data and click_data.get('points'):
+            point = click_data['points'][0]
+            if point.get('x') in columns and point.get('y') in columns and point['x'] != point['y']:
+                item1, item2 = point['y'], point['x']
+
+        window = max(int(window or CORRELATION_CONFIG['rolling_window']), 2)
+        corr = pair_rolling_correlation(load_dataset_frame(dataset), item1, item2, method, window)
+        return build_rolling_correlation_figure(corr, window)
+
+    # 콜백: 통계표 (시계열 차트 확대 시 보이는 구간 통계)
     @app.callback(
         Output('statistics-table', 'children'),
-        Input('stats-store', 'data'),
+        [Input('stats-store', 'data'),
+         Input('timeseries-chart', 'relayoutData')],
+        State('data-store', 'data'),
         prevent_initial_call=True
     )
-    def update_statistics_table(stats):
+    def update_statistics_table(stats, relayout_data, dataset):
         if not stats:
             return html.Div()
 
-        return create_statistics_table(stats)
+        x_range = None
+        if ctx.triggered_id == 'timeseries-chart':
+            changed, x_range = parse_relayout_range(relayout_data)
+            if not changed:
+                return dash.no_update
+
+        if x_range is None or not dataset:
+            return create_statistics_table(stats)
+
+        # 데이터셋별 인덱스에서 확대 구간 통계 조회
+        index_key = ('timeseries', dataset['key']) if dataset.get('key') else None
+        index = get_range_index(index_key, lambda: RangeIndex.from_frame(load_dataset_frame(dataset)))
+        summary = index.summary(*index.locate(*x_range))
+        range_stats = summary_to_records(summary, index.columns)
+
+        # 단위 등 구간과 무관한 정보는 전체 통계에서 유지
+        for item, item_stats in range_stats.items():
+            if 'unit' in stats.get(item, {}):
+                item_stats['unit'] = stats[item]['unit']
+
+        return create_statistics_table(range_stats)
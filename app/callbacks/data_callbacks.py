@@ -2,19 +2,32 @@
 데이터 로드 관련 콜백
 """
 
-from dash import Input, Output, State
+import dash
+from dash import Input, Output, State, Patch
 import pandas as pd
-from app.utils.data_utils import classify_items_by_type
+from app.utils.catalog import CatalogIndex
+from app.utils.data_utils import (
+    frame_to_dataset,
+    dataset_to_frame,
+    format_dates,
+    series_to_list,
+    series_digest,
+    dataset_key,
+    dataset_items,
+    order_items,
+    diff_selection
+)
+from app.utils.shared_datasets import share_frame, load_dataset_frame
 
 
-def register_data_callbacks(app, client, categories):
+def register_data_callbacks(app, client, catalog: CatalogIndex):
     """
     데이터 로드 관련 콜백 등록
 
     Args:
         app: Dash 앱 인스턴스
         client: API 클라이언트
-        categories: 카테고리 딕셔너리
+        catalog: 항목 카탈로그 인덱스
     """
 
     # 콜백: 데이터 로드
@@ -25,46 +38,125 @@ def register_data_callbacks(app, client, categories):
         [State('data-type-dropdown', 'value'),
          State('item-dropdown', 'value'),
          State('start-date', 'date'),
-         State('end-date', 'date')],
+         State('end-date', 'date'),
+         State('data-store', 'data')],
         prevent_initial_call=True
     )
-    def load_data(n_clicks, data_type, items, start_date, end_date):
+    def load_data(n_clicks, data_type, items, start_date, end_date, dataset):
         if not items:
             return None, None
 
-        # 항목별로 금리/환율 분류
-        if data_type == 'all':
-            interest_items, exchange_items = classify_items_by_type(items, categories)
-        elif data_type == 'interest_rate':
-            interest_items = items
-            exchange_items = []
-        else:  # exchange_rate
-            interest_items = []
-            exchange_items = items
-
-        # 데이터 조회 및 병합
-        dfs = []
-        all_stats = {}
-
-        if interest_items:
-            df_interest = client.get_interest_rates(interest_items, start_date, end_date)
-            dfs.append(df_interest)
-            stats_interest = client.get_statistics('interest_rate', interest_items, start_date, end_date)
-            all_stats.update(stats_interest)
-
-        if exchange_items:
-            df_exchange = client.get_exchange_rates(exchange_items, start_date, end_date)
-            dfs.append(df_exchange)
-            stats_exchange = client.get_statistics('exchange_rate', exchange_items, start_date, end_date)
-            all_stats.update(stats_exchange)
-
-        # DataFrame 병합
-        if len(dfs) > 1:
-            df = pd.concat(dfs, axis=1)
-        elif len(dfs) == 1:
-            df = dfs[0]
-        else:
-            return None, None
+        # 현재 데이터셋과 비교하여 새로 조회할 항목 결정
+        selection = diff_selection(dataset, items, start_date, end_date)
+        if selection is None:
+            df_new, new_stats = fetch_data(
+                client, catalog, data_type, items, start_date, end_date)
+            if df_new is None:
+                return None, None
+            payload = frame_to_dataset(df_new, start_date, end_date)
+            # 차트 콜백이 어느 워커에서 실행되든 변환 없이 바로 사용
+            share_frame(payload['key'], df_new)
+            return payload, new_stats
+
+        added, removed = selection
+        if not added and not removed:
+            return dash.no_update, dash.no_update
+
+        df_new, new_stats = fetch_data(
+            client, catalog, data_type, added, start_date, end_date)
+
+        # 통계는 변경된 항목만 갱신
+        stats_patch = Patch()
+        for item in removed:
+            del stats_patch[item]
+        for item, item_stats in new_stats.items():
+            stats_patch[item] = item_stats
+
+        # 날짜 인덱스가 같으면 변경된 시계열만 전송
+        if df_new is None or format_dates(df_new.index) == dataset['dates']:
+            digests = {item: digest for item, digest in dataset['digests'].items()
+                       if item not in removed}
+            data_patch = Patch()
+            for item in removed:
+                del data_patch['series'][item]
+                del data_patch['digests'][item]
+            if df_new is not None:
+                for col in df_new.columns:
+                    digests[col] = series_digest(df_new[col])
+                    data_patch['series'][col] = series_to_list(df_new[col])
+                    data_patch['digests'][col] = digests[col]
+
+            # 새 항목은 series 끝에 붙으므로 항목 선택 순서는 items로 따로 전송
+            kept = [item for item in dataset_items(dataset) if item not in removed]
+            columns = order_items(kept + list(df_new.columns if df_new is not None else []), items)
+            key = dataset_key(start_date, end_date, digests)
+            data_patch['items'] = columns
+            data_patch['key'] = key
+
+            # 전체 교체와 같이 변경된 데이터셋을 공유 메모리에 등록
+            df = load_dataset_frame(dataset).drop(columns=removed)
+            if df_new is not None:
+                df = pd.concat([df, df_new], axis=1)
+            share_frame(key, df[columns])
+            return data_patch, stats_patch
+
+        # 날짜 인덱스가 달라지면 기존 항목은 재조회 없이 병합하여 전체 교체
+        df = dataset_to_frame(dataset).drop(columns=removed)
+        df = pd.concat([df, df_new], axis=1)
+        df = df[order_items(list(df.columns), items)]
+        payload = frame_to_dataset(df, start_date, end_date)
+        share_frame(payload['key'], df)
+        return payload, stats_patch
+
+
+def fetch_data(client, catalog, data_type, items, start_date, end_date):
+    """
+    항목 데이터 및 통계 조회
+
+    Args:
+        client: API 클라이언트
+        catalog: 항목 카탈로그 인덱스
+        data_type: 데이터 타입 ('interest_rate', 'exchange_rate', 'all')
+        items: 조회할 항목 리스트
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+
+    Returns:
+        (병합된 DataFrame 또는 None, {item: stats} 딕셔너리) 튜플
+    """
+    # 항목별로 금리/환율 분류
+    if data_type == 'all':
+        interest_items, exchange_items = catalog.classify(items)
+    elif data_type == 'interest_rate':
+        interest_items = items
+        exchange_items = []
+    else:  # exchange_rate
+        interest_items = []
+        exchange_items = items
+
+    # 데이터 조회 및 병합
+    dfs = []
+    all_stats = {}
+
+    if interest_items:
+        df_interest = client.get_interest_rates(interest_items, start_date, end_date)
+        dfs.append(df_interest)
+        stats_interest = client.get_statistics('interest_rate', interest_items, start_date, end_date)
+        all_stats.update(stats_interest)
+
+    if exchange_items:
+        df_exchange = client.get_exchange_rates(exchange_items, start_date, end_date)
+        dfs.append(df_exchange)
+        stats_exchange = client.get_statistics('exchange_rate', exchange_items, start_date, end_date)
+        all_stats.update(stats_exchange)
+
+    # DataFrame 병합 (금리/환율을 나눠 조회하므로 항목 선택 순서로 다시 정렬)
+    if len(dfs) > 1:
+        df = pd.concat(dfs, axis=1)
+        df = df[order_items(list(df.columns), items)]
+    elif len(dfs) == 1:
+        df = dfs[0]
+    else:
+        return None, all_stats
 
-        # JSON으로 변환
-        return df.to_json(date_format='iso'), all_stats
+    return df, all_stats
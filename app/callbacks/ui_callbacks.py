@@ -2,108 +2,56 @@
 UI 상태 관련 콜백
 """
 
-import dash
-from dash import Input, Output, State
-from datetime import datetime, timedelta
+from dash import Input, Output, State, ClientsideFunction
+from app.utils.catalog import CatalogIndex
+from app.utils.data_utils import dataset_items
 from config import PERIOD_BUTTONS
 
 
-def register_ui_callbacks(app, categories):
+def register_ui_callbacks(app, catalog: CatalogIndex):
     """
     UI 관련 콜백 등록
 
+    기간 선택과 카테고리 옵션 계산은 assets/clientside.js의 클라이언트 사이드
+    함수로 처리하고, 데이터가 필요한 콜백만 서버에 등록한다.
+    항목 드롭다운은 카탈로그가 커서 서버에서 검색어에 맞는 상위 k개만 보낸다.
+
     Args:
         app: Dash 앱 인스턴스
-        categories: 카테고리 딕셔너리
+        catalog: 항목 카탈로그 인덱스
     """
 
-    # 콜백: 기간 빠른 선택
-    @app.callback(
-        [Output('start-date', 'date'),
-         Output('period-1y', 'outline'),
-         Output('period-3y', 'outline'),
-         Output('period-5y', 'outline'),
-         Output('period-10y', 'outline'),
-         Output('period-1y', 'color'),
-         Output('period-3y', 'color'),
-         Output('period-5y', 'color'),
-         Output('period-10y', 'color')],
-        [Input('period-1y', 'n_clicks'),
-         Input('period-3y', 'n_clicks'),
-         Input('period-5y', 'n_clicks'),
-         Input('period-10y', 'n_clicks'),
-         Input('start-date', 'date')],
-        [State('end-date', 'date')],
+    # 클라이언트 사이드 콜백: 기간 빠른 선택
+    app.clientside_callback(
+        ClientsideFunction(namespace='ui', function_name='update_period'),
+        [Output('start-date', 'date')] +
+        [Output(btn['id'], 'outline') for btn in PERIOD_BUTTONS] +
+        [Output(btn['id'], 'color') for btn in PERIOD_BUTTONS],
+        [Input(btn['id'], 'n_clicks') for btn in PERIOD_BUTTONS] +
+        [Input('start-date', 'date')],
+        [State('end-date', 'date'),
+         State('period-store', 'data')],
         prevent_initial_call=True
     )
-    def update_period(n1, n3, n5, n10, start_date, end_date):
-        ctx = dash.callback_context
-        if not ctx.triggered:
-            return dash.no_update
-
-        button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-
-        # 날짜가 수동으로 변경된 경우 모든 버튼 비활성화
-        if button_id == 'start-date':
-            return dash.no_update, True, True, True, True, 'secondary', 'secondary', 'secondary', 'secondary'
-
-        # 버튼 클릭 시
-        new_start_date = None
-        active_buttons = [True, True, True, True]
-        button_colors = ['secondary', 'secondary', 'secondary', 'secondary']
-
-        # 버튼별 처리
-        for idx, btn in enumerate(PERIOD_BUTTONS):
-            if button_id == btn['id']:
-                new_start_date = (datetime.now() - timedelta(days=btn['days'])).strftime('%Y-%m-%d')
-                active_buttons[idx] = False
-                button_colors[idx] = 'primary'
-                break
-
-        return new_start_date, *active_buttons, *button_colors
 
-    # 콜백: 카테고리 드롭다운 업데이트
-    @app.callback(
+    # 클라이언트 사이드 콜백: 카테고리 드롭다운 업데이트
+    app.clientside_callback(
+        ClientsideFunction(namespace='ui', function_name='update_category_dropdown'),
         Output('category-dropdown', 'options'),
-        Input('data-type-dropdown', 'value')
+        Input('data-type-dropdown', 'value'),
+        State('categories-store', 'data')
     )
-    def update_category_dropdown(data_type):
-        if data_type == 'interest_rate':
-            cats = categories['금리']
-        elif data_type == 'exchange_rate':
-            cats = categories['환율']
-        else:  # 'all'
-            cats = {}
-            cats.update(categories['금리'])
-            cats.update(categories['환율'])
-
-        return [{'label': cat, 'value': cat} for cat in cats.keys()]
 
-    # 콜백: 항목 드롭다운 업데이트
+    # 콜백: 항목 드롭다운 검색 (선택된 항목 + 검색 결과 상위 k개)
     @app.callback(
         Output('item-dropdown', 'options'),
-        [Input('data-type-dropdown', 'value'),
-         Input('category-dropdown', 'value')]
+        [Input('item-dropdown', 'search_value'),
+         Input('data-type-dropdown', 'value'),
+         Input('category-dropdown', 'value')],
+        State('item-dropdown', 'value')
     )
-    def update_item_dropdown(data_type, selected_categories):
-        if not selected_categories:
-            return []
-
-        if data_type == 'interest_rate':
-            all_cats = categories['금리']
-        elif data_type == 'exchange_rate':
-            all_cats = categories['환율']
-        else:  # 'all'
-            all_cats = {}
-            all_cats.update(categories['금리'])
-            all_cats.update(categories['환율'])
-
-        items = []
-        for cat in selected_categories:
-            if cat in all_cats:
-                items.extend(all_cats[cat])
-
-        return [{'label': item, 'value': item} for item in items]
+    def update_item_dropdown(search_value, data_type, selected_categories, selected_items):
+        return catalog.options(search_value, data_type or 'all', selected_categories, selected_items)
 
     # 콜백: 스프레드 섹션 표시 여부 및 자동 설정
     @app.callback(
@@ -115,22 +63,20 @@ def register_ui_callbacks(app, categories):
         Input('data-store', 'data'),
         prevent_initial_call=True
     )
-    def update_spread_section(data_json):
-        import pandas as pd
-
-        if not data_json:
+    def update_spread_section(dataset):
+        if not dataset:
             return {'display': 'none'}, [], [], None, None
 
-        df = pd.read_json(data_json)
+        columns = dataset_items(dataset)
 
         # 2개 이상의 항목이 있을 때만 스프레드 섹션 표시
-        if len(df.columns) < 2:
+        if len(columns) < 2:
             return {'display': 'none'}, [], [], None, None
 
-        options = [{'label': col, 'value': col} for col in df.columns]
+        options = [{'label': col, 'value': col} for col in columns]
 
         # 첫 번째와 두 번째 항목을 자동으로 설정
-        item1_value = df.columns[0] if len(df.columns) > 0 else None
-        item2_value = df.columns[1] if len(df.columns) > 1 else None
+        item1_value = columns[0]
+        item2_value = columns[1]
 
         return {'display': 'block'}, options, options, item1_value, item2_value
@@ -4,12 +4,16 @@
 
 from .charts import (
     create_timeseries_chart,
-    create_spread_chart
+    create_spread_chart,
+    build_timeseries_figure,
+    build_spread_figure
 )
 from .tables import create_statistics_table
 
 __all__ = [
     'create_timeseries_chart',
     'create_spread_chart',
+    'build_timeseries_figure',
+    'build_spread_figure',
     'create_statistics_table'
 ]
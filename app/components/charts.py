@@ -2,34 +2,84 @@
 재사용 가능한 차트 컴포넌트
 """
 
+import copy
+import logging
+from functools import lru_cache
+import plotly.colors
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
-from typing import Optional
-from app.utils.chart_utils import should_use_secondary_axis, get_chart_colors
-from config import CHART_CONFIG
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from app.utils.chart_utils import (
+    should_use_secondary_axis,
+    get_chart_colors,
+    plan_rendering,
+    histogram_bin_edges,
+    compute_histogram
+)
+from app.utils.stats_utils import box_statistics
+from app.utils.downsampling import downsample_series
+from app.utils.figure_encoding import encode_traces, supports_typed_arrays
+from config import BOX_CONFIG, CHART_CONFIG, CORRELATION_CONFIG, ROLLING_CONFIG, ROLLING_INDICATOR_NAMES
 
+LINE_HOVERTEMPLATE = '<b>%{fullData.name}</b><br>날짜: %{x}<br>값: %{y:.2f}<extra></extra>'
+SPREAD_HOVERTEMPLATE = '<b>%{fullData.name}</b><br>날짜: %{x}<br>값: %{y:.4f}<extra></extra>'
 
-def create_timeseries_chart(df: pd.DataFrame, is_normalized: bool = False) -> go.Figure:
+# 항목 선 색 (plotly 기본 색 순환과 동일)
+SERIES_COLORS = plotly.colors.qualitative.Plotly
+
+# 오버레이 지표별 선 모양 (밴드/채널 상하단은 같은 모양)
+OVERLAY_DASHES = {
+    'bb_upper': 'dash',
+    'bb_lower': 'dash',
+    'channel_high': 'dot',
+    'channel_low': 'dot',
+}
+
+logger = logging.getLogger(__name__)
+
+# 트레이스 타입별 graph_objects 클래스 (검증 빌더용)
+TRACE_CLASSES = {
+    'scatter': go.Scatter,
+    'scattergl': go.Scattergl,
+    'bar': go.Bar,
+}
+
+# 서브플롯 축 배치: 메인 차트(x, y), 보조 축(y3), 히스토그램(x2, y2)
+MAIN_AXES = dict(xaxis='x', yaxis='y')
+SECONDARY_AXES = dict(xaxis='x', yaxis='y3')
+HISTOGRAM_AXES = dict(xaxis='x2', yaxis='y2')
+
+# 값 스케일이 달라 아래 지표 패널에 그리는 지표 (RSI: 왼쪽 y4, 변동성: 오른쪽 y5)
+PANEL_AXES = {
+    'rsi': dict(xaxis='x', yaxis='y4'),
+    'volatility': dict(xaxis='x', yaxis='y5'),
+}
+
+
+def panel_indicators(overlays: Optional[Dict[str, pd.DataFrame]]) -> Tuple[str, ...]:
+    """오버레이 중 지표 패널에 그릴 지표 (PANEL_AXES 순서)"""
+    return tuple(name for name in PANEL_AXES if name in (overlays or {}))
+
+
+@lru_cache(maxsize=None)
+def get_figure_skeleton(kind: str, panel: Tuple[str, ...] = ()) -> dict:
     """
-    시계열 차트 생성 (히스토그램 포함)
+    차트 종류별 레이아웃 골격 생성 (종류별로 한 번만 생성)
+
+    make_subplots와 템플릿/범례/축 설정은 검증 비용이 커서 매 콜백마다
+    만들지 않고, 여기서 만든 레이아웃 딕셔너리를 복사하여 사용한다.
 
     Args:
-        df: 데이터 DataFrame
-        is_normalized: 정규화 여부
+        kind: 'single' (단일 축), 'dual' (이중 축), 'spread' (스프레드)
+        panel: 아래 지표 패널에 그릴 지표 (panel_indicators 결과, 없으면 패널 없음)
 
     Returns:
-        Plotly Figure
+        레이아웃 딕셔너리 (수정하지 말고 복사하여 사용)
     """
     colors = get_chart_colors()
-    config = CHART_CONFIG['timeseries']
-
-    # 정규화되면 단일 축, 아니면 스케일 차이 확인하여 보조 축 사용 결정
-    if is_normalized:
-        use_secondary = False
-        sorted_cols = list(df.columns)
-    else:
-        use_secondary, sorted_cols = should_use_secondary_axis(df)
+    config = CHART_CONFIG['spread' if kind == 'spread' else 'timeseries']
 
     # 히스토그램이 있는 서브플롯 생성
     fig = make_subplots(
@@ -40,46 +90,26 @@ def create_timeseries_chart(df: pd.DataFrame, is_normalized: bool = False) -> go
         shared_yaxes=True
     )
 
-    if use_secondary and len(df.columns) >= 2:
-        # 첫 번째 항목은 주 축
-        col = sorted_cols[0]
-        fig.add_trace(go.Scatter(
-            x=df.index,
-            y=df[col],
-            mode='lines',
-            name=col,
-            line=dict(width=2),
-            yaxis='y',
-            hovertemplate='<b>%{fullData.name}</b><br>날짜: %{x}<br>값: %{y:.2f}<extra></extra>'
-        ), row=1, col=1)
-
-        # 나머지는 보조 축
-        for col in sorted_cols[1:]:
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df[col],
-                mode='lines',
-                name=col,
-                line=dict(width=2),
-                yaxis='y3',
-                hovertemplate='<b>%{fullData.name}</b><br>날짜: %{x}<br>값: %{y:.2f}<extra></extra>'
-            ), row=1, col=1)
-
-        # 히스토그램 추가
-        for col in df.columns:
-            fig.add_trace(go.Histogram(
-                y=df[col],
-                name=col,
-                showlegend=False
-            ), row=1, col=2)
+    fig.update_layout(
+        template=config['template'],
+        hovermode=config['hovermode'],
+        xaxis_title="날짜",
+        xaxis_type='date',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=0.85
+        ),
+        height=config['height'],
+        bargap=0.1
+    )
 
-        # 레이아웃 설정 (이중 축)
+    # 이중 축 설정
+    if kind == 'dual':
         fig.update_layout(
-            template=config['template'],
-            hovermode=config['hovermode'],
-            xaxis_title="날짜",
             yaxis=dict(
-                title=sorted_cols[0],
                 titlefont=dict(color=colors['primary']),
                 tickfont=dict(color=colors['primary'])
             ),
@@ -90,131 +120,571 @@ def create_timeseries_chart(df: pd.DataFrame, is_normalized: bool = False) -> go
                 anchor='x',
                 overlaying='y',
                 side='right'
-            ),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=0.85
-            ),
-            height=config['height'],
-            bargap=0.1
+            )
         )
-    else:
-        # 단일 축 사용
-        for col in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df[col],
-                mode='lines',
-                name=col,
-                line=dict(width=2),
-                hovertemplate='<b>%{fullData.name}</b><br>날짜: %{x}<br>값: %{y:.2f}<extra></extra>'
-            ), row=1, col=1)
-
-        # 히스토그램 추가
-        for col in df.columns:
-            fig.add_trace(go.Histogram(
-                y=df[col],
-                name=col,
-                showlegend=False
-            ), row=1, col=2)
-
-        yaxis_title = "지수 (시작=100)" if is_normalized else "값"
 
+    # 지표 패널: 메인 차트/히스토그램을 위로 올리고 아래에 RSI(왼쪽)/변동성(오른쪽) 축
+    if panel:
+        split = config['indicator_panel']
+        top = [split + config['indicator_gap'], 1]
         fig.update_layout(
-            template=config['template'],
-            hovermode=config['hovermode'],
-            xaxis_title="날짜",
-            yaxis_title=yaxis_title,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=0.85
-            ),
-            height=config['height'],
-            bargap=0.1
+            height=round(config['height'] * (1 + split)),
+            xaxis=dict(anchor=PANEL_AXES[panel[0]]['yaxis']),
+            yaxis=dict(domain=top),
+            yaxis2=dict(domain=top)
         )
+        if 'rsi' in panel:
+            fig.update_layout(yaxis4=dict(title='RSI', domain=[0, split], anchor='x', range=[0, 100]))
+        if 'volatility' in panel:
+            volatility_axis = dict(title='변동성', domain=[0, split], anchor='x', side='right')
+            if 'rsi' in panel:
+                volatility_axis.update(overlaying='y4', showgrid=False)
+            fig.update_layout(yaxis5=volatility_axis)
 
     # X축 레이블 숨김 (히스토그램)
     fig.update_xaxes(title_text="", showticklabels=False, row=1, col=2)
 
-    return fig
+    return fig.to_dict()['layout']
 
 
-def create_spread_chart(spread: pd.Series, label: str, yaxis_title: str) -> go.Figure:
+def new_layout(kind: str, yaxis_title: str, x_range: Optional[tuple] = None,
+               panel: Tuple[str, ...] = ()) -> dict:
     """
-    스프레드 차트 생성 (히스토그램 포함)
+    캐시된 골격을 복사하여 레이아웃 딕셔너리 생성
 
     Args:
-        spread: 스프레드 데이터 Series
-        label: 차트 라벨
-        yaxis_title: Y축 제목
+        kind: 차트 종류 ('single', 'dual', 'spread')
+        yaxis_title: 주 Y축 제목
+        x_range: 확대된 X축 (시작, 끝) 범위 (None이면 전체)
+        panel: 지표 패널에 그릴 지표 (get_figure_skeleton 참고)
 
     Returns:
-        Plotly Figure
+        레이아웃 딕셔너리
     """
-    colors = get_chart_colors()
-    config = CHART_CONFIG['spread']
+    layout = copy.deepcopy(get_figure_skeleton(kind, panel))
+    layout['yaxis'].setdefault('title', {})['text'] = yaxis_title
 
-    # 히스토그램이 있는 서브플롯 생성
-    fig = make_subplots(
-        rows=1, cols=2,
-        column_widths=config['column_widths'],
-        horizontal_spacing=config['horizontal_spacing'],
-        specs=[[{"type": "scatter"}, {"type": "bar"}]],
-        shared_yaxes=True
-    )
+    # 확대 상태 유지
+    if x_range is not None:
+        layout['xaxis']['range'] = list(x_range)
+
+    return layout
+
+
+def line_trace(series: pd.Series, trace_type: str, max_points: int, **props) -> Tuple[str, dict]:
+    """
+    다운샘플링된 라인 트레이스 사양 생성
+
+    Args:
+        series: 값 Series (인덱스: 날짜)
+        trace_type: 'scatter' 또는 'scattergl'
+        max_points: 트레이스당 최대 포인트 수
+        **props: 추가 트레이스 속성
 
-    # 라인 플롯
-    fig.add_trace(go.Scatter(
-        x=spread.index,
-        y=spread,
+    Returns:
+        (트레이스 타입, 속성 딕셔너리) 튜플
+    """
+    line_data = downsample_series(series, max_points)
+    return trace_type, dict(
+        x=line_data.index.to_numpy(dtype='datetime64[ns]'),
+        y=line_data.to_numpy(dtype=float),
         mode='lines',
-        name=label,
-        line=dict(width=2, color=colors['spread']),
-        hovertemplate='<b>%{fullData.name}</b><br>날짜: %{x}<br>값: %{y:.4f}<extra></extra>'
-    ), row=1, col=1)
-
-    # 히스토그램 추가
-    fig.add_trace(go.Histogram(
-        y=spread,
-        name=label,
+        name=series.name,
+        **props
+    )
+
+
+def histogram_trace(values: np.ndarray, bins, name: str, with_width: bool = False,
+                    **props) -> Tuple[str, dict]:
+    """
+    서버에서 구간을 계산한 가로 막대 히스토그램 트레이스 사양 생성
+
+    Args:
+        values: 값 배열
+        bins: 구간 수, 구간 규칙 이름 또는 구간 경계 배열
+        name: 트레이스 이름
+        with_width: 막대 폭을 구간 폭으로 지정할지 여부 (구간이 항목별로 다를 때)
+        **props: 추가 트레이스 속성
+
+    Returns:
+        (트레이스 타입, 속성 딕셔너리) 튜플
+    """
+    centers, counts, widths = compute_histogram(values, bins)
+    if with_width:
+        props['width'] = widths
+    return 'bar', dict(
+        x=counts,
+        y=centers,
+        orientation='h',
+        name=name,
         showlegend=False,
-        marker=dict(color=colors['spread'])
-    ), row=1, col=2)
-
-    # 평균선 추가
-    mean_val = spread.mean()
-    fig.add_hline(
-        y=mean_val,
-        line_dash="dash",
-        line_color=colors['mean_line'],
-        annotation_text=f"평균: {mean_val:.4f}",
-        annotation_position="right",
-        row=1, col=1
+        **props,
+        **HISTOGRAM_AXES
     )
 
-    fig.update_layout(
-        template=config['template'],
-        hovermode=config['hovermode'],
-        xaxis_title="날짜",
-        yaxis_title=yaxis_title,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=0.85
+
+def timeseries_traces(df: pd.DataFrame,
+                      is_normalized: bool = False,
+                      overlays: Optional[Dict[str, pd.DataFrame]] = None) -> Tuple[str, str, List[tuple]]:
+    """
+    시계열 차트 트레이스 사양 생성 (두 빌더가 공유)
+
+    라인 트레이스는 트레이스당 포인트 예산(max_points_per_trace)에 맞게
+    다운샘플링되며, 히스토그램은 원본 데이터로 서버에서 구간을 계산하여
+    가로 막대로 그린다.
+    예상 렌더링 비용이 webgl_threshold를 넘으면 Scattergl로 그린다.
+    오버레이 지표는 앞쪽 max_overlay_series개 항목에 대해 같은 축에 얇은 선으로 그린다.
+    스케일이 다른 변동성/RSI는 아래 지표 패널 축(PANEL_AXES)에 그린다.
+
+    Args:
+        df: 데이터 DataFrame
+        is_normalized: 정규화 여부
+        overlays: 오버레이 지표 {지표 이름: df와 같은 모양의 DataFrame} (compute_rolling 결과)
+
+    Returns:
+        (차트 종류, 주 Y축 제목, [(트레이스 타입, 속성), ...]) 튜플
+    """
+    config = CHART_CONFIG['timeseries']
+    overlays = overlays or {}
+    overlay_cols = list(df.columns[:ROLLING_CONFIG['max_overlay_series']]) if overlays else []
+
+    # 렌더링 비용에 따라 WebGL 사용 여부 및 포인트 예산 결정 (오버레이 포함)
+    n_lines = len(df.columns) + len(overlays) * len(overlay_cols)
+    use_webgl, max_points, cost = plan_rendering(n_lines, len(df), config)
+    scatter = 'scattergl' if use_webgl else 'scatter'
+    logger.info("timeseries render cost: traces=%d points=%d cost=%d webgl=%s",
+                n_lines, len(df), cost, use_webgl)
+
+    # 오버레이가 있으면 항목 선 색을 고정하여 지표 선과 맞춤 (색 순환이 밀리지 않게)
+    colorway = SERIES_COLORS if overlays else [None]
+
+    def line_style(idx):
+        color = colorway[idx % len(colorway)]
+        return dict(width=2) if color is None else dict(width=2, color=color)
+
+    def overlay_traces(col, idx, axes):
+        if col not in overlay_cols:
+            return
+        for name, frame in overlays.items():
+            label = ROLLING_INDICATOR_NAMES.get(name, name.upper())
+            yield line_trace(
+                frame[col].rename(f"{col} {label}"), scatter, max_points,
+                line=dict(width=1, dash=OVERLAY_DASHES.get(name, 'solid'),
+                          color=colorway[idx % len(colorway)]),
+                opacity=0.7,
+                legendgroup=col,
+                hovertemplate=LINE_HOVERTEMPLATE,
+                **PANEL_AXES.get(name, axes)
+            )
+
+    # 정규화되면 단일 축, 아니면 스케일 차이 확인하여 보조 축 사용 결정
+    if is_normalized:
+        use_secondary = False
+        sorted_cols = list(df.columns)
+    else:
+        use_secondary, sorted_cols = should_use_secondary_axis(df)
+
+    traces = []
+
+    if use_secondary and len(df.columns) >= 2:
+        # 첫 번째 항목은 주 축, 나머지는 보조 축
+        for idx, col in enumerate(sorted_cols):
+            axes = MAIN_AXES if idx == 0 else SECONDARY_AXES
+            traces.append(line_trace(
+                df[col], scatter, max_points,
+                line=line_style(idx),
+                legendgroup=col,
+                hovertemplate=LINE_HOVERTEMPLATE,
+                **axes
+            ))
+            traces.extend(overlay_traces(col, idx, axes))
+
+        # 히스토그램 추가 (축 스케일이 달라 항목별 구간 사용)
+        for col in df.columns:
+            traces.append(histogram_trace(
+                df[col].to_numpy(dtype=float), config['histogram_bins'], col, with_width=True))
+
+        return 'dual', sorted_cols[0], traces
+
+    # 단일 축 사용
+    for idx, col in enumerate(df.columns):
+        traces.append(line_trace(
+            df[col], scatter, max_points,
+            line=line_style(idx),
+            legendgroup=col,
+            hovertemplate=LINE_HOVERTEMPLATE,
+            **MAIN_AXES
+        ))
+        traces.extend(overlay_traces(col, idx, MAIN_AXES))
+
+    # 히스토그램 추가 (단일 축이므로 모든 항목이 같은 구간 공유)
+    edges = histogram_bin_edges(df.to_numpy(dtype=float), config['histogram_bins'])
+    for col in df.columns:
+        traces.append(histogram_trace(df[col].to_numpy(dtype=float), edges, col))
+
+    yaxis_title = "지수 (시작=100)" if is_normalized else "값"
+    return 'single', yaxis_title, traces
+
+
+def spread_traces(spread: pd.Series, label: str) -> Tuple[List[tuple], dict, dict]:
+    """
+    스프레드 차트 트레이스 및 평균선 사양 생성 (두 빌더가 공유)
+
+    Args:
+        spread: 스프레드 데이터 Series
+        label: 차트 라벨
+
+    Returns:
+        ([(트레이스 타입, 속성), ...], 평균선 shape, 평균 annotation) 튜플
+    """
+    colors = get_chart_colors()
+    config = CHART_CONFIG['spread']
+
+    use_webgl, max_points, cost = plan_rendering(1, len(spread), config)
+    logger.info("spread render cost: traces=1 points=%d cost=%d webgl=%s",
+                len(spread), cost, use_webgl)
+
+    traces = [
+        # 라인 플롯 (포인트 예산에 맞게 다운샘플링)
+        line_trace(
+            spread.rename(label), 'scattergl' if use_webgl else 'scatter', max_points,
+            line=dict(width=2, color=colors['spread']),
+            hovertemplate=SPREAD_HOVERTEMPLATE,
+            **MAIN_AXES
         ),
-        height=config['height'],
-        bargap=0.1
+        # 히스토그램 추가 (서버에서 구간 계산)
+        histogram_trace(
+            spread.to_numpy(dtype=float), config['histogram_bins'], label,
+            marker=dict(color=colors['spread'])
+        )
+    ]
+
+    # 평균선
+    mean_val = float(spread.mean())
+    shape = dict(
+        type='line',
+        xref='x domain', x0=0, x1=1,
+        yref='y', y0=mean_val, y1=mean_val,
+        line=dict(dash='dash', color=colors['mean_line'])
+    )
+    annotation = dict(
+        xref='x domain', x=1, xanchor='left',
+        yref='y', y=mean_val, yanchor='middle',
+        text=f"평균: {mean_val:.4f}",
+        showarrow=False
     )
 
-    # X축 레이블 숨김
-    fig.update_xaxes(title_text="", showticklabels=False, row=1, col=2)
+    return traces, shape, annotation
+
+
+def create_timeseries_chart(df: pd.DataFrame,
+                            is_normalized: bool = False,
+                            x_range: Optional[tuple] = None,
+                            overlays: Optional[Dict[str, pd.DataFrame]] = None) -> go.Figure:
+    """
+    시계열 차트 생성 (히스토그램 포함, graph_objects 검증 빌더)
+
+    트레이스마다 검증을 거치므로 디버그용으로 사용하고,
+    콜백에서는 build_timeseries_figure를 사용한다.
+
+    Args:
+        df: 데이터 DataFrame
+        is_normalized: 정규화 여부
+        x_range: 확대된 X축 (시작, 끝) 범위 (None이면 전체)
+        overlays: 오버레이 지표 {지표 이름: df와 같은 모양의 DataFrame} (compute_rolling 결과)
+
+    Returns:
+        Plotly Figure
+    """
+    kind, yaxis_title, traces = timeseries_traces(df, is_normalized, overlays)
+    traces = encode_traces(traces, typed=False)
+
+    # 골격은 이미 검증된 레이아웃이므로 다시 검증하지 않음
+    layout = new_layout(kind, yaxis_title, x_range, panel_indicators(overlays))
+    fig = go.Figure(layout=layout, _validate=False)
+    for trace_type, props in traces:
+        fig.add_trace(TRACE_CLASSES[trace_type](**props))
+
+    return fig
+
+
+def create_spread_chart(spread: pd.Series,
+                        label: str,
+                        yaxis_title: str,
+                        x_range: Optional[tuple] = None) -> go.Figure:
+    """
+    스프레드 차트 생성 (히스토그램 포함, graph_objects 검증 빌더)
+
+    Args:
+        spread: 스프레드 데이터 Series
+        label: 차트 라벨
+        yaxis_title: Y축 제목
+        x_range: 확대된 X축 (시작, 끝) 범위 (None이면 전체)
+
+    Returns:
+        Plotly Figure
+    """
+    traces, shape, annotation = spread_traces(spread, label)
+    traces = encode_traces(traces, typed=False)
+
+    fig = go.Figure(layout=new_layout('spread', yaxis_title, x_range), _validate=False)
+    for trace_type, props in traces:
+        fig.add_trace(TRACE_CLASSES[trace_type](**props))
+
+    fig.add_shape(**shape)
+    fig.add_annotation(**annotation)
 
     return fig
+
+
+def build_timeseries_figure(df: pd.DataFrame,
+                            is_normalized: bool = False,
+                            x_range: Optional[tuple] = None,
+                            overlays: Optional[Dict[str, pd.DataFrame]] = None) -> dict:
+    """
+    시계열 차트를 검증 없이 딕셔너리로 생성 (빠른 빌더)
+
+    create_timeseries_chart와 같은 트레이스/축 구성을 NumPy 배열 그대로
+    딕셔너리에 담아 dcc.Graph에 바로 전달한다.
+    번들된 plotly.js가 지원하면 숫자 배열을 typed array(bdata)로 인코딩한다.
+
+    Args:
+        df: 데이터 DataFrame
+        is_normalized: 정규화 여부
+        x_range: 확대된 X축 (시작, 끝) 범위 (None이면 전체)
+        overlays: 오버레이 지표 {지표 이름: df와 같은 모양의 DataFrame} (compute_rolling 결과)
+
+    Returns:
+        {'data': [...], 'layout': {...}} Figure 딕셔너리
+    """
+    kind, yaxis_title, traces = timeseries_traces(df, is_normalized, overlays)
+    traces = encode_traces(traces, supports_typed_arrays())
+
+    return {
+        'data': [dict(type=trace_type, **props) for trace_type, props in traces],
+        'layout': new_layout(kind, yaxis_title, x_range, panel_indicators(overlays))
+    }
+
+
+def build_spread_figure(spread: pd.Series,
+                        label: str,
+                        yaxis_title: str,
+                        x_range: Optional[tuple] = None) -> dict:
+    """
+    스프레드 차트를 검증 없이 딕셔너리로 생성 (빠른 빌더)
+
+    Args:
+        spread: 스프레드 데이터 Series
+        label: 차트 라벨
+        yaxis_title: Y축 제목
+        x_range: 확대된 X축 (시작, 끝) 범위 (None이면 전체)
+
+    Returns:
+        {'data': [...], 'layout': {...}} Figure 딕셔너리
+    """
+    traces, shape, annotation = spread_traces(spread, label)
+    traces = encode_traces(traces, supports_typed_arrays())
+
+    layout = new_layout('spread', yaxis_title, x_range)
+    layout['shapes'] = [shape]
+    layout['annotations'] = [annotation]
+
+    return {
+        'data': [dict(type=trace_type, **props) for trace_type, props in traces],
+        'layout': layout
+    }
+
+
+@lru_cache(maxsize=None)
+def get_plain_skeleton(kind: str) -> dict:
+    """
+    서브플롯 없는 차트 레이아웃 골격 생성 (종류별로 한 번만 생성)
+
+    Args:
+        kind: 'heatmap' (상관계수 히트맵), 'rolling' (롤링 상관계수), 'box' (박스플롯)
+
+    Returns:
+        레이아웃 딕셔너리 (수정하지 말고 복사하여 사용)
+    """
+    config = CORRELATION_CONFIG
+    fig = go.Figure()
+
+    if kind == 'heatmap':
+        fig.update_layout(
+            template=config['template'],
+            xaxis=dict(side='bottom', tickangle=-45),
+            yaxis=dict(autorange='reversed'),
+            margin=dict(l=120, r=20, t=30, b=120)
+        )
+    elif kind == 'box':
+        fig.update_layout(
+            template=config['template'],
+            yaxis=dict(title=dict(text="일간 변화량"), zeroline=True),
+            xaxis=dict(type='category', tickangle=-45),
+            height=BOX_CONFIG['height'],
+            showlegend=False,
+            margin=dict(l=60, r=20, t=30, b=100)
+        )
+    else:
+        fig.update_layout(
+            template=config['template'],
+            hovermode='x unified',
+            xaxis_type='date',
+            yaxis=dict(range=[-1.05, 1.05], title=dict(text="상관계수")),
+            height=config['rolling_height'],
+            margin=dict(l=60, r=20, t=40, b=40),
+            shapes=[dict(type='line', xref='x domain', x0=0, x1=1, yref='y', y0=0, y1=0,
+                         line=dict(color='gray', width=1))]
+        )
+
+    return fig.to_dict()['layout']
+
+
+def build_correlation_figure(corr: np.ndarray, labels: List[str]) -> dict:
+    """
+    상관계수 히트맵을 검증 없이 딕셔너리로 생성
+
+    Args:
+        corr: (항목, 항목) 상관계수 행렬 (군집 순서로 정렬된 상태)
+        labels: 항목 이름 리스트 (행렬 순서)
+
+    Returns:
+        {'data': [...], 'layout': {...}} Figure 딕셔너리
+    """
+    config = CORRELATION_CONFIG
+    layout = copy.deepcopy(get_plain_skeleton('heatmap'))
+    layout['height'] = int(np.clip(len(labels) * config['cell_height'] + 150,
+                                   config['min_height'], config['max_height']))
+
+    return {
+        'data': [dict(
+            type='heatmap',
+            z=np.round(corr, config['decimals']),
+            x=labels,
+            y=labels,
+            zmin=-1, zmax=1, zmid=0,
+            colorscale=config['colorscale'],
+            colorbar=dict(title=dict(text="ρ")),
+            hovertemplate='<b>%{y} ~ %{x}</b><br>상관계수: %{z:.3f}<extra></extra>'
+        )],
+        'layout': layout
+    }
+
+
+def build_rolling_correlation_figure(corr: pd.Series, window: int) -> dict:
+    """
+    롤링 상관계수 라인 차트를 검증 없이 딕셔너리로 생성
+
+    Args:
+        corr: 롤링 상관계수 Series (이름: 항목 쌍 라벨)
+        window: 창 크기 (제목 표시용)
+
+    Returns:
+        {'data': [...], 'layout': {...}} Figure 딕셔너리
+    """
+    config = CHART_CONFIG['spread']
+    use_webgl, max_points, _ = plan_rendering(1, len(corr), config)
+    traces = [line_trace(
+        corr, 'scattergl' if use_webgl else 'scatter', max_points,
+        line=dict(width=2, color=get_chart_colors()['spread']),
+        hovertemplate=SPREAD_HOVERTEMPLATE
+    )]
+    traces = encode_traces(traces, supports_typed_arrays())
+
+    layout = copy.deepcopy(get_plain_skeleton('rolling'))
+    layout['title'] = dict(text=f"{corr.name} 롤링 상관계수 ({window}개 관측치)")
+
+    return {
+        'data': [dict(type=trace_type, **props) for trace_type, props in traces],
+        'layout': layout
+    }
+
+
+def box_traces(changes: pd.DataFrame) -> List[tuple]:
+    """
+    서버에서 계산한 사분위수/수염으로 박스플롯 트레이스 사양 생성
+
+    원본 배열 대신 항목별 다섯 수치 요약과 이상치만 보내므로
+    항목 수 × 관측치 수와 관계없이 전송량이 작다.
+
+    Args:
+        changes: 일간 변화량 DataFrame
+
+    Returns:
+        [(트레이스 타입, 속성), ...] (박스 트레이스 1개, 이상치 점 트레이스 1개)
+    """
+    colors = get_chart_colors()
+    config = BOX_CONFIG
+    values = changes.to_numpy(dtype=float)
+    stats = box_statistics(values, config['whisker_iqr'])
+    has_data = stats['count'] > 0
+    labels = [col for col, ok in zip(changes.columns, has_data) if ok]
+
+    traces = [('box', dict(
+        x=labels,
+        **{key: stats[key][has_data] for key in ('q1', 'median', 'q3', 'lowerfence', 'upperfence', 'mean')},
+        name='일간 변화량',
+        boxpoints=False,
+        marker=dict(color=colors['primary'])
+    ))]
+
+    # 이상치: 항목별로 중앙값에서 먼 값부터 max_outliers개까지
+    deviation = np.where(stats['outliers'], np.abs(values - stats['median']), -1.0)
+    keep = min(config['max_outliers'], len(values))
+    if keep:
+        rows = np.argpartition(-deviation, keep - 1, axis=0)[:keep]
+        cols = np.broadcast_to(np.arange(values.shape[1]), rows.shape)
+        selected = deviation[rows, cols] >= 0
+        rows, cols = rows[selected], cols[selected]
+        names = np.asarray(changes.columns, dtype=object)
+        traces.append(('scatter', dict(
+            x=names[cols].tolist(),
+            y=values[rows, cols],
+            customdata=changes.index[rows].strftime('%Y-%m-%d').tolist(),
+            mode='markers',
+            name='이상치',
+            marker=dict(color=colors['secondary'], size=5, opacity=0.7),
+            hovertemplate='<b>%{x}</b><br>날짜: %{customdata}<br>변화량: %{y:.4f}<extra></extra>'
+        )))
+
+    return traces
+
+
+def build_change_figure(changes: pd.DataFrame, x_range: Optional[tuple] = None) -> dict:
+    """
+    일간 변화량 차트를 검증 없이 딕셔너리로 생성
+
+    시계열 차트와 같은 트레이스 구성(다운샘플링, 보조 축, 히스토그램)을 사용한다.
+
+    Args:
+        changes: 일간 변화량 DataFrame (calculate_daily_changes 결과)
+        x_range: 확대된 X축 (시작, 끝) 범위 (None이면 전체)
+
+    Returns:
+        {'data': [...], 'layout': {...}} Figure 딕셔너리
+    """
+    kind, yaxis_title, traces = timeseries_traces(changes)
+    traces = encode_traces(traces, supports_typed_arrays())
+
+    return {
+        'data': [dict(type=trace_type, **props) for trace_type, props in traces],
+        'layout': new_layout(kind, yaxis_title if kind == 'dual' else "일간 변화량", x_range)
+    }
+
+
+def build_box_figure(changes: pd.DataFrame) -> dict:
+    """
+    일간 변화량 박스플롯을 검증 없이 딕셔너리로 생성
+
+    Args:
+        changes: 일간 변화량 DataFrame
+
+    Returns:
+        {'data': [...], 'layout': {...}} Figure 딕셔너리
+    """
+    traces = encode_traces(box_traces(changes), supports_typed_arrays())
+
+    return {
+        'data': [dict(type=trace_type, **props) for trace_type, props in traces],
+        'layout': copy.deepcopy(get_plain_skeleton('box'))
+    }
@@ -1,11 +1,104 @@
 """
 테이블 컴포넌트
+
+통계는 항목별 행 레코드로 바로 변환하여 dash_table.DataTable 하나로 그린다.
+셀마다 컴포넌트를 만들지 않으므로 항목이 수백 개여도 컴포넌트 트리가 커지지 않고,
+행이 많으면 가상 스크롤(virtualization)로 보이는 행만 렌더링한다.
 """
 
-from dash import html
-import dash_bootstrap_components as dbc
-import pandas as pd
-from config import STATS_COLUMN_NAMES, SPREAD_STATS_KEYS
+import math
+from typing import Dict, List
+from dash import html, dash_table
+from dash.dash_table.Format import Format, Scheme
+from config import STATS_COLUMN_NAMES, STATS_TABLE_CONFIG
+
+
+def stats_fields(stats: Dict[str, dict]) -> List[str]:
+    """
+    통계 딕셔너리에 있는 통계 항목 (STATS_COLUMN_NAMES 순서, 단위 제외)
+
+    저장소 JSON은 키가 정렬되므로 STATS_COLUMN_NAMES 순서로 복원한다.
+
+    Args:
+        stats: {항목: {통계명: 값}} 딕셔너리
+
+    Returns:
+        통계 항목 리스트
+    """
+    present = set()
+    for item_stats in stats.values():
+        present.update(item_stats)
+    present.discard('unit')
+
+    known = [field for field in STATS_COLUMN_NAMES if field in present]
+    return known + sorted(present - set(known))
+
+
+def stats_records(stats: Dict[str, dict], fields: List[str]) -> List[dict]:
+    """
+    통계 딕셔너리를 DataTable 행 레코드로 변환 (NaN/무한대는 빈 칸)
+
+    Args:
+        stats: {항목: {통계명: 값}} 딕셔너리
+        fields: 포함할 통계 항목
+
+    Returns:
+        [{'item': 항목, 통계명: 값, ...}, ...]
+    """
+    decimals = STATS_TABLE_CONFIG['decimals']
+
+    def clean(value):
+        if isinstance(value, (int, float)):
+            return round(value, decimals) if math.isfinite(value) else None
+        return value
+
+    return [
+        dict(item=item, **{field: clean(item_stats.get(field)) for field in fields})
+        for item, item_stats in stats.items()
+    ]
+
+
+def stats_datatable(table_id: str, records: List[dict], fields: List[str],
+                    item_header: str = "항목", sortable: bool = True) -> dash_table.DataTable:
+    """
+    통계 DataTable 생성 (행이 많으면 가상 스크롤)
+
+    Args:
+        table_id: 컴포넌트 id
+        records: stats_records 결과
+        fields: 통계 항목 (컬럼 순서)
+        item_header: 항목 컬럼 제목
+        sortable: 컬럼 정렬 허용 여부
+
+    Returns:
+        DataTable 컴포넌트
+    """
+    config = STATS_TABLE_CONFIG
+    number = Format(precision=config['decimals'], scheme=Scheme.fixed)
+    virtualize = len(records) > config['virtualize_rows']
+
+    columns = [{'name': item_header, 'id': 'item'}] + [
+        {'name': STATS_COLUMN_NAMES.get(field, field), 'id': field, 'type': 'numeric', 'format': number}
+        for field in fields
+    ]
+
+    # 가상 스크롤은 헤더 고정이 필요 (스크롤해도 컬럼 제목 유지)
+    scroll = dict(virtualization=True, fixed_rows={'headers': True}) if virtualize else {}
+
+    return dash_table.DataTable(
+        id=table_id,
+        columns=columns,
+        data=records,
+        sort_action='native' if sortable else 'none',
+        page_action='none',
+        **scroll,
+        style_table={'overflowX': 'auto', 'maxHeight': config['max_height'], 'overflowY': 'auto',
+                     'minWidth': '100%'},
+        style_cell={'fontSize': '0.85rem', 'padding': '4px 8px', 'minWidth': '90px'},
+        style_cell_conditional=[{'if': {'column_id': 'item'}, 'textAlign': 'left', 'minWidth': '140px'}],
+        style_header={'fontWeight': 'bold'},
+        style_data_conditional=[{'if': {'row_index': 'odd'}, 'backgroundColor': 'rgba(0, 0, 0, 0.03)'}]
+    )
 
 
 def create_statistics_table(stats: dict) -> html.Div:
@@ -21,26 +114,8 @@ def create_statistics_table(stats: dict) -> html.Div:
     if not stats:
         return html.Div()
 
-    # 통계 데이터프레임 생성
-    stats_df = pd.DataFrame(stats).T
-    stats_df = stats_df.round(4)
-
-    # 테이블 생성
-    table = dbc.Table([
-        html.Thead(
-            html.Tr([html.Th("항목")] +
-                   [html.Th(STATS_COLUMN_NAMES.get(col, col))
-                    for col in stats_df.columns if col != 'unit'])
-        ),
-        html.Tbody([
-            html.Tr([html.Td(idx)] +
-                   [html.Td(f"{val:.4f}" if isinstance(val, (int, float)) else val)
-                    for col, val in row.items() if col != 'unit'])
-            for idx, row in stats_df.iterrows()
-        ])
-    ], bordered=True, hover=True, striped=True, responsive=True, size='sm')
-
-    return table
+    fields = stats_fields(stats)
+    return html.Div(stats_datatable('statistics-datatable', stats_records(stats, fields), fields))
 
 
 def create_spread_statistics_table(stats_data: dict, spread_label: str = "스프레드") -> html.Div:
@@ -54,33 +129,11 @@ def create_spread_statistics_table(stats_data: dict, spread_label: str = "스프
     Returns:
         Dash HTML 컴포넌트
     """
-    # DataFrame으로 변환 (시계열 차트 통계와 동일한 형태)
-    stats_df = pd.DataFrame({spread_label: stats_data}).T
-    stats_df = stats_df.round(4)
-
-    # 컬럼 순서를 시계열 차트와 동일하게 정렬
-    desired_order = ['current', 'mean', 'std', 'min', 'max', 'median', 'q25', 'q75',
-                     'change_1d', 'change_1w', 'change_1m', 'change_3m']
-    # 존재하는 컬럼만 선택
-    available_cols = [col for col in desired_order if col in stats_df.columns]
-    stats_df = stats_df[available_cols]
-
-    # 테이블 생성 (가로 형태)
-    stats_table = html.Div([
-        dbc.Table([
-            html.Thead(
-                html.Tr([html.Th("항목")] +
-                       [html.Th(STATS_COLUMN_NAMES.get(col, col))
-                        for col in stats_df.columns])
-            ),
-            html.Tbody([
-                html.Tr([html.Td(idx)] +
-                       [html.Td(f"{val:.4f}" if isinstance(val, (int, float)) else val)
-                        for col, val in row.items()])
-                for idx, row in stats_df.iterrows()
-            ])
-        ], bordered=True, striped=True, hover=True, responsive=True, size='sm',
-           style={'marginTop': '10px'})
-    ])
-
-    return stats_table
+    stats = {spread_label: stats_data}
+    fields = [field for field in STATS_COLUMN_NAMES if field in stats_data]
+
+    return html.Div(
+        stats_datatable('spread-statistics-datatable', stats_records(stats, fields), fields,
+                        sortable=False),
+        style={'marginTop': '10px'}
+    )
@@ -0,0 +1,116 @@
+"""
+Dash 애플리케이션 생성
+
+개발 서버(app.py)와 운영 WSGI 서버(wsgi.py)가 같은 create_app을 사용한다.
+"""
+
+import os
+import dash
+from src.api_client import APIClient, MockAPIClient
+from src.response_cache import ResponseCache
+from app.layouts import create_layout
+from app.callbacks import (
+    register_ui_callbacks,
+    register_data_callbacks,
+    register_chart_callbacks
+)
+from app.utils.catalog import CatalogIndex
+from app.utils.figure_cache import FigureCache
+from app.utils.metrics import install_metrics
+from app.utils.profiling import install_profiling
+from config import API_CONFIG, FIGURE_CACHE_CONFIG, RESPONSE_CACHE_CONFIG
+
+# 프로젝트 루트 (assets 폴더 위치)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# create_app으로 만든 API 클라이언트 (fork 후 reset_after_fork에서 연결 교체)
+_clients = []
+
+
+def create_response_cache():
+    """
+    API 응답 캐시 생성 및 디스크 캐시 warm-up
+
+    Returns:
+        ResponseCache (비활성화되었으면 None)
+    """
+    config = RESPONSE_CACHE_CONFIG
+    if not config['enabled']:
+        return None
+
+    cache = ResponseCache(
+        config['path'],
+        config['memory_bytes'],
+        config['disk_bytes'],
+        config['current_ttl'],
+        config['historical_ttl']
+    )
+    cache.warm(config['warm_bytes'])
+    return cache
+
+
+def create_client():
+    """
+    환경 설정으로 API 클라이언트 생성
+
+    Returns:
+        DASH_API_URL이 있으면 응답 캐시를 붙인 APIClient, 없으면 MockAPIClient
+    """
+    if API_CONFIG['base_url']:
+        return APIClient(base_url=API_CONFIG['base_url'], cache=create_response_cache())
+    return MockAPIClient()
+
+
+def reset_after_fork() -> None:
+    """
+    gunicorn post_fork 훅: preload로 마스터에서 만든 클라이언트의 세션/캐시 연결을 워커별로 교체
+    """
+    for client in _clients:
+        client.reset_after_fork()
+
+
+def create_app(client=None) -> dash.Dash:
+    """
+    Dash 애플리케이션 생성 및 초기화
+
+    Args:
+        client: API 클라이언트 (없으면 create_client로 생성)
+
+    Returns:
+        Dash 앱 인스턴스 (WSGI 서버 객체는 app.server)
+    """
+    # 오프라인 환경을 위해 로컬 Bootstrap CSS 사용
+    # assets/bootstrap.min.css 파일이 자동으로 로드됨
+    app = dash.Dash(
+        __name__,
+        assets_folder=os.path.join(PROJECT_ROOT, 'assets'),
+        suppress_callback_exceptions=True
+    )
+
+    if client is None:
+        client = create_client()
+    _clients.append(client)
+
+    # 카테고리 데이터 로드 (항목 분류/검색 인덱스는 한 번만 생성)
+    categories = client.get_categories()
+    catalog = CatalogIndex(categories)
+
+    # Figure 캐시 (같은 보기를 다시 열거나 다른 사용자가 열 때 재사용)
+    figure_cache = FigureCache(FIGURE_CACHE_CONFIG['max_bytes'])
+
+    # 레이아웃 설정
+    app.layout = create_layout(catalog.category_lists())
+
+    # 콜백 등록
+    register_ui_callbacks(app, catalog)
+    register_data_callbacks(app, client, catalog)
+    register_chart_callbacks(app, figure_cache)
+
+    # 성능 지표 (DASH_METRICS=1일 때만 계측 및 /metrics 경로 등록)
+    install_metrics(app, client, [('figure', figure_cache),
+                                  ('response', getattr(client, 'cache', None))])
+
+    # 콜백 프로파일링 (DASH_PROFILE / DASH_PROFILE_HEADER일 때만)
+    install_profiling(app)
+
+    return app
@@ -2,9 +2,13 @@
 차트 섹션 레이아웃
 """
 
-from dash import dcc, html
+from dash import dcc, html, dash_table
+from dash.dash_table.Format import Format, Scheme
 import dash_bootstrap_components as dbc
-from config import SPREAD_OPERATIONS
+from config import (
+    CORRELATION_CONFIG, CORRELATION_METHODS, OVERLAY_OPTIONS,
+    SPREAD_OPERATIONS, SPREAD_SCREENER_CONFIG, STATS_COLUMN_NAMES
+)
 
 
 def create_timeseries_section() -> dbc.Card:
@@ -27,6 +31,14 @@ def create_timeseries_section() -> dbc.Card:
                     switch=True,
                     style={'display': 'inline-block', 'marginLeft': '20px',
                           'verticalAlign': 'middle'}
+                ),
+                dbc.Checklist(
+                    id='overlay-toggle',
+                    options=OVERLAY_OPTIONS,
+                    value=[],
+                    inline=True,
+                    style={'display': 'inline-block', 'marginLeft': '20px',
+                          'verticalAlign': 'middle'}
                 )
             ]),
             dcc.Graph(id='timeseries-chart', config={'displayModeBar': True}),
@@ -35,6 +47,23 @@ def create_timeseries_section() -> dbc.Card:
     ], className="chart-container mb-4")
 
 
+def create_change_section() -> dbc.Card:
+    """
+    일간 변화량 차트 및 박스플롯 섹션 생성
+
+    Returns:
+        Dash Bootstrap Card 컴포넌트
+    """
+    return dbc.Card([
+        dbc.CardBody([
+            html.H4("일간 변화량", className="card-header"),
+            dcc.Graph(id='change-chart', config={'displayModeBar': True}),
+            html.H5("박스플롯 (일간 변화량 분포)", className="mt-4"),
+            dcc.Graph(id='box-chart')
+        ])
+    ], className="chart-container mb-4")
+
+
 def create_spread_section() -> html.Div:
     """
     스프레드 차트 섹션 생성
@@ -66,11 +95,102 @@ def create_spread_section() -> html.Div:
                                 value='subtract',
                                 clearable=False
                             )
-                        ], md=3),
+                        ], md=2),
+                        dbc.Col([
+                            html.Label("수식 (입력 시 우선 적용)", className="control-label"),
+                            dbc.Input(
+                                id='spread-expression',
+                                type='text',
+                                placeholder="예: 2*KR_5Y - KR_3Y - KR_10Y",
+                                debounce=True
+                            )
+                        ], md=4),
                     ], className="mb-3"),
                 ]),
                 dcc.Graph(id='spread-chart'),
-                html.Div(id='spread-stats', className="mt-3")
+                html.Div(id='spread-stats', className="mt-3"),
+                create_spread_screener()
+            ])
+        ], className="chart-container mb-4")
+    ], style={'display': 'none'})
+
+
+def create_spread_screener() -> html.Div:
+    """
+    전체 항목 쌍 스프레드 스크리너 생성 (행 클릭 시 스프레드 차트 항목 선택)
+
+    Returns:
+        Dash HTML Div 컴포넌트
+    """
+    number = Format(precision=SPREAD_SCREENER_CONFIG['decimals'], scheme=Scheme.fixed)
+    change_name = STATS_COLUMN_NAMES.get(SPREAD_SCREENER_CONFIG['change_horizon'], '변화')
+
+    return html.Div([
+        html.H5("스프레드 스크리너", className="mt-4"),
+        dash_table.DataTable(
+            id='spread-screener',
+            columns=[
+                {'name': '스프레드', 'id': 'label'},
+                {'name': '현재값', 'id': 'current', 'type': 'numeric', 'format': number},
+                {'name': '평균', 'id': 'mean', 'type': 'numeric', 'format': number},
+                {'name': '표준편차', 'id': 'std', 'type': 'numeric', 'format': number},
+                {'name': 'Z-점수', 'id': 'zscore', 'type': 'numeric',
+                 'format': Format(precision=2, scheme=Scheme.fixed)},
+                {'name': '백분위 순위', 'id': 'pct_rank', 'type': 'numeric',
+                 'format': Format(precision=1, scheme=Scheme.fixed)},
+                {'name': change_name, 'id': 'change', 'type': 'numeric', 'format': number},
+            ],
+            data=[],
+            sort_action='native',
+            page_action='native',
+            page_size=SPREAD_SCREENER_CONFIG['page_size'],
+            style_table={'overflowX': 'auto'},
+            style_cell={'fontSize': '0.85rem', 'padding': '4px 8px'},
+            style_header={'fontWeight': 'bold'},
+            style_data_conditional=[
+                {'if': {'state': 'active'}, 'backgroundColor': 'rgba(0, 176, 80, 0.15)'}
+            ]
+        )
+    ])
+
+
+def create_correlation_section() -> html.Div:
+    """
+    상관관계 히트맵 섹션 생성 (셀 클릭 시 해당 쌍의 롤링 상관계수 표시)
+
+    Returns:
+        Dash HTML Div 컴포넌트
+    """
+    return html.Div(id='correlation-section', children=[
+        dbc.Card([
+            dbc.CardBody([
+                html.Div([
+                    html.H4("상관관계 히트맵", className="card-header",
+                           style={'display': 'inline-block'}),
+                    dbc.RadioItems(
+                        id='correlation-method',
+                        options=CORRELATION_METHODS,
+                        value='change',
+                        inline=True,
+                        style={'display': 'inline-block', 'marginLeft': '20px',
+                              'verticalAlign': 'middle'}
+                    )
+                ]),
+                dcc.Graph(id='correlation-heatmap'),
+                dbc.Row([
+                    dbc.Col([
+                        html.Label("롤링 창 (관측치 수)", className="control-label"),
+                        dbc.Input(
+                            id='correlation-window',
+                            type='number',
+                            min=5,
+                            step=1,
+                            value=CORRELATION_CONFIG['rolling_window'],
+                            debounce=True
+                        )
+                    ], md=3),
+                ], className="mt-3"),
+                dcc.Graph(id='rolling-correlation-chart')
             ])
         ], className="chart-container mb-4")
     ], style={'display': 'none'})
@@ -4,15 +4,24 @@
 
 from dash import dcc, html
 import dash_bootstrap_components as dbc
-from config import APP_CONFIG
+from config import APP_CONFIG, PERIOD_BUTTONS
 from .control_panel import create_control_panel
-from .charts_section import create_timeseries_section, create_spread_section
+from .charts_section import (
+    create_timeseries_section,
+    create_change_section,
+    create_spread_section,
+    create_correlation_section
+)
 
 
-def create_layout() -> dbc.Container:
+def create_layout(categories: dict) -> dbc.Container:
     """
     애플리케이션 메인 레이아웃 생성
 
+    Args:
+        categories: 타입별 카테고리 이름 목록 (클라이언트 사이드 콜백용으로 레이아웃에 포함,
+            항목은 서버 검색으로 조회하므로 포함하지 않음)
+
     Returns:
         Dash Bootstrap Container 컴포넌트
     """
@@ -34,8 +43,14 @@ def create_layout() -> dbc.Container:
                 # 메인 시계열 차트
                 create_timeseries_section(),
 
+                # 일간 변화량 및 박스플롯
+                create_change_section(),
+
                 # 스프레드 차트
                 create_spread_section(),
+
+                # 상관관계 히트맵
+                create_correlation_section(),
             ]
         ),
 
@@ -43,4 +58,8 @@ def create_layout() -> dbc.Container:
         dcc.Store(id='data-store'),
         dcc.Store(id='stats-store'),
 
+        # 클라이언트 사이드 콜백용 정적 데이터 (레이아웃에 한 번만 포함)
+        dcc.Store(id='categories-store', data=categories),
+        dcc.Store(id='period-store', data=PERIOD_BUTTONS),
+
     ], fluid=True, style={'padding': '0'})
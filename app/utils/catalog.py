@@ -0,0 +1,241 @@
+"""
+항목 카탈로그 인덱스
+
+get_categories 결과({'금리': {카테고리: [항목]}, '환율': {...}})로 한 번만 만들어
+- 항목 → (데이터 타입, 카테고리) 역방향 맵으로 항목 분류를 항목당 O(1)에 처리하고
+- 이름/토큰 접두어(정렬 배열 + 이분 탐색)와 3-gram 역색인으로 검색어에 맞는
+  상위 k개 항목만 찾아 드롭다운 옵션을 작게 유지한다.
+"""
+
+import re
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+from config import CATALOG_CONFIG
+
+# 데이터 타입 → 카테고리 딕셔너리 키
+TYPE_KEYS = OrderedDict([('interest_rate', '금리'), ('exchange_rate', '환율')])
+
+TOKEN_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (소문자, 앞뒤 공백 제거)"""
+    return text.strip().lower()
+
+
+def trigrams(text: str) -> set:
+    """
+    문자 3-gram 집합
+
+    Args:
+        text: 정규화된 문자열
+
+    Returns:
+        3-gram 집합 (3자 미만이면 빈 집합)
+    """
+    return {text[idx:idx + 3] for idx in range(len(text) - 2)}
+
+
+class CatalogIndex:
+    """항목 카탈로그 역방향 맵 및 검색 인덱스"""
+
+    def __init__(self, categories: dict):
+        """
+        Args:
+            categories: get_categories 결과 딕셔너리
+        """
+        self.items: List[str] = []
+        self.lookup: Dict[str, Tuple[str, str]] = {}
+        self._ids: Dict[str, int] = {}
+        self._scopes: Dict[Tuple[str, str], List[int]] = OrderedDict()
+
+        for data_type, key in TYPE_KEYS.items():
+            for category, cat_items in categories.get(key, {}).items():
+                scope = self._scopes.setdefault((data_type, category), [])
+                for item in cat_items:
+                    if item not in self._ids:
+                        self._ids[item] = len(self.items)
+                        self.items.append(item)
+                        self.lookup[item] = (data_type, category)
+                    scope.append(self._ids[item])
+
+        # 접두어 색인: (정규화된 이름 또는 토큰, 항목 번호) 정렬 배열
+        names = [normalize(item) for item in self.items]
+        prefixes = set()
+        for item_id, name in enumerate(names):
+            prefixes.add((name, item_id))
+            prefixes.update((token, item_id) for token in TOKEN_PATTERN.split(name) if token)
+        self._prefixes = sorted(prefixes)
+        self._names = names
+
+        # 3-gram 역색인 (구분자는 공백으로 통일: 'USD/KRW'와 'usd-krw'가 같은 형태)
+        self._forms = [TOKEN_PATTERN.sub(' ', name) for name in names]
+        self._trigrams: Dict[str, List[int]] = {}
+        for item_id, form in enumerate(self._forms):
+            for gram in trigrams(form):
+                self._trigrams.setdefault(gram, []).append(item_id)
+
+    def classify(self, items: Iterable[str]) -> Tuple[list, list]:
+        """
+        항목들을 금리/환율로 분류 (항목당 O(1))
+
+        Args:
+            items: 항목 리스트
+
+        Returns:
+            (금리 항목 리스트, 환율 항목 리스트) 튜플 (카탈로그에 없는 항목은 제외)
+        """
+        interest_items, exchange_items = [], []
+        for item in items:
+            data_type = self.lookup.get(item, (None, None))[0]
+            if data_type == 'interest_rate':
+                interest_items.append(item)
+            elif data_type == 'exchange_rate':
+                exchange_items.append(item)
+        return interest_items, exchange_items
+
+    def category_names(self, data_type: str = 'all') -> List[str]:
+        """
+        데이터 타입의 카테고리 목록
+
+        Args:
+            data_type: 'interest_rate', 'exchange_rate' 또는 'all'
+
+        Returns:
+            카테고리 이름 리스트
+        """
+        return list(OrderedDict.fromkeys(
+            category for scope_type, category in self._scopes
+            if data_type == 'all' or scope_type == data_type))
+
+    def category_lists(self) -> Dict[str, List[str]]:
+        """
+        타입별 카테고리 이름 목록 (항목 없이 레이아웃에 포함할 용도)
+
+        Returns:
+            {'금리': [카테고리, ...], '환율': [...]}
+        """
+        return OrderedDict((key, self.category_names(data_type)) for data_type, key in TYPE_KEYS.items())
+
+    def scope_ids(self, data_type: str = 'all', categories: Optional[List[str]] = None) -> Optional[set]:
+        """
+        데이터 타입/카테고리에 속한 항목 번호 집합
+
+        Args:
+            data_type: 'interest_rate', 'exchange_rate' 또는 'all'
+            categories: 카테고리 목록 (없으면 데이터 타입 전체)
+
+        Returns:
+            항목 번호 집합 (제한이 없으면 None)
+        """
+        if data_type == 'all' and not categories:
+            return None
+        return {
+            item_id
+            for (scope_type, category), ids in self._scopes.items()
+            if (data_type == 'all' or scope_type == data_type)
+            and (not categories or category in categories)
+            for item_id in ids
+        }
+
+    def items_in(self, data_type: str = 'all', categories: Optional[List[str]] = None) -> List[str]:
+        """
+        데이터 타입/카테고리에 속한 항목 (카탈로그 순서)
+
+        Args:
+            data_type: 'interest_rate', 'exchange_rate' 또는 'all'
+            categories: 카테고리 목록 (없으면 데이터 타입 전체)
+
+        Returns:
+            항목 리스트
+        """
+        scope = self.scope_ids(data_type, categories)
+        if scope is None:
+            return list(self.items)
+        return [self.items[item_id] for item_id in sorted(scope)]
+
+    def _prefix_matches(self, query: str) -> List[int]:
+        """이름 또는 토큰이 검색어로 시작하는 항목 번호 (이분 탐색)"""
+        start = bisect_left(self._prefixes, (query, -1))
+        matches = []
+        for token, item_id in self._prefixes[start:]:
+            if not token.startswith(query):
+                break
+            matches.append(item_id)
+        return matches
+
+    def search(self, query: str,
+               data_type: str = 'all',
+               categories: Optional[List[str]] = None,
+               limit: Optional[int] = None) -> List[str]:
+        """
+        검색어에 맞는 상위 k개 항목
+
+        순위: 이름 일치 > 이름 접두어 > 토큰 접두어 > 부분 문자열 > 3-gram 유사.
+        같은 순위는 이름이 짧은 순, 카탈로그 순서.
+
+        Args:
+            query: 검색어
+            data_type: 'interest_rate', 'exchange_rate' 또는 'all'
+            categories: 카테고리 목록 (없으면 데이터 타입 전체)
+            limit: 최대 항목 수 (기본: CATALOG_CONFIG['max_options'])
+
+        Returns:
+            항목 리스트
+        """
+        limit = limit or CATALOG_CONFIG['max_options']
+        query = normalize(query)
+        if not query:
+            return self.items_in(data_type, categories)[:limit]
+
+        scope = self.scope_ids(data_type, categories)
+        ranks: Dict[int, tuple] = {}
+
+        def rank(item_id, level):
+            if scope is not None and item_id not in scope:
+                return
+            key = (level, len(self._names[item_id]), item_id)
+            if item_id not in ranks or key < ranks[item_id]:
+                ranks[item_id] = key
+
+        for item_id in self._prefix_matches(query):
+            name = self._names[item_id]
+            rank(item_id, 0 if name == query else 1 if name.startswith(query) else 2)
+
+        form = TOKEN_PATTERN.sub(' ', query)
+        grams = trigrams(form)
+        if grams:
+            # 모든 3-gram을 포함하는 후보만 부분 문자열 확인, 나머지는 겹치는 비율로 유사 검색
+            counts = Counter(item_id for gram in grams for item_id in self._trigrams.get(gram, ()))
+            min_overlap = CATALOG_CONFIG['min_trigram_overlap'] * len(grams)
+            for item_id, count in counts.items():
+                if count == len(grams) and form in self._forms[item_id]:
+                    rank(item_id, 3)
+                elif count >= min_overlap:
+                    rank(item_id, 4 + (len(grams) - count) / len(grams))
+
+        ordered = sorted(ranks, key=ranks.get)
+        return [self.items[item_id] for item_id in ordered[:limit]]
+
+    def options(self, query: Optional[str],
+                data_type: str = 'all',
+                categories: Optional[List[str]] = None,
+                selected: Optional[List[str]] = None) -> List[dict]:
+        """
+        드롭다운 옵션 (검색 결과 상위 k개 + 이미 선택된 항목)
+
+        Args:
+            query: 검색어 (없으면 범위 내 앞쪽 k개)
+            data_type: 'interest_rate', 'exchange_rate' 또는 'all'
+            categories: 카테고리 목록
+            selected: 현재 선택된 항목 (선택 표시가 사라지지 않도록 항상 포함)
+
+        Returns:
+            [{'label': 항목, 'value': 항목}, ...]
+        """
+        items = list(selected or [])
+        chosen = set(items)
+        items.extend(item for item in self.search(query or '', data_type, categories)
+                     if item not in chosen)
+        return [{'label': item, 'value': item} for item in items]
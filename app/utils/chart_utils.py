@@ -2,9 +2,11 @@
 차트 유틸리티 함수
 """
 
+import numpy as np
 import pandas as pd
-from typing import Tuple
-from config import SCALE_DIFF_THRESHOLD, CHART_COLORS
+from typing import Optional, Tuple
+from app.utils.stats_utils import summarize_columns
+from config import SCALE_DIFF_THRESHOLD, CHART_COLORS, MIN_POINTS_PER_TRACE
 
 
 def should_use_secondary_axis(df: pd.DataFrame) -> Tuple[bool, list]:
@@ -20,20 +22,142 @@ def should_use_secondary_axis(df: pd.DataFrame) -> Tuple[bool, list]:
     if len(df.columns) < 2:
         return False, list(df.columns)
 
-    # 중앙값 계산
-    medians = [df[col].median() for col in df.columns]
-    max_median = max(medians) if medians else 1
-    min_median = min([m for m in medians if m > 0]) if any(m > 0 for m in medians) else 1
+    # 중앙값/범위를 한 번에 계산
+    summary = summarize_columns(df.to_numpy(dtype=float))
+    medians = summary['median']
+    max_median = medians.max() if len(medians) else 1
+    positive = medians[medians > 0]
+    min_median = positive.min() if len(positive) else 1
 
     # 중앙값 차이가 임계값 이상이면 보조 축 사용
-    use_secondary = (max_median / min_median > SCALE_DIFF_THRESHOLD) if min_median > 0 else False
+    use_secondary = bool(max_median / min_median > SCALE_DIFF_THRESHOLD) if min_median > 0 else False
 
-    # 범위 기준으로 컬럼 정렬
-    sorted_cols = sorted(df.columns, key=lambda x: df[x].max() - df[x].min(), reverse=True)
+    # 범위 기준으로 컬럼 정렬 (범위가 같으면 원래 순서 유지)
+    ranges = summary['max'] - summary['min']
+    sorted_cols = [df.columns[idx] for idx in np.argsort(-ranges, kind='stable')]
 
     return use_secondary, sorted_cols
 
 
+def estimate_render_cost(n_traces: int, n_points: int, max_points_per_trace: int) -> int:
+    """
+    렌더링 비용 추정 (다운샘플링 후 브라우저가 그릴 포인트 수)
+
+    Args:
+        n_traces: 라인 트레이스 수
+        n_points: 트레이스당 원본 포인트 수
+        max_points_per_trace: 트레이스당 최대 포인트 수
+
+    Returns:
+        예상 렌더링 포인트 수 (트레이스 × 포인트)
+    """
+    return n_traces * min(n_points, max_points_per_trace)
+
+
+def plan_rendering(n_traces: int, n_points: int, config: dict) -> Tuple[bool, int, int]:
+    """
+    차트 렌더링 방식 결정 (WebGL 사용 여부 및 트레이스당 포인트 예산)
+
+    Args:
+        n_traces: 라인 트레이스 수
+        n_points: 트레이스당 원본 포인트 수
+        config: CHART_CONFIG 항목 (max_points_per_trace, webgl_threshold, render_budget)
+
+    Returns:
+        (WebGL 사용 여부, 트레이스당 최대 포인트 수, 예상 렌더링 비용) 튜플
+    """
+    max_points = config['max_points_per_trace']
+
+    # 차트 전체 예산 초과 시 트레이스당 예산 축소
+    if n_traces and estimate_render_cost(n_traces, n_points, max_points) > config['render_budget']:
+        max_points = max(config['render_budget'] // n_traces, MIN_POINTS_PER_TRACE)
+
+    cost = estimate_render_cost(n_traces, n_points, max_points)
+    use_webgl = cost > config['webgl_threshold']
+
+    return use_webgl, max_points, cost
+
+
+def parse_relayout_range(relayout_data: Optional[dict]) -> Tuple[bool, Optional[tuple]]:
+    """
+    relayoutData에서 메인 차트 X축(날짜) 범위 추출
+
+    Args:
+        relayout_data: dcc.Graph의 relayoutData
+
+    Returns:
+        (X축 범위 변경 여부, (시작, 끝) 범위 또는 전체 보기면 None) 튜플
+    """
+    if not relayout_data:
+        return False, None
+
+    if relayout_data.get('xaxis.autorange'):
+        return True, None
+
+    if 'xaxis.range[0]' in relayout_data and 'xaxis.range[1]' in relayout_data:
+        return True, (relayout_data['xaxis.range[0]'], relayout_data['xaxis.range[1]'])
+
+    if 'xaxis.range' in relayout_data:
+        x0, x1 = relayout_data['xaxis.range']
+        return True, (x0, x1)
+
+    return False, None
+
+
+def slice_range(data, x_range: Optional[tuple]):
+    """
+    날짜 범위로 데이터 슬라이스
+
+    Args:
+        data: 날짜 인덱스를 가진 DataFrame 또는 Series
+        x_range: (시작, 끝) 범위 (None이면 전체)
+
+    Returns:
+        슬라이스된 데이터
+    """
+    if x_range is None:
+        return data
+    return data.loc[pd.Timestamp(x_range[0]):pd.Timestamp(x_range[1])]
+
+
+def histogram_bin_edges(values: np.ndarray, bins) -> np.ndarray:
+    """
+    유한값 기준 히스토그램 구간 경계 계산 (여러 항목이 같은 구간을 공유할 때 사용)
+
+    Args:
+        values: 값 배열 (NaN 허용, 다차원 가능)
+        bins: 구간 수 또는 구간 규칙 이름
+
+    Returns:
+        구간 경계 배열 (유한값이 없으면 빈 배열)
+    """
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return np.array([])
+    return np.histogram_bin_edges(finite, bins=bins)
+
+
+def compute_histogram(values: np.ndarray, bins) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    서버에서 히스토그램 구간별 빈도 계산
+
+    Args:
+        values: 값 배열 (NaN 허용)
+        bins: 구간 수, 구간 규칙 이름 또는 구간 경계 배열
+
+    Returns:
+        (구간 중심 배열, 빈도 배열, 구간 폭 배열) 튜플
+    """
+    finite = values[np.isfinite(values)]
+    if finite.size == 0 or (isinstance(bins, np.ndarray) and bins.size < 2):
+        return np.array([]), np.array([], dtype=int), np.array([])
+
+    counts, edges = np.histogram(finite, bins=bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+
+    return centers, counts, np.diff(edges)
+
+
 def get_chart_colors():
     """
     차트 색상 설정 반환
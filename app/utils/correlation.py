@@ -0,0 +1,266 @@
+"""
+상관관계 계산 유틸리티 함수
+
+- 상관계수 행렬: 결측 마스크를 곱한 행렬곱 몇 번으로 모든 쌍의 공분산/분산을
+  한 번에 계산 (쌍별 결측 제외, pandas DataFrame.corr와 동일)
+- 롤링 상관계수: 공적률(co-moment) 누적합으로 창 크기와 무관하게 O(n),
+  RollingCorrelation은 같은 합계를 유지하며 새 값 추가를 O(1)에 처리
+- 계층적 군집 순서: 상관계수 거리(1 - ρ)로 비슷한 항목끼리 모아 히트맵 정렬
+"""
+
+from collections import deque
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from scipy.cluster.hierarchy import leaves_list, linkage
+from scipy.spatial.distance import squareform
+from app.utils.data_utils import calculate_daily_changes
+from config import CORRELATION_CONFIG
+
+# 분산을 0으로 볼 제곱합 대비 비율 (평평한 창 판정)
+VARIANCE_EPS = 1e-10
+
+
+def transform_values(df: pd.DataFrame, method: str) -> pd.DataFrame:
+    """
+    상관계수 계산 대상 값 변환
+
+    변화량은 일간 변화량 차트와 같은 calculate_daily_changes(직전 유효값 대비)를
+    사용하므로, 휴일이 다른 금리/환율 항목을 섞어도 휴일 다음 날 변화량이 남는다.
+
+    Args:
+        df: 데이터 DataFrame
+        method: 'level' (수준) 또는 'change' (일간 변화량)
+
+    Returns:
+        변환된 DataFrame (변화량은 결측 행과 항목별 첫 관측치가 NaN)
+    """
+    return calculate_daily_changes(df) if method == 'change' else df
+
+
+def correlation_matrix(values: np.ndarray, min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    결측을 쌍별로 제외한 상관계수 행렬 (행렬곱 기반)
+
+    쌍 (i, j)마다 두 항목이 모두 유효한 행만으로 평균/분산/공분산을 구한다.
+    마스크 행렬 M과 0으로 채운 값 행렬 X로 n = MᵀM, Σx = XᵀM, Σx² = (X²)ᵀM,
+    Σxy = XᵀX를 계산하므로 항목 수와 관계없이 행렬곱 네 번이면 된다.
+
+    Args:
+        values: (행: 날짜, 열: 항목) 2차원 배열
+        min_periods: 쌍별 최소 관측치 수 (기본: CORRELATION_CONFIG['min_periods'])
+
+    Returns:
+        (항목, 항목) 상관계수 행렬 (관측치가 부족하거나 분산이 0이면 NaN)
+    """
+    if min_periods is None:
+        min_periods = CORRELATION_CONFIG['min_periods']
+
+    values = np.asarray(values, dtype=float)
+    valid = ~np.isnan(values)
+    mask = valid.astype(float)
+
+    # 항목별 평균으로 중심화하여 제곱합 자릿수 손실 방지
+    with np.errstate(invalid='ignore', divide='ignore'):
+        center = np.where(valid, values, 0.0).sum(axis=0) / valid.sum(axis=0)
+    filled = np.where(valid, values - np.nan_to_num(center), 0.0)
+
+    counts = mask.T @ mask
+    sums = filled.T @ mask              # sums[i, j]: j가 유효한 행에서 i의 합
+    sums_sq = (filled ** 2).T @ mask
+    cross = filled.T @ filled
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = cross - sums * sums.T / counts
+        var_i = sums_sq - sums ** 2 / counts
+        corr = cov / np.sqrt(var_i * var_i.T)
+
+    corr = np.where((counts >= max(min_periods, 2)) & np.isfinite(corr), corr, np.nan)
+    corr = np.clip(corr, -1.0, 1.0)
+    np.fill_diagonal(corr, np.where(np.isnan(np.diag(corr)), np.nan, 1.0))
+    return corr
+
+
+def cluster_order(corr: np.ndarray) -> np.ndarray:
+    """
+    계층적 군집(평균 연결) 기준 항목 순서
+
+    Args:
+        corr: 상관계수 행렬 (NaN은 상관 없음으로 간주)
+
+    Returns:
+        항목 위치 순서 배열
+    """
+    n = len(corr)
+    if n < 3:
+        return np.arange(n)
+
+    distance = 1.0 - np.nan_to_num(corr, nan=0.0)
+    distance = (distance + distance.T) / 2
+    np.fill_diagonal(distance, 0.0)
+    tree = linkage(squareform(np.clip(distance, 0.0, 2.0), checks=False), method='average')
+    return leaves_list(tree)
+
+
+def correlation_frame(df: pd.DataFrame, method: str, cluster: bool = True) -> Tuple[np.ndarray, List[str]]:
+    """
+    DataFrame 전체 항목의 상관계수 행렬 (군집 순서로 정렬)
+
+    Args:
+        df: 데이터 DataFrame
+        method: 'level' 또는 'change'
+        cluster: 계층적 군집 순서로 정렬할지 여부
+
+    Returns:
+        (상관계수 행렬, 항목 이름 리스트) 튜플
+    """
+    corr = correlation_matrix(transform_values(df, method).to_numpy(dtype=float))
+    labels = list(df.columns)
+    if cluster:
+        order = cluster_order(corr)
+        corr = corr[np.ix_(order, order)]
+        labels = [labels[idx] for idx in order]
+    return corr, labels
+
+
+def window_correlation(count, sx, sy, sxx, syy, sxy, min_periods: int):
+    """
+    창 합계로 상관계수 계산 (전체/증분 계산 공용)
+
+    분산이 제곱합 대비 반올림 오차 수준이면 0으로 보아 NaN을 반환하므로
+    누적합 차이와 이동 합계의 오차가 달라도 두 경로 결과가 같다.
+
+    Args:
+        count: 창 관측치 수
+        sx, sy: 창 합계
+        sxx, syy, sxy: 창 제곱합/곱합
+
+    Returns:
+        상관계수 (관측치가 min_periods 미만이거나 분산이 0이면 NaN)
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = sxy - sx * sy / count
+        var_x = sxx - sx * sx / count
+        var_y = syy - sy * sy / count
+        flat = (var_x <= VARIANCE_EPS * sxx) | (var_y <= VARIANCE_EPS * syy)
+        corr = np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+    return np.where((count >= max(min_periods, 2)) & ~flat, corr, np.nan)
+
+
+def rolling_correlation(x: np.ndarray, y: np.ndarray, window: int,
+                        min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    두 시계열의 롤링 상관계수 (공적률 누적합, O(n))
+
+    두 값이 모두 유효한 관측치만으로 최근 window개 창을 구성한다.
+
+    Args:
+        x: 첫 번째 값 배열
+        y: 두 번째 값 배열
+        window: 창 크기 (관측치 수)
+        min_periods: 최소 관측치 수 (기본: window, 창이 다 차야 계산)
+
+    Returns:
+        길이 n 배열 (관측치가 부족하거나 한쪽이 결측인 행은 NaN)
+    """
+    min_periods = window if min_periods is None else min_periods
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    both = ~np.isnan(x) & ~np.isnan(y)
+    result = np.full(len(x), np.nan)
+
+    xs, ys = x[both], y[both]
+    n = len(xs)
+    if n == 0:
+        return result
+
+    # 평균으로 중심화하여 제곱합 자릿수 손실 방지
+    xs = xs - xs.mean()
+    ys = ys - ys.mean()
+
+    ends = np.arange(1, n + 1)
+    starts = np.maximum(ends - window, 0)
+
+    def window_sums(values):
+        prefix = np.concatenate([[0.0], np.cumsum(values)])
+        return prefix[ends] - prefix[starts]
+
+    result[both] = window_correlation(
+        ends - starts, window_sums(xs), window_sums(ys),
+        window_sums(xs * xs), window_sums(ys * ys), window_sums(xs * ys), min_periods)
+    return result
+
+
+def pair_rolling_correlation(df: pd.DataFrame, item1: str, item2: str,
+                             method: str, window: int) -> pd.Series:
+    """
+    항목 쌍의 롤링 상관계수 Series
+
+    Args:
+        df: 데이터 DataFrame
+        item1: 첫 번째 항목
+        item2: 두 번째 항목
+        method: 'level' 또는 'change'
+        window: 창 크기 (관측치 수)
+
+    Returns:
+        롤링 상관계수 Series (인덱스: 날짜)
+    """
+    values = transform_values(df[[item1, item2]], method)
+    corr = rolling_correlation(values[item1].to_numpy(), values[item2].to_numpy(), window)
+    return pd.Series(corr, index=df.index, name=f"{item1} ~ {item2}")
+
+
+class RollingCorrelation:
+    """두 시계열의 롤링 상관계수 상태 (새 값 추가 O(1), rolling_correlation과 같은 결과)"""
+
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        """
+        Args:
+            window: 창 크기 (관측치 수)
+            min_periods: 최소 관측치 수 (기본: window)
+        """
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self._pairs = deque(maxlen=window)
+        self._sums = np.zeros(5)    # Σx, Σy, Σx², Σy², Σxy (첫 값 기준으로 이동)
+        self._shift = None
+
+    def append(self, x: float, y: float) -> float:
+        """
+        새 관측치 추가 (한쪽이라도 결측이면 창에 넣지 않음)
+
+        Args:
+            x: 첫 번째 값
+            y: 두 번째 값
+
+        Returns:
+            이 행의 상관계수 (결측 행이거나 관측치가 부족하면 NaN)
+        """
+        if np.isnan(x) or np.isnan(y):
+            return np.nan
+
+        # 첫 관측치를 기준점으로 빼서 제곱합 자릿수 손실 방지
+        if self._shift is None:
+            self._shift = (x, y)
+        x, y = x - self._shift[0], y - self._shift[1]
+
+        if len(self._pairs) == self.window:
+            old_x, old_y = self._pairs[0]
+            self._sums -= (old_x, old_y, old_x * old_x, old_y * old_y, old_x * old_y)
+
+        self._pairs.append((x, y))
+        self._sums += (x, y, x * x, y * y, x * y)
+        return self.value()
+
+    def value(self) -> float:
+        """
+        현재 창의 상관계수
+
+        Returns:
+            상관계수 (관측치가 min_periods 미만이거나 분산이 0이면 NaN)
+        """
+        if not self._pairs:
+            return np.nan
+        sx, sy, sxx, syy, sxy = self._sums
+        return float(window_correlation(len(self._pairs), sx, sy, sxx, syy, sxy, self.min_periods))
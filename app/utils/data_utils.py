@@ -2,8 +2,13 @@
 데이터 처리 유틸리티 함수
 """
 
+import hashlib
+import json
+import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import Optional, Tuple
+from app.utils.catalog import CatalogIndex
+from app.utils.stats_utils import forward_valid_rows, summarize_columns, summary_to_records
 
 
 def normalize_data(df: pd.DataFrame) -> pd.DataFrame:
@@ -24,6 +29,34 @@ def normalize_data(df: pd.DataFrame) -> pd.DataFrame:
     return df_normalized
 
 
+def calculate_daily_changes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    항목별 일간 변화량 계산 (직전 유효 관측치 대비)
+
+    항목마다 휴일이 달라 결측이 있어도 직전 유효값과 비교하므로
+    휴일 다음 날의 변화량이 사라지지 않는다.
+
+    Args:
+        df: 데이터 DataFrame
+
+    Returns:
+        변화량 DataFrame (결측 행과 항목별 첫 관측치는 NaN)
+    """
+    values = df.to_numpy(dtype=float)
+    if len(values) == 0:
+        return df.astype(float)
+
+    valid = ~np.isnan(values)
+    prev_valid = forward_valid_rows(valid)
+
+    # 각 행 직전 행까지의 마지막 유효 위치
+    previous = np.vstack([np.full((1, values.shape[1]), -1), prev_valid[:-1]])
+    past = values[np.maximum(previous, 0), np.arange(values.shape[1])]
+    changes = np.where(valid & (previous >= 0), values - past, np.nan)
+
+    return pd.DataFrame(changes, index=df.index, columns=df.columns)
+
+
 def calculate_spread(df: pd.DataFrame,
                      item1: str,
                      item2: str,
@@ -57,35 +90,22 @@ def calculate_spread_statistics(spread: pd.Series) -> dict:
     스프레드 통계 계산 (시계열 차트 통계와 동일한 형태 및 순서)
 
     Args:
-        spread: 스프레드 Series
+        spread: 스프레드 Series (날짜 인덱스가 아니면 변화량은 행 위치 기준)
 
     Returns:
         통계 딕셔너리 (순서 보장)
     """
-    from collections import OrderedDict
-    data = spread.dropna()
-
-    # 시계열 차트와 동일한 순서로 반환
-    return OrderedDict([
-        ('current', float(data.iloc[-1])),
-        ('mean', float(data.mean())),
-        ('std', float(data.std())),
-        ('min', float(data.min())),
-        ('max', float(data.max())),
-        ('median', float(data.median())),
-        ('q25', float(data.quantile(0.25))),
-        ('q75', float(data.quantile(0.75))),
-        ('change_1d', float(data.iloc[-1] - data.iloc[-2]) if len(data) > 1 else 0),
-        ('change_1w', float(data.iloc[-1] - data.iloc[-5]) if len(data) > 5 else 0),
-        ('change_1m', float(data.iloc[-1] - data.iloc[-20]) if len(data) > 20 else 0),
-        ('change_3m', float(data.iloc[-1] - data.iloc[-60]) if len(data) > 60 else 0),
-    ])
+    summary = summarize_columns(spread.to_numpy(dtype=float), spread.index.to_numpy())
+    return summary_to_records(summary, ['spread']).get('spread', {})
 
 
 def classify_items_by_type(items: list, categories: dict) -> Tuple[list, list]:
     """
     항목들을 금리/환율로 분류
 
+    카탈로그 인덱스를 매번 만드므로, 반복 호출 시에는 한 번 만든
+    CatalogIndex.classify를 사용한다.
+
     Args:
         items: 항목 리스트
         categories: 카테고리 딕셔너리
@@ -93,23 +113,168 @@ def classify_items_by_type(items: list, categories: dict) -> Tuple[list, list]:
     Returns:
         (금리 항목 리스트, 환율 항목 리스트) 튜플
     """
-    interest_items = []
-    exchange_items = []
+    return CatalogIndex(categories).classify(items)
+
+
+def frame_to_dataset(df: pd.DataFrame, start_date: str, end_date: str) -> dict:
+    """
+    DataFrame을 data-store 저장 형식으로 변환
+
+    API 응답과 같은 컬럼 지향 형식이라 항목 단위로 추가/삭제(Patch)할 수 있다.
+
+    Args:
+        df: 데이터 DataFrame (인덱스: 날짜)
+        start_date: 조회 시작 날짜
+        end_date: 조회 종료 날짜
+
+    Returns:
+        {'start_date', 'end_date', 'items': [항목 순서], 'dates': [...],
+         'series': {item: [...]}, 'digests': {item: 해시}, 'key': 데이터셋 키} 딕셔너리
+    """
+    digests = {col: series_digest(df[col]) for col in df.columns}
+    return {
+        'start_date': start_date,
+        'end_date': end_date,
+        'items': list(df.columns),
+        'dates': format_dates(df.index),
+        'series': {col: series_to_list(df[col]) for col in df.columns},
+        'digests': digests,
+        'key': dataset_key(start_date, end_date, digests)
+    }
+
+
+def dataset_to_frame(dataset: dict) -> pd.DataFrame:
+    """
+    data-store 데이터를 DataFrame으로 변환
+
+    Args:
+        dataset: frame_to_dataset 형식의 딕셔너리
+
+    Returns:
+        DataFrame (인덱스: 날짜, 컬럼: 각 항목)
+    """
+    index = pd.to_datetime(dataset['dates'])
+    series = dataset['series']
+    return pd.DataFrame({item: series[item] for item in dataset_items(dataset)},
+                        index=index, dtype=float)
+
+
+def dataset_items(dataset: dict) -> list:
+    """
+    data-store 항목 순서
+
+    Patch로 추가한 항목은 'series' 딕셔너리 끝에 붙으므로, 항목 선택 순서는
+    함께 전송하는 'items'를 따른다.
+
+    Args:
+        dataset: frame_to_dataset 형식의 딕셔너리
+
+    Returns:
+        항목 리스트
+    """
+    items = dataset.get('items')
+    return list(items) if items is not None else list(dataset['series'])
+
+
+def order_items(columns: list, items: list) -> list:
+    """
+    컬럼을 항목 선택 순서로 정렬 (선택에 없는 컬럼은 뒤에 원래 순서대로)
 
-    # 전체 금리/환율 항목 목록 생성
-    all_interest_items = []
-    for cat_items in categories.get('금리', {}).values():
-        all_interest_items.extend(cat_items)
+    Args:
+        columns: 컬럼 리스트
+        items: 항목 선택 순서 (item-dropdown 값)
+
+    Returns:
+        정렬된 컬럼 리스트
+    """
+    present = set(columns)
+    ordered = [item for item in items if item in present]
+    selected = set(ordered)
+    return ordered + [col for col in columns if col not in selected]
+
+
+def series_digest(series: pd.Series) -> str:
+    """
+    시계열 내용 해시 (날짜 + 값)
+
+    Args:
+        series: 값 Series (인덱스: 날짜)
+
+    Returns:
+        16자리 16진수 해시 문자열
+    """
+    digest = hashlib.sha1(pd.DatetimeIndex(series.index).asi8.tobytes())
+    digest.update(series.to_numpy(dtype=np.float64).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def dataset_key(start_date: str, end_date: str, digests: dict) -> str:
+    """
+    데이터셋 키 계산 (같은 내용이면 항목 순서와 무관하게 같은 키)
+
+    Args:
+        start_date: 조회 시작 날짜
+        end_date: 조회 종료 날짜
+        digests: {item: series_digest} 딕셔너리
 
-    all_exchange_items = []
-    for cat_items in categories.get('환율', {}).values():
-        all_exchange_items.extend(cat_items)
+    Returns:
+        16자리 16진수 키 문자열
+    """
+    payload = json.dumps([start_date, end_date, sorted(digests.items())])
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def format_dates(index: pd.Index) -> list:
+    """
+    날짜 인덱스를 'YYYY-MM-DD' 문자열 리스트로 변환
+
+    Args:
+        index: 날짜 인덱스
+
+    Returns:
+        날짜 문자열 리스트
+    """
+    return list(pd.DatetimeIndex(index).strftime('%Y-%m-%d'))
+
+
+def series_to_list(series: pd.Series) -> list:
+    """
+    Series 값을 JSON 직렬화 가능한 리스트로 변환 (NaN은 None)
+
+    Args:
+        series: 값 Series
+
+    Returns:
+        값 리스트
+    """
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def diff_selection(dataset: Optional[dict],
+                   items: list,
+                   start_date: str,
+                   end_date: str) -> Optional[Tuple[list, list]]:
+    """
+    요청 항목/기간을 현재 데이터셋과 비교
+
+    Args:
+        dataset: 현재 data-store 데이터 (없으면 None)
+        items: 요청 항목 리스트
+        start_date: 요청 시작 날짜
+        end_date: 요청 종료 날짜
+
+    Returns:
+        (추가 항목 리스트, 제거 항목 리스트) 튜플.
+        기간이 달라 전체를 다시 조회해야 하면 None
+    """
+    if (not dataset
+            or dataset.get('start_date') != start_date
+            or dataset.get('end_date') != end_date):
+        return None
 
-    # 항목 분류
-    for item in items:
-        if item in all_interest_items:
-            interest_items.append(item)
-        elif item in all_exchange_items:
-            exchange_items.append(item)
+    loaded = dataset['series']
+    added = [item for item in items if item not in loaded]
+    requested = set(items)
+    removed = [item for item in loaded if item not in requested]
 
-    return interest_items, exchange_items
+    return added, removed
@@ -0,0 +1,79 @@
+"""
+시계열 다운샘플링 유틸리티 함수
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def minmax_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    구간별 최소/최대 위치를 선택하는 다운샘플링 인덱스 계산 (벡터화)
+
+    첫 점과 마지막 점은 항상 포함하고, 나머지 구간을 버킷으로 나누어
+    각 버킷의 최소값과 최대값 위치를 남긴다. 급등락 같은 극값이 사라지지 않는다.
+
+    Args:
+        values: 값 배열 (NaN 없음)
+        max_points: 최대 포인트 수
+
+    Returns:
+        정렬된 선택 인덱스 배열
+    """
+    n = len(values)
+    if n <= max_points or max_points < 4:
+        return np.arange(n)
+
+    interior = values[1:-1]
+    size = int(np.ceil(len(interior) / ((max_points - 2) // 2)))
+    n_buckets = int(np.ceil(len(interior) / size))
+    pad = n_buckets * size - len(interior)
+    offsets = np.arange(n_buckets) * size + 1
+
+    high = np.concatenate([interior, np.full(pad, -np.inf)]).reshape(n_buckets, size)
+    low = np.concatenate([interior, np.full(pad, np.inf)]).reshape(n_buckets, size)
+
+    return np.unique(np.concatenate([
+        [0],
+        low.argmin(axis=1) + offsets,
+        high.argmax(axis=1) + offsets,
+        [n - 1]
+    ]))
+
+
+def downsample_series(series: pd.Series, max_points: int) -> pd.Series:
+    """
+    포인트 예산에 맞게 Series 다운샘플링
+
+    NaN 구간은 다운샘플링하지 않은 경우와 같게 끊어 그리도록, 각 결측 구간의
+    첫 NaN(gap marker)과 그 앞뒤 유효값을 남긴다 (이 점들도 예산에 포함).
+
+    Args:
+        series: 원본 Series (인덱스: 날짜)
+        max_points: 트레이스당 최대 포인트 수
+
+    Returns:
+        예산 이하면 원본, 초과하면 최소/최대 보존 다운샘플링된 Series
+    """
+    if len(series) <= max_points:
+        return series
+
+    values = series.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    if valid.all():
+        return series.iloc[minmax_indices(values, max_points)]
+
+    positions = np.flatnonzero(valid)
+    if len(positions) == 0:
+        return series.iloc[:0]
+
+    # 유효값 다음 첫 NaN과 그 직전 값, NaN 다음 첫 유효값 (데이터 범위 안의 결측 구간만)
+    gap_starts = np.flatnonzero(valid[:-1] & ~valid[1:]) + 1
+    gap_starts = gap_starts[gap_starts < positions[-1]]
+    gap_ends = np.flatnonzero(~valid[:-1] & valid[1:]) + 1
+    gap_ends = gap_ends[gap_ends > positions[0]]
+    edges = np.concatenate([gap_starts, gap_starts - 1, gap_ends])
+
+    budget = max(max_points - len(edges), 4)
+    chosen = positions[minmax_indices(values[positions], budget)]
+    return series.iloc[np.union1d(chosen, edges)]
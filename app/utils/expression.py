@@ -0,0 +1,194 @@
+"""
+스프레드 수식 컴파일 유틸리티 함수
+
+'2*KR_5Y - KR_3Y - KR_10Y', '(USD/KRW) / (EUR/KRW)' 같은 수식을 안전하게 AST로
+해석하여 NumPy 벡터 연산 함수로 컴파일한다. 항목명에 '/'가 포함될 수 있으므로
+로드된 항목명을 먼저 자리표시자로 치환한 뒤 해석한다.
+"""
+
+import ast
+import re
+from functools import lru_cache
+from typing import Callable, Tuple
+import numpy as np
+import pandas as pd
+from config import SPREAD_EXPRESSION_CONFIG
+
+PLACEHOLDER = '__c{}__'
+PLACEHOLDER_PATTERN = re.compile(r'^__c(\d+)__$')
+
+BINARY_OPERATORS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.divide,
+    ast.Pow: np.power,
+}
+
+UNARY_OPERATORS = {
+    ast.USub: np.negative,
+    ast.UAdd: np.positive,
+}
+
+FUNCTIONS = {
+    'abs': np.abs,
+    'log': np.log,
+    'exp': np.exp,
+    'sqrt': np.sqrt,
+}
+
+
+class CompiledExpression:
+    """컴파일된 스프레드 수식"""
+
+    def __init__(self, text: str, columns: Tuple[str, ...], evaluator: Callable):
+        """
+        Args:
+            text: 정규화된 수식 문자열
+            columns: 수식에 사용된 항목명 (자리표시자 순서)
+            evaluator: {자리표시자 번호: 배열}을 받아 결과 배열을 반환하는 함수
+        """
+        self.text = text
+        self.columns = columns
+        self._evaluator = evaluator
+
+    def evaluate(self, df: pd.DataFrame) -> pd.Series:
+        """
+        수식 계산 (행 단위 반복 없이 컬럼 배열 연산)
+
+        Args:
+            df: 데이터 DataFrame
+
+        Returns:
+            결과 Series (무한대는 NaN)
+        """
+        arrays = {idx: df[col].to_numpy(dtype=float) for idx, col in enumerate(self.columns)}
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            result = np.broadcast_to(self._evaluator(arrays), (len(df),)).astype(float)
+        return pd.Series(np.where(np.isfinite(result), result, np.nan), index=df.index, name=self.text)
+
+
+def substitute_columns(text: str, columns: Tuple[str, ...]) -> Tuple[str, Tuple[str, ...]]:
+    """
+    수식 안의 항목명을 자리표시자로 치환 (긴 이름 우선)
+
+    Args:
+        text: 수식 문자열
+        columns: 사용 가능한 항목명
+
+    Returns:
+        (치환된 수식, 사용된 항목명 튜플) 튜플
+    """
+    if not columns:
+        return text, ()
+
+    names = sorted(columns, key=len, reverse=True)
+    pattern = re.compile(r'(?<![\w.])(' + '|'.join(re.escape(name) for name in names) + r')(?![\w.])')
+    used = []
+
+    def replace(match):
+        name = match.group(1)
+        if name not in used:
+            used.append(name)
+        return PLACEHOLDER.format(used.index(name))
+
+    return pattern.sub(replace, text), tuple(used)
+
+
+def build_evaluator(node: ast.AST) -> Callable:
+    """
+    허용된 AST 노드만으로 계산 함수 생성
+
+    Args:
+        node: AST 노드 (항목명은 자리표시자로 치환된 상태)
+
+    Returns:
+        {자리표시자 번호: 배열} -> 배열 함수
+
+    Raises:
+        ValueError: 허용되지 않는 구문 또는 알 수 없는 항목
+    """
+    if isinstance(node, ast.Expression):
+        return build_evaluator(node.body)
+
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = float(node.value)
+        return lambda arrays: value
+
+    if isinstance(node, ast.Name):
+        match = PLACEHOLDER_PATTERN.match(node.id)
+        if not match:
+            raise ValueError(f"알 수 없는 항목: {node.id}")
+        idx = int(match.group(1))
+        return lambda arrays: arrays[idx]
+
+    if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+        func = BINARY_OPERATORS[type(node.op)]
+        left = build_evaluator(node.left)
+        right = build_evaluator(node.right)
+        return lambda arrays: func(left(arrays), right(arrays))
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPERATORS:
+        func = UNARY_OPERATORS[type(node.op)]
+        operand = build_evaluator(node.operand)
+        return lambda arrays: func(operand(arrays))
+
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id in FUNCTIONS and len(node.args) == 1 and not node.keywords):
+        func = FUNCTIONS[node.func.id]
+        operand = build_evaluator(node.args[0])
+        return lambda arrays: func(operand(arrays))
+
+    raise ValueError(f"지원하지 않는 수식 구문: {type(node).__name__}")
+
+
+@lru_cache(maxsize=SPREAD_EXPRESSION_CONFIG['cache_size'])
+def compile_expression(text: str, columns: Tuple[str, ...]) -> CompiledExpression:
+    """
+    스프레드 수식 컴파일 (수식 문자열과 항목 목록 기준 캐시)
+
+    Args:
+        text: 수식 문자열
+        columns: 사용 가능한 항목명 튜플
+
+    Returns:
+        CompiledExpression
+
+    Raises:
+        ValueError: 수식이 비었거나 길거나, 문법 오류 또는 허용되지 않는 구문
+    """
+    text = ' '.join(text.split())
+    if not text:
+        raise ValueError("수식이 비어 있습니다")
+    if len(text) > SPREAD_EXPRESSION_CONFIG['max_length']:
+        raise ValueError(f"수식이 너무 깁니다 (최대 {SPREAD_EXPRESSION_CONFIG['max_length']}자)")
+
+    substituted, used = substitute_columns(text, columns)
+    try:
+        tree = ast.parse(substituted, mode='eval')
+    except SyntaxError:
+        raise ValueError(f"수식 문법 오류: {text}")
+
+    evaluator = build_evaluator(tree)
+    if not used:
+        raise ValueError("수식에 로드된 항목이 없습니다")
+
+    return CompiledExpression(text, used, evaluator)
+
+
+def calculate_expression_spread(df: pd.DataFrame, text: str) -> Tuple[pd.Series, str, str]:
+    """
+    수식 스프레드 계산 (calculate_spread와 같은 형태로 반환)
+
+    Args:
+        df: 데이터 DataFrame
+        text: 수식 문자열
+
+    Returns:
+        (스프레드 Series, 라벨, y축 제목) 튜플
+
+    Raises:
+        ValueError: 수식 오류
+    """
+    compiled = compile_expression(text, tuple(df.columns))
+    return compiled.evaluate(df), compiled.text, "수식 값"
@@ -0,0 +1,130 @@
+"""
+Figure 캐시 (데이터셋 키와 보기 옵션 기준 LRU)
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# JSON 직렬화 시 원소당 대략적인 바이트 수 (숫자: 부호/소수점/구분자 포함)
+JSON_BYTES_PER_NUMBER = 20
+
+
+def estimate_serialized_size(obj: Any) -> int:
+    """
+    Figure의 JSON 직렬화 크기 추정
+
+    실제로 직렬화하지 않고 배열 길이와 문자열 길이로 크기를 추정한다.
+
+    Args:
+        obj: Figure 딕셔너리 또는 그 일부 (graph_objects Figure도 허용)
+
+    Returns:
+        추정 바이트 수
+    """
+    if hasattr(obj, 'to_plotly_json'):
+        obj = obj.to_plotly_json()
+
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind in 'US':
+            return obj.size * (obj.dtype.itemsize // (4 if obj.dtype.kind == 'U' else 1) + 3)
+        if obj.dtype.kind == 'O':
+            return sum(estimate_serialized_size(v) for v in obj.tolist())
+        return obj.size * JSON_BYTES_PER_NUMBER
+    if isinstance(obj, dict):
+        return sum(len(str(k)) + 4 + estimate_serialized_size(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return sum(estimate_serialized_size(v) + 1 for v in obj) + 2
+    if isinstance(obj, str):
+        return len(obj.encode('utf-8')) + 2
+    return len(str(obj))
+
+
+class FigureCache:
+    """직렬화 크기 기준으로 제거하는 LRU Figure 캐시"""
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: 캐시 전체 최대 크기 (추정 직렬화 바이트)
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        캐시 조회 (조회된 항목은 가장 최근 사용으로 이동)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 Figure 또는 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                logger.debug("figure cache miss: hit_rate=%.2f", self.hit_rate)
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            logger.debug("figure cache hit: hit_rate=%.2f", self.hit_rate)
+            return entry[0]
+
+    def put(self, key: Hashable, figure: Any) -> None:
+        """
+        캐시 저장 (최대 크기를 넘으면 오래된 항목부터 제거)
+
+        Args:
+            key: 캐시 키
+            figure: Figure 딕셔너리 또는 graph_objects Figure
+        """
+        size = estimate_serialized_size(figure)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[1]
+
+            self._entries[key] = (figure, size)
+            self.total_bytes += size
+
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """캐시 적중률 (조회가 없으면 0)"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        """
+        캐시 통계
+
+        Returns:
+            {'entries', 'bytes', 'hits', 'misses', 'evictions', 'hit_rate'} 딕셔너리
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hit_rate
+            }
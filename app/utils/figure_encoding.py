@@ -0,0 +1,178 @@
+"""
+Figure 트레이스 배열 인코딩 유틸리티 함수
+
+plotly.js 2.28부터 지원하는 typed array({'dtype', 'bdata'}) 형식으로 숫자 배열을
+base64 바이너리로 보내고, 지원하지 않는 번들에서는 소수 자릿수를 줄인 JSON 배열로 보낸다.
+날짜 축은 간격이 일정하면 x 배열 대신 x0/dx로 보낸다.
+"""
+
+import base64
+import logging
+import os
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+from config import FIGURE_ENCODING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# typed array를 지원하는 최소 plotly.js 버전
+TYPED_ARRAY_MIN_PLOTLYJS = (2, 28)
+
+# 인코딩 대상 트레이스 배열 속성
+ARRAY_PROPS = ('x', 'y', 'width', 'q1', 'median', 'q3', 'lowerfence', 'upperfence', 'mean')
+
+
+@lru_cache(maxsize=1)
+def bundled_plotlyjs_version() -> Optional[Tuple[int, int, int]]:
+    """
+    dash(dcc.Graph)에 번들된 plotly.js 버전 확인
+
+    Returns:
+        (major, minor, patch) 튜플 (확인할 수 없으면 None)
+    """
+    try:
+        from dash import dcc
+        path = os.path.join(os.path.dirname(dcc.__file__), 'plotly.min.js')
+        with open(path, 'r', encoding='utf-8') as f:
+            header = f.read(512)
+    except (ImportError, OSError):
+        return None
+
+    match = re.search(r'plotly\.js v(\d+)\.(\d+)\.(\d+)', header)
+    if not match:
+        return None
+    return tuple(int(part) for part in match.groups())
+
+
+@lru_cache(maxsize=1)
+def supports_typed_arrays() -> bool:
+    """
+    typed array(bdata) 인코딩 사용 여부
+
+    FIGURE_ENCODING_CONFIG['typed_arrays']가 'auto'면 번들된 plotly.js 버전으로 판단한다.
+
+    Returns:
+        사용 여부
+    """
+    setting = FIGURE_ENCODING_CONFIG['typed_arrays']
+    if setting != 'auto':
+        return bool(setting)
+
+    version = bundled_plotlyjs_version()
+    supported = version is not None and version[:2] >= TYPED_ARRAY_MIN_PLOTLYJS
+    logger.info("plotly.js bundle %s: typed arrays %s",
+                '.'.join(map(str, version)) if version else 'unknown',
+                'enabled' if supported else 'disabled')
+    return supported
+
+
+def encode_typed_array(values: np.ndarray) -> dict:
+    """
+    숫자 배열을 plotly.js typed array 형식으로 인코딩
+
+    Args:
+        values: 숫자 배열
+
+    Returns:
+        {'dtype': 'f8' 등, 'bdata': base64 문자열} 딕셔너리
+    """
+    if values.dtype.kind in 'iub':
+        info = np.iinfo(np.int32)
+        if values.size == 0 or (values.min() >= info.min and values.max() <= info.max):
+            dtype = 'i4'
+        else:
+            dtype = 'f8'
+    elif values.dtype == np.float32:
+        dtype = 'f4'
+    else:
+        dtype = 'f8'
+
+    data = np.ascontiguousarray(values, dtype='<' + dtype)
+    return {'dtype': dtype, 'bdata': base64.b64encode(data.tobytes()).decode('ascii')}
+
+
+def decode_typed_array(encoded: dict) -> np.ndarray:
+    """
+    typed array 디코딩 (테스트 및 오프라인 분석용)
+
+    Args:
+        encoded: encode_typed_array 결과
+
+    Returns:
+        숫자 배열
+    """
+    return np.frombuffer(base64.b64decode(encoded['bdata']), dtype='<' + encoded['dtype'])
+
+
+def encode_array(values: np.ndarray, typed: bool):
+    """
+    숫자 배열 인코딩
+
+    Args:
+        values: 숫자 배열
+        typed: typed array 사용 여부
+
+    Returns:
+        typed array 딕셔너리 또는 소수 자릿수를 줄인 배열
+    """
+    if typed:
+        return encode_typed_array(values)
+    if values.dtype.kind == 'f':
+        return np.round(values, FIGURE_ENCODING_CONFIG['json_decimals'])
+    return values
+
+
+def encode_dates(props: dict, typed: bool) -> None:
+    """
+    날짜 x 배열 인코딩 (props를 직접 수정)
+
+    간격이 일정하면 x0/dx(밀리초)로, 아니면 typed array(epoch 밀리초) 또는
+    'YYYY-MM-DD' 문자열 배열로 보낸다.
+
+    Args:
+        props: 트레이스 속성 딕셔너리 ('x'가 datetime64 배열)
+        typed: typed array 사용 여부
+    """
+    dates = props['x']
+    millis = dates.astype('datetime64[ms]').astype(np.int64)
+
+    if len(millis) > 2:
+        steps = np.diff(millis)
+        if np.all(steps == steps[0]) and steps[0] > 0:
+            del props['x']
+            props['x0'] = str(np.datetime_as_string(dates[0], unit='D'))
+            props['dx'] = int(steps[0])
+            return
+
+    if typed:
+        props['x'] = encode_typed_array(millis.astype(np.float64))
+    else:
+        props['x'] = np.datetime_as_string(dates, unit='D')
+
+
+def encode_traces(traces: list, typed: bool) -> list:
+    """
+    트레이스 사양의 배열 속성 인코딩
+
+    Args:
+        traces: [(트레이스 타입, 속성 딕셔너리), ...]
+        typed: typed array 사용 여부
+
+    Returns:
+        인코딩된 [(트레이스 타입, 속성 딕셔너리), ...]
+    """
+    encoded = []
+    for trace_type, props in traces:
+        props = dict(props)
+        for name in ARRAY_PROPS:
+            values = props.get(name)
+            if not isinstance(values, np.ndarray):
+                continue
+            if values.dtype.kind == 'M':
+                encode_dates(props, typed)
+            else:
+                props[name] = encode_array(values, typed)
+        encoded.append((trace_type, props))
+    return encoded
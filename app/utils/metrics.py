@@ -0,0 +1,508 @@
+"""
+콜백 성능 지표 (Prometheus 텍스트 형식)
+
+콜백마다 처리 시간, 요청/응답 바이트, JSON 디코딩/인코딩 시간을, API 클라이언트는
+엔드포인트별 지연 시간을 히스토그램으로 모아 Flask 서버의 /metrics 경로로 내보낸다.
+
+METRICS_CONFIG['enabled']가 꺼져 있으면 훅, 래퍼, 경로를 아무것도 설치하지 않으므로
+요청 처리에 추가 비용이 없다.
+
+지표는 워커 프로세스마다 모으고 METRICS_CONFIG['multiprocess_dir']에 워커별 스냅샷을
+저장한다. gunicorn 멀티 워커에서 /metrics 요청은 임의의 워커가 받지만, 받은 워커가
+살아 있는 모든 워커의 스냅샷을 합산하여 출력하므로 한 번의 수집으로 전체 값이 나온다.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import flask
+from config import METRICS_CONFIG
+
+# Dash 콜백 요청 경로 (requests_pathname_prefix 뒤)
+DISPATCH_SUFFIX = '/_dash-update-component'
+
+# 계측할 API 클라이언트 메서드 → endpoint 라벨
+CLIENT_ENDPOINTS = {
+    'get_categories': 'categories',
+    'get_interest_rates': 'interest-rates',
+    'get_exchange_rates': 'exchange-rates',
+    'get_statistics': 'statistics',
+}
+
+
+def format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    """
+    Prometheus 라벨 문자열 ('{a="1",b="2"}')
+
+    Args:
+        names: 라벨 이름
+        values: 라벨 값
+        extra: 뒤에 붙일 라벨 (예: 'le="0.1"')
+
+    Returns:
+        라벨 문자열 (라벨이 없으면 빈 문자열)
+    """
+    parts = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{name}="{escaped}"')
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def format_value(value: float) -> str:
+    """Prometheus 숫자 표기 (정수는 소수점 없이)"""
+    if value == float('inf'):
+        return '+Inf'
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def merge_values(current, value):
+    """스냅샷 값 합산 (히스토그램: 버킷별 리스트, 카운터: 숫자)"""
+    if current is None:
+        return list(value) if isinstance(value, list) else value
+    if isinstance(current, list):
+        return [a + b for a, b in zip(current, value)]
+    return current + value
+
+
+class Histogram:
+    """라벨별 누적 버킷 히스토그램"""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str], buckets: Sequence[float]):
+        """
+        Args:
+            name: 지표 이름
+            help_text: 설명
+            labelnames: 라벨 이름
+            buckets: 버킷 상한 (오름차순, +Inf는 자동 추가)
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Sequence[str], value: float) -> None:
+        """
+        값 기록
+
+        Args:
+            labels: 라벨 값 (labelnames 순서)
+            value: 관측값
+        """
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(tuple(labels))
+            if series is None:
+                # [버킷별 개수 ..., +Inf 개수, 합계]
+                series = self._series[tuple(labels)] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[idx] += 1
+            series[-1] += value
+
+    def snapshot(self) -> Dict[tuple, list]:
+        """현재 값 복사본 {라벨: [버킷별 개수 ..., 합계]}"""
+        with self._lock:
+            return {labels: list(series) for labels, series in self._series.items()}
+
+    def reset(self) -> None:
+        """모든 값 삭제 (fork 직후 자식 프로세스)"""
+        with self._lock:
+            self._series.clear()
+
+    def render(self, snapshot: Optional[Dict[tuple, list]] = None) -> List[str]:
+        """
+        Prometheus 텍스트 형식 행
+
+        Args:
+            snapshot: 출력할 값 (없으면 현재 프로세스 값, 워커 합산 시 merge_values 결과)
+        """
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        if snapshot is None:
+            snapshot = self.snapshot()
+
+        for labels, series in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series[:-1]):
+                cumulative += count
+                le = f'le="{format_value(bound)}"'
+                lines.append(f'{self.name}_bucket{format_labels(self.labelnames, labels, le)} {cumulative}')
+            label_str = format_labels(self.labelnames, labels)
+            lines.append(f'{self.name}_sum{label_str} {format_value(series[-1])}')
+            lines.append(f'{self.name}_count{label_str} {cumulative}')
+        return lines
+
+
+class Counter:
+    """라벨별 누적 카운터"""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str]):
+        """
+        Args:
+            name: 지표 이름 (_total로 끝나는 이름 권장)
+            help_text: 설명
+            labelnames: 라벨 이름
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Sequence[str], amount: float = 1) -> None:
+        """카운터 증가"""
+        with self._lock:
+            key = tuple(labels)
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self) -> Dict[tuple, float]:
+        """현재 값 복사본 {라벨: 값}"""
+        with self._lock:
+            return dict(self._values)
+
+    def reset(self) -> None:
+        """모든 값 삭제 (fork 직후 자식 프로세스)"""
+        with self._lock:
+            self._values.clear()
+
+    def render(self, snapshot: Optional[Dict[tuple, float]] = None) -> List[str]:
+        """
+        Prometheus 텍스트 형식 행
+
+        Args:
+            snapshot: 출력할 값 (없으면 현재 프로세스 값, 워커 합산 시 merge_values 결과)
+        """
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        if snapshot is None:
+            snapshot = self.snapshot()
+        for labels, value in sorted(snapshot.items()):
+            lines.append(f'{self.name}{format_labels(self.labelnames, labels)} {format_value(value)}')
+        return lines
+
+
+def process_alive(pid: int) -> bool:
+    """프로세스가 살아 있는지 확인 (신호 0)"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsRegistry:
+    """
+    지표 모음 및 Prometheus 텍스트 출력
+
+    directory가 있으면 워커마다 {directory}/{pid}.json에 스냅샷을 저장하고,
+    출력 시 살아 있는 모든 워커의 스냅샷을 합산한다 (gunicorn 멀티 워커에서 어느
+    워커가 /metrics를 받아도 같은 합계). 히스토그램/카운터는 워커 합계, 캐시 통계
+    게이지는 워커별 값(worker 라벨)으로 출력한다.
+    """
+
+    def __init__(self, latency_buckets: Sequence[float], size_buckets: Sequence[float],
+                 directory: Optional[str] = None, flush_interval: float = 1.0):
+        """
+        Args:
+            latency_buckets: 시간 히스토그램 버킷 (초)
+            size_buckets: 바이트 히스토그램 버킷
+            directory: 워커별 스냅샷 폴더 (None이면 현재 프로세스 값만 출력)
+            flush_interval: 기록 후 스냅샷 저장 간격 (초)
+        """
+        self.callback_seconds = Histogram(
+            'dash_callback_duration_seconds', 'Callback request wall time.', ['callback'], latency_buckets)
+        self.decode_seconds = Histogram(
+            'dash_callback_json_decode_seconds', 'Callback request JSON decode time.', ['callback'],
+            latency_buckets)
+        self.encode_seconds = Histogram(
+            'dash_callback_json_encode_seconds', 'Callback response JSON encode time.', ['callback'],
+            latency_buckets)
+        self.request_bytes = Histogram(
+            'dash_callback_request_bytes', 'Callback request payload size.', ['callback'], size_buckets)
+        self.response_bytes = Histogram(
+            'dash_callback_response_bytes', 'Callback response payload size.', ['callback'], size_buckets)
+        self.callback_requests = Counter(
+            'dash_callback_requests_total', 'Callback requests by HTTP status.', ['callback', 'status'])
+        self.upstream_seconds = Histogram(
+            'dash_upstream_request_duration_seconds', 'API client call latency.', ['endpoint'],
+            latency_buckets)
+        self.metrics = [self.callback_seconds, self.decode_seconds, self.encode_seconds,
+                        self.request_bytes, self.response_bytes, self.callback_requests,
+                        self.upstream_seconds]
+        self._collectors: List[Tuple[str, str, Callable[[], Dict[str, float]]]] = []
+
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._dirty = threading.Event()
+        self._flusher_pid: Optional[int] = None
+        self._flush_lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            # preload로 마스터에서 만든 값이 워커마다 복사되어 중복 합산되지 않도록
+            os.register_at_fork(after_in_child=self.reset)
+
+    def add_gauges(self, name: str, help_text: str, collect: Callable[[], Dict[str, float]]) -> None:
+        """
+        출력 시점에 값을 읽는 게이지 등록 (예: 캐시 통계)
+
+        Args:
+            name: 지표 이름 (라벨 'stat'에 딕셔너리 키가 들어감)
+            help_text: 설명
+            collect: {stat: 값} 딕셔너리를 반환하는 함수
+        """
+        self._collectors.append((name, help_text, collect))
+
+    def reset(self) -> None:
+        """현재 프로세스의 값 삭제 (fork 직후 자식 프로세스)"""
+        for metric in self.metrics:
+            metric.reset()
+        self._dirty.clear()
+        self._flusher_pid = None
+
+    def snapshot(self) -> dict:
+        """
+        현재 프로세스의 지표 스냅샷 (JSON 직렬화 가능)
+
+        Returns:
+            {'pid', 'metrics': {이름: [[라벨..., 값], ...]}, 'gauges': {이름: {stat: 값}}}
+        """
+        return {
+            'pid': os.getpid(),
+            'metrics': {metric.name: [[list(labels), value] for labels, value in metric.snapshot().items()]
+                        for metric in self.metrics},
+            'gauges': {name: dict(collect()) for name, _, collect in self._collectors},
+        }
+
+    def mark_dirty(self) -> None:
+        """기록 후 호출: flush_interval 안에 스냅샷 저장 (워커별 백그라운드 스레드)"""
+        if not self.directory:
+            return
+        self._dirty.set()
+        if self._flusher_pid != os.getpid():
+            self._flusher_pid = os.getpid()
+            threading.Thread(target=self._flush_loop, name='metrics-flush', daemon=True).start()
+
+    def _flush_loop(self) -> None:
+        """변경이 있으면 flush_interval마다 스냅샷 저장"""
+        pid = os.getpid()
+        while self._flusher_pid == pid:
+            self._dirty.wait()
+            time.sleep(self.flush_interval)
+            self._dirty.clear()
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def flush(self) -> None:
+        """현재 프로세스 스냅샷을 {directory}/{pid}.json에 저장 (임시 파일 후 교체)"""
+        if not self.directory:
+            return
+        with self._flush_lock:
+            path = os.path.join(self.directory, f'{os.getpid()}.json')
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot(), f)
+            os.replace(path + '.tmp', path)
+
+    def load_snapshots(self) -> List[dict]:
+        """
+        살아 있는 워커의 스냅샷 (종료된 워커의 파일은 삭제)
+
+        Returns:
+            스냅샷 리스트 (현재 프로세스 포함)
+        """
+        snapshots = []
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.directory, name)
+            pid = int(name[:-len('.json')]) if name[:-len('.json')].isdigit() else None
+            if pid is None or not process_alive(pid):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return snapshots
+
+    def render(self) -> str:
+        """
+        Prometheus 텍스트 형식 출력 (directory가 있으면 모든 워커 합산)
+
+        Returns:
+            exposition 텍스트
+        """
+        if self.directory:
+            self.flush()
+            snapshots = self.load_snapshots()
+        else:
+            snapshots = [self.snapshot()]
+
+        lines = []
+        for metric in self.metrics:
+            merged = {}
+            for snapshot in snapshots:
+                for labels, value in snapshot['metrics'].get(metric.name, []):
+                    merged[tuple(labels)] = merge_values(merged.get(tuple(labels)), value)
+            lines.extend(metric.render(merged))
+
+        # 캐시 통계는 워커마다 따로 있으므로 합산하지 않고 worker 라벨로 구분
+        for name, help_text, _ in self._collectors:
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} gauge')
+            for snapshot in snapshots:
+                worker = str(snapshot['pid'])
+                for stat, value in snapshot['gauges'].get(name, {}).items():
+                    lines.append(f'{name}{format_labels(["worker", "stat"], [worker, stat])} '
+                                 f'{format_value(value)}')
+
+        lines.append('# HELP dash_metrics_workers Worker processes merged into this scrape.')
+        lines.append('# TYPE dash_metrics_workers gauge')
+        lines.append(f'dash_metrics_workers {len(snapshots)}')
+        return '\n'.join(lines) + '\n'
+
+
+def callback_names(app) -> Dict[str, str]:
+    """
+    콜백 출력 id → 함수 이름 (라벨용, Dash 래퍼는 functools.wraps로 이름 유지)
+
+    Args:
+        app: Dash 앱
+
+    Returns:
+        {출력 id 문자열: 함수 이름}
+    """
+    return {output: getattr(spec.get('callback'), '__name__', output)
+            for output, spec in app.callback_map.items()}
+
+
+def _time_encoder() -> None:
+    """Dash 콜백 응답 인코딩(dash._callback.to_json) 시간을 요청별로 누적"""
+    import dash._callback as dash_callback
+
+    encode = getattr(dash_callback, 'to_json', None)
+    if encode is None or getattr(encode, '_metrics_wrapped', False):
+        return
+
+    @functools.wraps(encode)
+    def timed_encode(value):
+        start = time.perf_counter()
+        try:
+            return encode(value)
+        finally:
+            if flask.has_request_context() and 'metrics' in flask.g:
+                flask.g.metrics['encode'] += time.perf_counter() - start
+
+    timed_encode._metrics_wrapped = True
+    dash_callback.to_json = timed_encode
+
+
+def instrument_client(client, registry: MetricsRegistry) -> None:
+    """
+    API 클라이언트 메서드를 엔드포인트별 지연 시간 기록 래퍼로 교체 (중첩 호출은 바깥만 기록)
+
+    Args:
+        client: API 클라이언트 인스턴스
+        registry: 지표 모음
+    """
+    # 메서드 안에서 다른 계측 메서드를 부르면 (예: Mock get_statistics → get_interest_rates)
+    # 바깥 호출만 기록하도록 스레드별 진행 중 표시
+    active = threading.local()
+
+    for method_name, endpoint in CLIENT_ENDPOINTS.items():
+        method = getattr(client, method_name, None)
+        if method is None:
+            continue
+
+        def timed(*args, _method=method, _endpoint=endpoint, **kwargs):
+            if getattr(active, 'calling', False):
+                return _method(*args, **kwargs)
+            active.calling = True
+            start = time.perf_counter()
+            try:
+                return _method(*args, **kwargs)
+            finally:
+                active.calling = False
+                registry.upstream_seconds.observe((_endpoint,), time.perf_counter() - start)
+
+        setattr(client, method_name, functools.wraps(method)(timed))
+
+
+def install_metrics(app, client=None, caches: Optional[Iterable[Tuple[str, object]]] = None
+                    ) -> Optional[MetricsRegistry]:
+    """
+    콜백/클라이언트 계측 및 /metrics 경로 등록 (콜백 등록 후 호출)
+
+    Args:
+        app: Dash 앱
+        client: API 클라이언트 (엔드포인트별 지연 시간 기록)
+        caches: [(이름, stats() 메서드가 있는 캐시), ...] (게이지로 출력)
+
+    Returns:
+        MetricsRegistry (METRICS_CONFIG['enabled']가 꺼져 있으면 None, 아무것도 설치 안 함)
+    """
+    config = METRICS_CONFIG
+    if not config['enabled']:
+        return None
+
+    registry = MetricsRegistry(config['latency_buckets'], config['size_buckets'],
+                               config['multiprocess_dir'], config['flush_interval'])
+    names = callback_names(app)
+    server = app.server
+
+    for name, cache in caches or ():
+        if cache is not None:
+            registry.add_gauges(f'dash_{name}_cache', f'{name} cache statistics.', cache.stats)
+    if client is not None:
+        instrument_client(client, registry)
+    _time_encoder()
+
+    @server.before_request
+    def start_callback_timer():
+        if not flask.request.path.endswith(DISPATCH_SUFFIX):
+            return
+        start = time.perf_counter()
+        # Flask가 파싱 결과를 캐시하므로 Dash dispatch는 다시 디코딩하지 않음
+        body = flask.request.get_json(silent=True) or {}
+        output = body.get('output', '')
+        flask.g.metrics = {
+            'start': start,
+            'decode': time.perf_counter() - start,
+            'encode': 0.0,
+            'callback': names.get(output, output),
+        }
+
+    @server.after_request
+    def record_callback(response):
+        metrics = flask.g.pop('metrics', None)
+        if metrics is None:
+            return response
+
+        labels = (metrics['callback'],)
+        registry.callback_seconds.observe(labels, time.perf_counter() - metrics['start'])
+        registry.decode_seconds.observe(labels, metrics['decode'])
+        registry.encode_seconds.observe(labels, metrics['encode'])
+        registry.request_bytes.observe(labels, flask.request.content_length or 0)
+        registry.response_bytes.observe(labels, response.calculate_content_length() or 0)
+        registry.callback_requests.inc(labels + (str(response.status_code),))
+        registry.mark_dirty()
+        return response
+
+    @server.route(config['path'])
+    def metrics_endpoint():
+        return flask.Response(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8',
+                              headers={'X-Worker-Pid': str(os.getpid())})
+
+    return registry
@@ -0,0 +1,282 @@
+"""
+콜백 프로파일링 (필요할 때만 켜는 cProfile 훅)
+
+DASH_PROFILE=1이면 선택한 콜백(DASH_PROFILE_CALLBACKS, 비우면 전체)을 항상,
+DASH_PROFILE_HEADER=1이면 X-Dash-Profile 헤더가 있는 요청만 cProfile로 감싼다.
+둘 다 꺼져 있으면 아무 훅도 설치하지 않는다.
+
+프로파일마다 같은 이름으로 두 파일을 남긴다.
+- {이름}.prof: cProfile 결과 (pstats / snakeviz로 확인)
+- {이름}.json: 콜백 요청 본문 (입력/상태 값 그대로, 오프라인 재현용)
+
+헤더로 요청한 호출은 항상 저장하되 최근 requested_size개만, 나머지는 최근 max_age초
+안에서 가장 느린 slowest_size개만 남긴다 (밀려난 호출의 파일은 삭제). 응답 헤더와
+목록에는 저장 폴더 경로 없이 파일 이름만 내보낸다. 저장된 요청은 replay_invocation
+또는 `python -m app.utils.profiling replay 파일.json`으로 다시 실행할 수 있다.
+"""
+
+import cProfile
+import heapq
+import io
+import json
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from collections import deque
+from typing import List, Optional
+import flask
+from app.utils.metrics import DISPATCH_SUFFIX, callback_names
+from config import PROFILING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class ProfiledCall:
+    """프로파일된 콜백 호출 (파일 경로와 소요 시간)"""
+
+    def __init__(self, callback: str, elapsed: float, started: float, path: str):
+        self.callback = callback
+        self.elapsed = elapsed
+        self.started = started
+        self.path = path
+
+    def __lt__(self, other: 'ProfiledCall') -> bool:
+        return self.elapsed < other.elapsed
+
+    def to_dict(self) -> dict:
+        """목록 출력용 딕셔너리"""
+        return {
+            'callback': self.callback,
+            'elapsed_ms': round(self.elapsed * 1000, 1),
+            'started': datetime.fromtimestamp(self.started).isoformat(timespec='seconds'),
+            'profile': os.path.basename(self.path) + '.prof',
+            'inputs': os.path.basename(self.path) + '.json',
+        }
+
+
+class SlowestCalls:
+    """최근 호출 중 가장 느린 k개 (밀려난 호출의 파일 삭제)"""
+
+    def __init__(self, size: int, max_age: float):
+        """
+        Args:
+            size: 보관할 호출 수
+            max_age: 보관 기간 (초, 지나면 느리더라도 제거)
+        """
+        self.size = size
+        self.max_age = max_age
+        self._heap: List[ProfiledCall] = []
+        self._lock = threading.Lock()
+
+    def admits(self, elapsed: float) -> bool:
+        """소요 시간이 목록에 들어갈 만큼 느린지 확인"""
+        with self._lock:
+            self._expire(time.time())
+            return len(self._heap) < self.size or elapsed > self._heap[0].elapsed
+
+    def add(self, call: ProfiledCall) -> None:
+        """호출 추가 (넘치면 가장 빠른 호출 제거)"""
+        with self._lock:
+            self._expire(time.time())
+            heapq.heappush(self._heap, call)
+            while len(self._heap) > self.size:
+                remove_files(heapq.heappop(self._heap).path)
+
+    def _expire(self, now: float) -> None:
+        """보관 기간이 지난 호출 제거 (잠금 안에서 호출)"""
+        expired = [call for call in self._heap if now - call.started > self.max_age]
+        if expired:
+            self._heap = [call for call in self._heap if now - call.started <= self.max_age]
+            heapq.heapify(self._heap)
+            for call in expired:
+                remove_files(call.path)
+
+    def snapshot(self) -> List[dict]:
+        """느린 순 목록"""
+        with self._lock:
+            return [call.to_dict() for call in sorted(self._heap, reverse=True)]
+
+
+class RecentCalls:
+    """최근 호출 k개 (헤더로 요청한 프로파일, 밀려나거나 기간이 지난 호출의 파일 삭제)"""
+
+    def __init__(self, size: int, max_age: float):
+        """
+        Args:
+            size: 보관할 호출 수
+            max_age: 보관 기간 (초)
+        """
+        self.size = size
+        self.max_age = max_age
+        self._calls: 'deque[ProfiledCall]' = deque()
+        self._lock = threading.Lock()
+
+    def add(self, call: ProfiledCall) -> None:
+        """호출 추가 (넘치거나 기간이 지나면 오래된 호출 제거)"""
+        with self._lock:
+            self._calls.append(call)
+            now = time.time()
+            while self._calls and (len(self._calls) > self.size
+                                   or now - self._calls[0].started > self.max_age):
+                remove_files(self._calls.popleft().path)
+
+
+def remove_files(path: str) -> None:
+    """프로파일 파일 쌍 삭제"""
+    for suffix in ('.prof', '.json'):
+        try:
+            os.remove(path + suffix)
+        except FileNotFoundError:
+            pass
+
+
+def dump_call(directory: str, callback: str, elapsed: float, started: float,
+              profiler: cProfile.Profile, body: dict) -> str:
+    """
+    프로파일과 요청 본문 저장
+
+    Args:
+        directory: 저장 폴더
+        callback: 콜백 함수 이름
+        elapsed: 소요 시간 (초)
+        started: 시작 시각 (epoch 초)
+        profiler: 종료된 cProfile 프로파일러
+        body: 콜백 요청 본문
+
+    Returns:
+        확장자를 뺀 파일 경로
+    """
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.fromtimestamp(started).strftime('%Y%m%d-%H%M%S-%f')
+    name = f"{stamp}_{re.sub(r'[^0-9A-Za-z_-]+', '_', callback)}_{elapsed * 1000:.0f}ms_{os.getpid()}"
+    path = os.path.join(directory, name)
+
+    profiler.dump_stats(path + '.prof')
+    with open(path + '.json', 'w', encoding='utf-8') as f:
+        json.dump({'callback': callback, 'elapsed': elapsed, 'body': body}, f, ensure_ascii=False)
+    return path
+
+
+def install_profiling(app) -> Optional[SlowestCalls]:
+    """
+    콜백 프로파일링 훅 설치 (콜백 등록 후 호출)
+
+    Args:
+        app: Dash 앱
+
+    Returns:
+        SlowestCalls (프로파일링이 모두 꺼져 있으면 None, 아무것도 설치 안 함)
+    """
+    config = PROFILING_CONFIG
+    if not (config['enabled'] or config['allow_header']):
+        return None
+
+    names = callback_names(app)
+    selected = set(config['callbacks'])
+    slowest = SlowestCalls(config['slowest_size'], config['max_age'])
+    requested = RecentCalls(config['requested_size'], config['max_age'])
+    server = app.server
+
+    @server.before_request
+    def start_profiler():
+        if not flask.request.path.endswith(DISPATCH_SUFFIX):
+            return
+        requested = config['allow_header'] and bool(flask.request.headers.get(config['header']))
+        if not requested and not config['enabled']:
+            return
+
+        body = flask.request.get_json(silent=True) or {}
+        callback = names.get(body.get('output', ''), body.get('output', ''))
+        if not requested and selected and callback not in selected:
+            return
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # 다른 프로파일러가 이미 동작 중 (Python 3.12+는 프로세스당 하나)
+            return
+        flask.g.profile = {'profiler': profiler, 'callback': callback, 'body': body,
+                           'requested': requested, 'started': time.time(), 'start': time.perf_counter()}
+
+    @server.after_request
+    def stop_profiler(response):
+        state = flask.g.pop('profile', None)
+        if state is None:
+            return response
+
+        state['profiler'].disable()
+        elapsed = time.perf_counter() - state['start']
+        if not state['requested'] and not slowest.admits(elapsed):
+            return response
+
+        try:
+            path = dump_call(config['output_dir'], state['callback'], elapsed, state['started'],
+                             state['profiler'], state['body'])
+        except OSError as e:
+            logger.warning("profile dump failed: %s", e)
+            return response
+
+        call = ProfiledCall(state['callback'], elapsed, state['started'], path)
+        if state['requested']:
+            requested.add(call)
+            response.headers['X-Dash-Profile-Path'] = os.path.basename(path) + '.prof'
+        else:
+            slowest.add(call)
+        logger.info("profiled %s: %.1f ms -> %s", state['callback'], elapsed * 1000, path)
+        return response
+
+    @server.route(config['path'])
+    def slowest_profiles():
+        return flask.jsonify(slowest.snapshot())
+
+    return slowest
+
+
+def replay_invocation(path: str, app=None, sort: str = 'cumulative', limit: int = 30) -> str:
+    """
+    저장된 콜백 요청을 다시 실행하여 프로파일 (오프라인 재현)
+
+    Args:
+        path: dump_call이 저장한 .json 파일
+        app: Dash 앱 (없으면 create_app으로 생성)
+        sort: pstats 정렬 기준
+        limit: 출력할 함수 수
+
+    Returns:
+        pstats 출력 문자열 (첫 줄: 응답 상태와 소요 시간)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        saved = json.load(f)
+
+    if app is None:
+        from app.factory import create_app
+        app = create_app()
+    prefix = app.config.requests_pathname_prefix.rstrip('/')
+
+    client = app.server.test_client()
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    response = client.post(prefix + DISPATCH_SUFFIX, json=saved['body'])
+    profiler.disable()
+    elapsed = time.perf_counter() - start
+
+    out = io.StringIO()
+    out.write(f"{saved['callback']}: status={response.status_code} "
+              f"elapsed={elapsed * 1000:.1f} ms (recorded {saved['elapsed'] * 1000:.1f} ms)\n")
+    pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats(limit)
+    return out.getvalue()
+
+
+if __name__ == '__main__':
+    # 사용법: python -m app.utils.profiling replay <파일.json> [정렬 기준]
+    if len(sys.argv) < 3 or sys.argv[1] != 'replay':
+        print("usage: python -m app.utils.profiling replay <profile.json> [sort]")
+        sys.exit(1)
+    print(replay_invocation(sys.argv[2], sort=sys.argv[3] if len(sys.argv) > 3 else 'cumulative'))
@@ -0,0 +1,390 @@
+"""
+확대 구간 통계 인덱스
+
+데이터셋마다 한 번 만들어 두고, 차트 확대 구간의 통계를 원본을 다시 훑지 않고 조회한다.
+- 평균/표준편차: 누적합, 누적 제곱합 (O(1))
+- 최소/최대: 블록 단위 희소 테이블 + 경계 행 직접 비교 (O(√n))
+- 분위수/백분위 순위: 순위 구간 × 행 블록 누적 개수 (O(√n), 반복 없는 벡터 연산)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+import numpy as np
+import pandas as pd
+from app.utils.stats_utils import forward_valid_rows, horizon_changes
+from config import RANGE_INDEX_CONFIG, STAT_HORIZONS
+
+_index_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class RangeIndex:
+    """날짜 구간 통계 조회용 인덱스 (행: 날짜, 열: 항목)"""
+
+    def __init__(self, dates, values: np.ndarray, block_size: Optional[int] = None,
+                 columns: Optional[list] = None):
+        """
+        Args:
+            dates: 정렬된 날짜 배열 (DatetimeIndex 또는 datetime64 배열)
+            values: (행: 날짜, 열: 항목) 값 배열 (1차원이면 항목 1개)
+            block_size: 정렬 블록 크기 (기본: RANGE_INDEX_CONFIG['block_size'])
+            columns: 열 순서의 항목 이름 (없으면 열 번호)
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 1:
+            values = values[:, None]
+
+        # 데이터셋 키는 항목 순서와 무관하므로, 통계 라벨은 호출 측 순서가 아니라 이 순서를 따름
+        self.columns = list(columns) if columns is not None else list(range(values.shape[1]))
+
+        self.dates = np.asarray(dates, dtype='datetime64[ns]')
+        self.values = values
+        self.block_size = block_size or RANGE_INDEX_CONFIG['block_size']
+        n_rows, n_cols = values.shape
+        valid = ~np.isnan(values)
+
+        # 누적합 (열 평균으로 중심화하여 제곱합의 자릿수 손실 방지)
+        filled = np.where(valid, values, 0.0)
+        self._shift = filled.sum(axis=0) / np.maximum(valid.sum(axis=0), 1)
+        centered = np.where(valid, values - self._shift, 0.0)
+        zeros = np.zeros((1, n_cols))
+        self._count = np.vstack([np.zeros((1, n_cols), dtype=np.int64), np.cumsum(valid, axis=0)])
+        self._sum = np.vstack([zeros, np.cumsum(centered, axis=0)])
+        self._sq_sum = np.vstack([zeros, np.cumsum(centered ** 2, axis=0)])
+
+        # 열별 순위 (NaN은 n_rows로 두어 모든 조회에서 제외)
+        order = np.argsort(values, axis=0, kind='stable')
+        self._order = order
+        self._sorted = np.take_along_axis(values, order, axis=0)
+        ranks = np.empty((n_rows, n_cols), dtype=np.int64)
+        np.put_along_axis(ranks, order, np.arange(n_rows)[:, None], axis=0)
+        ranks[~valid] = n_rows
+        self._ranks = ranks
+
+        # 순위를 폭 w 구간으로 나누고, 행 블록(크기 w)마다 구간별 누적 개수 저장
+        # (w ≥ √n이므로 누적 개수 표는 원본 크기 정도)
+        width = max(self.block_size, int(np.ceil(np.sqrt(max(n_rows, 1)))))
+        self._width = width
+        self._n_blocks = max(-(-n_rows // width), 1)
+        self._buckets = ranks // width  # NaN은 마지막 구간 (n_blocks)
+        block_ids = np.arange(n_rows)[:, None] // width
+        flat = ((block_ids * (self._n_blocks + 1) + self._buckets) * n_cols + np.arange(n_cols)).ravel()
+        hist = np.bincount(flat, minlength=self._n_blocks * (self._n_blocks + 1) * n_cols)
+        hist = hist.reshape(self._n_blocks, self._n_blocks + 1, n_cols)
+        self._block_counts = np.concatenate([np.zeros((1,) + hist.shape[1:], dtype=hist.dtype),
+                                             np.cumsum(hist, axis=0)])
+
+        # 블록 단위 희소 테이블 (레벨 k: 연속 2^k 블록의 최소/최대)
+        lows = np.full((self._n_blocks * width, n_cols), np.inf)
+        highs = np.full((self._n_blocks * width, n_cols), -np.inf)
+        lows[:n_rows] = np.where(valid, values, np.inf)
+        highs[:n_rows] = np.where(valid, values, -np.inf)
+        self._mins = [lows.reshape(self._n_blocks, width, n_cols).min(axis=1)]
+        self._maxs = [highs.reshape(self._n_blocks, width, n_cols).max(axis=1)]
+        span = 1
+        while span * 2 <= self._n_blocks:
+            self._mins.append(np.minimum(self._mins[-1][:-span], self._mins[-1][span:]))
+            self._maxs.append(np.maximum(self._maxs[-1][:-span], self._maxs[-1][span:]))
+            span *= 2
+        self._lows, self._highs = lows, highs
+
+        self._prev_valid = forward_valid_rows(valid)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, block_size: Optional[int] = None) -> 'RangeIndex':
+        """
+        DataFrame으로 인덱스 생성
+
+        Args:
+            df: 데이터 DataFrame (인덱스: 날짜)
+            block_size: 정렬 블록 크기
+
+        Returns:
+            RangeIndex
+        """
+        return cls(df.index, df.to_numpy(dtype=float), block_size, columns=list(df.columns))
+
+    def locate(self, start, end) -> Tuple[int, int]:
+        """
+        날짜 구간을 행 위치 구간으로 변환
+
+        Args:
+            start: 시작 날짜 (relayoutData 문자열 등, 포함)
+            end: 끝 날짜 (포함)
+
+        Returns:
+            (시작 행, 끝 행 + 1) 튜플
+        """
+        start = pd.Timestamp(start).to_datetime64()
+        end = pd.Timestamp(end).to_datetime64()
+        return (int(np.searchsorted(self.dates, start, side='left')),
+                int(np.searchsorted(self.dates, end, side='right')))
+
+    def counts(self, lo: int, hi: int) -> np.ndarray:
+        """구간 [lo, hi)의 열별 유효값 개수"""
+        return self._count[hi] - self._count[lo]
+
+    def mean_std(self, lo: int, hi: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        구간 평균 및 표본 표준편차 (누적합 기반)
+
+        Args:
+            lo: 시작 행
+            hi: 끝 행 + 1
+
+        Returns:
+            (평균 배열, 표준편차 배열) 튜플 (값이 부족하면 NaN)
+        """
+        n = self.counts(lo, hi)
+        total = self._sum[hi] - self._sum[lo]
+        sq_total = self._sq_sum[hi] - self._sq_sum[lo]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = total / n
+            var = np.maximum(sq_total - total * mean, 0.0) / (n - 1)
+        mean = np.where(n > 0, mean + self._shift, np.nan)
+        std = np.where(n > 1, np.sqrt(var), np.nan)
+        return mean, std
+
+    def min_max(self, lo: int, hi: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        구간 최소/최대 (블록 단위 희소 테이블 기반)
+
+        Args:
+            lo: 시작 행
+            hi: 끝 행 + 1
+
+        Returns:
+            (최소 배열, 최대 배열) 튜플 (값이 없으면 NaN)
+        """
+        n_cols = self.values.shape[1]
+        if hi <= lo:
+            return np.full(n_cols, np.nan), np.full(n_cols, np.nan)
+
+        # 블록 경계 밖의 앞뒤 행은 직접 비교
+        width = self._width
+        first_block = -(-lo // width)
+        last_block = hi // width
+        if first_block >= last_block:
+            low = self._lows[lo:hi].min(axis=0)
+            high = self._highs[lo:hi].max(axis=0)
+        else:
+            edges = np.r_[lo:first_block * width, last_block * width:hi]
+            low = self._lows[edges].min(axis=0, initial=np.inf)
+            high = self._highs[edges].max(axis=0, initial=-np.inf)
+
+            # 온전한 블록은 희소 테이블에서 겹치는 두 구간으로 조회
+            level = int(last_block - first_block).bit_length() - 1
+            tail = last_block - (1 << level)
+            low = np.minimum(low, np.minimum(self._mins[level][first_block], self._mins[level][tail]))
+            high = np.maximum(high, np.maximum(self._maxs[level][first_block], self._maxs[level][tail]))
+
+        return np.where(np.isfinite(low), low, np.nan), np.where(np.isfinite(high), high, np.nan)
+
+    def bucket_counts(self, lo: int, hi: int) -> np.ndarray:
+        """
+        구간 [lo, hi)의 순위 구간별 누적 개수
+
+        Args:
+            lo: 시작 행
+            hi: 끝 행 + 1
+
+        Returns:
+            (순위 구간, 열) 누적 개수 배열 (NaN 구간 제외)
+        """
+        width = self._width
+        n_cols = self._ranks.shape[1]
+        n_buckets = self._n_blocks + 1
+        first_block = -(-lo // width)
+        last_block = hi // width
+
+        if first_block >= last_block:
+            edges = self._buckets[lo:hi]
+            counts = 0
+        else:
+            edges = np.concatenate([self._buckets[lo:first_block * width],
+                                    self._buckets[last_block * width:hi]])
+            counts = self._block_counts[last_block] - self._block_counts[first_block]
+
+        # 블록 경계 밖의 앞뒤 행은 직접 집계
+        flat = (edges * n_cols + np.arange(n_cols)).ravel()
+        counts = counts + np.bincount(flat, minlength=n_buckets * n_cols).reshape(n_buckets, n_cols)
+        return np.cumsum(counts[:-1], axis=0)
+
+    def _bucket_members(self, lo: int, hi: int, buckets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        순위 구간에 속한 값 중 구간 [lo, hi) 안에 있는 값 표시
+
+        Args:
+            lo: 시작 행
+            hi: 끝 행 + 1
+            buckets: (k, 열) 순위 구간 배열
+
+        Returns:
+            ((k, 열, w) 순위 배열, (k, 열, w) 구간 포함 여부) 튜플
+        """
+        n_rows, n_cols = self._ranks.shape
+        ranks = buckets[:, :, None] * self._width + np.arange(self._width)
+        clipped = np.minimum(ranks, max(n_rows - 1, 0))
+        rows = self._order[clipped, np.arange(n_cols)[None, :, None]]
+        valid_total = self._count[-1][None, :, None]
+        inside = (ranks < valid_total) & (rows >= lo) & (rows < hi)
+        return clipped, inside
+
+    def order_statistics(self, lo: int, hi: int, ks: np.ndarray) -> np.ndarray:
+        """
+        구간 내 k번째(0부터) 작은 값
+
+        순위 구간별 누적 개수로 k번째 값이 속한 구간을 찾고,
+        그 구간(폭 w)의 값만 확인한다.
+
+        Args:
+            lo: 시작 행
+            hi: 끝 행 + 1
+            ks: (k, 열) 순서 배열 (유효값 개수 미만)
+
+        Returns:
+            (k, 열) 값 배열
+        """
+        n_cols = self._ranks.shape[1]
+        cols = np.arange(n_cols)[None, :]
+        cumulative = self.bucket_counts(lo, hi)
+
+        buckets = np.minimum((cumulative[None, :, :] <= ks[:, None, :]).sum(axis=1), self._n_blocks - 1)
+        before = np.where(buckets > 0, cumulative[np.maximum(buckets - 1, 0), cols], 0)
+
+        ranks, inside = self._bucket_members(lo, hi, buckets)
+        hit = np.argmax(np.cumsum(inside, axis=2) == (ks - before + 1)[:, :, None], axis=2)
+        return self._sorted[np.take_along_axis(ranks, hit[:, :, None], axis=2)[:, :, 0], cols]
+
+    def quantiles(self, lo: int, hi: int, qs) -> np.ndarray:
+        """
+        구간 분위수 (선형 보간, pandas quantile과 동일)
+
+        Args:
+            lo: 시작 행
+            hi: 끝 행 + 1
+            qs: 분위 리스트 (0~1)
+
+        Returns:
+            (분위, 열) 값 배열 (값이 없으면 NaN)
+        """
+        n = self.counts(lo, hi)
+        pos = np.asarray(qs, dtype=float)[:, None] * np.maximum(n - 1, 0)[None, :]
+        lower = np.floor(pos).astype(np.int64)
+        upper = np.minimum(lower + 1, np.maximum(n - 1, 0))
+
+        values = self.order_statistics(lo, hi, np.vstack([lower, upper]))
+        low_val, high_val = values[:len(qs)], values[len(qs):]
+        result = low_val + (high_val - low_val) * (pos - lower)
+        return np.where(n > 0, result, np.nan)
+
+    def percentile_rank(self, lo: int, hi: int, targets: np.ndarray) -> np.ndarray:
+        """
+        구간 내 값 이하인 값의 비율 (백분위 순위)
+
+        Args:
+            lo: 시작 행
+            hi: 끝 행 + 1
+            targets: 열별 기준값
+
+        Returns:
+            열별 백분위 순위 (0~100, 값이 없으면 NaN)
+        """
+        n_cols = self.values.shape[1]
+        cols = np.arange(n_cols)
+        valid_total = self._count[-1]
+
+        # 기준값 이하인 가장 큰 순위 (없으면 -1)
+        bounds = np.array([
+            np.searchsorted(self._sorted[:valid_total[col], col], targets[col], side='right') - 1
+            for col in cols
+        ], dtype=np.int64)
+
+        cumulative = self.bucket_counts(lo, hi)
+        buckets = np.maximum(bounds, 0) // self._width
+        before = np.where(buckets > 0, cumulative[np.maximum(buckets - 1, 0), cols], 0)
+        ranks, inside = self._bucket_members(lo, hi, buckets[None, :])
+        at_most = before + (inside & (ranks <= bounds[None, :, None])).sum(axis=2)[0]
+        at_most = np.where(bounds >= 0, at_most, 0)
+
+        n = self.counts(lo, hi)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(n > 0, at_most / n * 100, np.nan)
+
+    def summary(self, lo: int, hi: int, horizons: Optional[Dict[str, str]] = None) -> Dict[str, np.ndarray]:
+        """
+        구간 요약 통계 (summarize_columns와 같은 형식)
+
+        변화량은 구간 끝 날짜 기준으로 전체 이력에서 조회한다.
+
+        Args:
+            lo: 시작 행
+            hi: 끝 행 + 1
+            horizons: {변화량 이름: 기간 문자열} 딕셔너리 (기본: STAT_HORIZONS)
+
+        Returns:
+            통계 이름별 열 배열 딕셔너리
+        """
+        n_cols = self.values.shape[1]
+        cols = np.arange(n_cols)
+        n = self.counts(lo, hi)
+        has_data = n > 0
+
+        mean, std = self.mean_std(lo, hi)
+        low, high = self.min_max(lo, hi)
+        std = np.where((n > 1) & (high == low), 0.0, std)  # 값이 모두 같으면 누적합 오차 없이 0
+        q25, median, q75 = self.quantiles(lo, hi, [0.25, 0.5, 0.75])
+
+        last_rows = np.maximum(self._prev_valid[hi - 1], 0) if hi > 0 else np.zeros(n_cols, dtype=np.int64)
+        current = np.where(has_data, self.values[last_rows, cols], np.nan)
+
+        summary = {
+            'count': n,
+            'current': current,
+            'mean': mean,
+            'std': std,
+            'min': low,
+            'max': high,
+            'median': median,
+            'q25': q25,
+            'q75': q75,
+            'pct_rank': self.percentile_rank(lo, hi, current),
+        }
+
+        changes = horizon_changes(self.values, self.dates, self._prev_valid, current, last_rows,
+                                  STAT_HORIZONS if horizons is None else horizons)
+        for name, change in changes.items():
+            summary[name] = np.where(has_data, change, 0.0)
+
+        return summary
+
+
+def get_range_index(key: Hashable, build: Callable[[], RangeIndex]) -> RangeIndex:
+    """
+    캐시된 인덱스 조회 (없으면 생성, RANGE_INDEX_CONFIG['max_entries'] 기준 LRU)
+
+    Args:
+        key: 캐시 키 (데이터셋 키 등, None이면 캐시하지 않음)
+        build: 인덱스 생성 함수
+
+    Returns:
+        RangeIndex
+    """
+    if key is None:
+        return build()
+
+    with _cache_lock:
+        index = _index_cache.get(key)
+        if index is not None:
+            _index_cache.move_to_end(key)
+            return index
+
+    index = build()
+
+    with _cache_lock:
+        _index_cache[key] = index
+        while len(_index_cache) > RANGE_INDEX_CONFIG['max_entries']:
+            _index_cache.popitem(last=False)
+
+    return index
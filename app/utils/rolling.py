@@ -0,0 +1,383 @@
+"""
+롤링 지표 계산 유틸리티 함수 (금리/환율 시계열)
+
+이동평균, 볼린저 밴드, 고저 채널, 변동성, RSI를 한 번에 계산한다.
+- 전체 계산: 누적합(평균/표준편차)과 블록 누적 최소/최대(van Herk/Gil-Werman)를
+  지표끼리 공유하여 창 크기와 무관하게 O(n) 벡터 연산
+- 증분 계산: RollingState가 누적합과 단조 덱으로 새 값 추가를 O(1)에 처리
+  (결측 무시, 창이 다 차기 전 NaN 등 전체 계산과 같은 결과)
+"""
+
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import pandas as pd
+from config import ROLLING_CONFIG
+
+# 연율화 계수 (영업일 기준)
+ANNUALIZATION = np.sqrt(252)
+
+
+def indicator_names(config: Optional[dict] = None) -> List[str]:
+    """
+    설정으로 계산 가능한 지표 이름 목록
+
+    Args:
+        config: 롤링 설정 (기본: ROLLING_CONFIG)
+
+    Returns:
+        지표 이름 리스트
+    """
+    config = config or ROLLING_CONFIG
+    return ([f"ma{window}" for window in config['ma_windows']] +
+            ['bb_upper', 'bb_lower', 'channel_high', 'channel_low', 'volatility', 'rsi'])
+
+
+def rolling_sums(prefix: np.ndarray, window: int) -> np.ndarray:
+    """
+    누적합 배열로 창 합계 계산 (창이 다 차지 않은 앞부분은 NaN)
+
+    Args:
+        prefix: 앞에 0을 붙인 누적합 배열 (길이 n + 1)
+        window: 창 크기
+
+    Returns:
+        길이 n 창 합계 배열
+    """
+    n = len(prefix) - 1
+    result = np.full(n, np.nan)
+    if n >= window:
+        result[window - 1:] = prefix[window:] - prefix[:-window]
+    return result
+
+
+def rolling_extreme(values: np.ndarray, window: int, maximum: bool = False) -> np.ndarray:
+    """
+    창 최소/최대 (van Herk/Gil-Werman, 창 크기와 무관하게 O(n))
+
+    창 크기 블록마다 앞쪽 누적 최소와 뒤쪽 누적 최소를 구해 두면
+    임의의 창은 두 값의 최소로 구해진다.
+
+    Args:
+        values: 값 배열 (NaN 없음)
+        window: 창 크기
+        maximum: True면 최대, False면 최소
+
+    Returns:
+        길이 n 배열 (창이 다 차지 않은 앞부분은 NaN)
+    """
+    n = len(values)
+    result = np.full(n, np.nan)
+    if n < window:
+        return result
+
+    func = np.maximum if maximum else np.minimum
+    fill = -np.inf if maximum else np.inf
+    blocks = np.concatenate([values, np.full(-n % window, fill)]).reshape(-1, window)
+    prefix = func.accumulate(blocks, axis=1).ravel()
+    suffix = func.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    result[window - 1:] = func(suffix[:n - window + 1], prefix[window - 1:n])
+    return result
+
+
+def rsi_values(gains, losses, ups, downs):
+    """
+    창 상승/하락 합계로 RSI 계산 (전체/증분 계산 공용)
+
+    상승/하락 여부는 횟수로 판정하여 누적합 차이의 반올림 오차와 무관하게
+    평평한 창(변화 없음)은 NaN, 하락이 없는 창은 100, 상승이 없는 창은 0이 된다.
+
+    Args:
+        gains: 창 상승폭 합계
+        losses: 창 하락폭 합계
+        ups: 창 상승 횟수
+        downs: 창 하락 횟수
+
+    Returns:
+        RSI (입력과 같은 모양)
+    """
+    gains = np.where(ups > 0, gains, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rsi = np.where(downs > 0, 100 - 100 / (1 + gains / np.where(downs > 0, losses, 1.0)), 100.0)
+    return np.where(ups + downs > 0, rsi, np.nan)
+
+
+def compute_indicators(values: np.ndarray,
+                       names: Iterable[str],
+                       config: Optional[dict] = None) -> Dict[str, np.ndarray]:
+    """
+    단일 시계열의 롤링 지표 계산 (누적합 등 중간 결과 공유)
+
+    Args:
+        values: 값 배열 (NaN 없음, 관측치 순서)
+        names: 계산할 지표 이름
+        config: 롤링 설정 (기본: ROLLING_CONFIG)
+
+    Returns:
+        {지표 이름: 길이 n 배열}
+    """
+    config = config or ROLLING_CONFIG
+    names = list(names)
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    result = OrderedDict()
+
+    # 평균/표준편차용 누적합 (평균으로 중심화하여 제곱합 자릿수 손실 방지)
+    shift = values.mean() if n else 0.0
+    centered = values - shift
+    prefix = np.concatenate([[0.0], np.cumsum(centered)])
+    prefix_sq = np.concatenate([[0.0], np.cumsum(centered ** 2)])
+
+    def mean_std(window):
+        total = rolling_sums(prefix, window)
+        total_sq = rolling_sums(prefix_sq, window)
+        with np.errstate(invalid='ignore'):
+            std = np.sqrt(np.maximum(total_sq - total ** 2 / window, 0.0) / (window - 1))
+        return total / window + shift, std
+
+    for window in config['ma_windows']:
+        if f"ma{window}" in names:
+            result[f"ma{window}"] = mean_std(window)[0]
+
+    if 'bb_upper' in names or 'bb_lower' in names:
+        middle, std = mean_std(config['bollinger_window'])
+        result['bb_upper'] = middle + config['bollinger_std'] * std
+        result['bb_lower'] = middle - config['bollinger_std'] * std
+
+    if 'channel_high' in names or 'channel_low' in names:
+        result['channel_high'] = rolling_extreme(values, config['channel_window'], maximum=True)
+        result['channel_low'] = rolling_extreme(values, config['channel_window'])
+
+    # 일간 변화량 기반 지표 (변동성, RSI)
+    if 'volatility' in names or 'rsi' in names:
+        diffs = np.diff(values)
+        diff_shift = diffs.mean() if len(diffs) else 0.0
+        diff_prefix = np.concatenate([[0.0], np.cumsum(diffs - diff_shift)])
+        diff_prefix_sq = np.concatenate([[0.0], np.cumsum((diffs - diff_shift) ** 2)])
+
+        if 'volatility' in names:
+            window = config['volatility_window']
+            total = rolling_sums(diff_prefix, window)
+            total_sq = rolling_sums(diff_prefix_sq, window)
+            with np.errstate(invalid='ignore'):
+                std = np.sqrt(np.maximum(total_sq - total ** 2 / window, 0.0) / (window - 1))
+            result['volatility'] = np.concatenate([[np.nan], std * ANNUALIZATION])[:n]
+
+        if 'rsi' in names:
+            period = config['rsi_period']
+            gains = rolling_sums(np.concatenate([[0.0], np.cumsum(np.maximum(diffs, 0.0))]), period)
+            losses = rolling_sums(np.concatenate([[0.0], np.cumsum(np.maximum(-diffs, 0.0))]), period)
+            ups = rolling_sums(np.concatenate([[0], np.cumsum(diffs > 0)]), period)
+            downs = rolling_sums(np.concatenate([[0], np.cumsum(diffs < 0)]), period)
+            result['rsi'] = np.concatenate([[np.nan], rsi_values(gains, losses, ups, downs)])[:n]
+
+    return result
+
+
+def compute_rolling(df: pd.DataFrame,
+                    names: Iterable[str],
+                    config: Optional[dict] = None) -> Dict[str, pd.DataFrame]:
+    """
+    DataFrame 전체 항목의 롤링 지표 계산
+
+    항목별로 결측을 제외한 관측치 기준으로 창을 계산한다 (휴일이 다른 항목 간 영향 없음).
+
+    Args:
+        df: 데이터 DataFrame
+        names: 계산할 지표 이름
+        config: 롤링 설정 (기본: ROLLING_CONFIG)
+
+    Returns:
+        {지표 이름: df와 같은 모양의 DataFrame}
+    """
+    names = list(names)
+    frames = OrderedDict()
+
+    for col in df.columns:
+        values = df[col].to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+        for name, result in compute_indicators(values[valid], names, config).items():
+            column = np.full(len(values), np.nan)
+            column[valid] = result
+            frames.setdefault(name, OrderedDict())[col] = column
+
+    return OrderedDict((name, pd.DataFrame(columns, index=df.index)) for name, columns in frames.items())
+
+
+def overlay_indicators(overlays: Iterable[str]) -> List[str]:
+    """
+    오버레이 선택값을 지표 이름으로 변환
+
+    Args:
+        overlays: 오버레이 값 ('ma', 'bollinger', 'channel', 'volatility', 'rsi')
+
+    Returns:
+        지표 이름 리스트
+    """
+    mapping = {
+        'ma': [f"ma{window}" for window in ROLLING_CONFIG['ma_windows']],
+        'bollinger': ['bb_upper', 'bb_lower'],
+        'channel': ['channel_high', 'channel_low'],
+        'volatility': ['volatility'],
+        'rsi': ['rsi'],
+    }
+    return [name for overlay in overlays for name in mapping.get(overlay, [])]
+
+
+class RollingState:
+    """단일 시계열의 롤링 지표 상태 (새 값 추가 O(1))"""
+
+    def __init__(self, config: Optional[dict] = None):
+        """
+        Args:
+            config: 롤링 설정 (기본: ROLLING_CONFIG)
+        """
+        self.config = config or ROLLING_CONFIG
+        self._mean_windows = sorted(set(self.config['ma_windows']) | {self.config['bollinger_window']})
+        self._values = deque(maxlen=max(self._mean_windows + [self.config['channel_window']]))
+        self._diffs = deque(maxlen=max(self.config['volatility_window'], self.config['rsi_period']))
+        self._sums = {window: [0.0, 0.0] for window in self._mean_windows}
+        self._diff_sums = [0.0, 0.0]
+        self._gain_loss = [0.0, 0.0]
+        self._moves = [0, 0]
+        self._lows = deque()
+        self._highs = deque()
+        self.count = 0
+
+    @classmethod
+    def from_history(cls, values: Iterable[float], config: Optional[dict] = None) -> 'RollingState':
+        """
+        과거 값으로 상태 생성 (창에 필요한 마지막 값만 반영)
+
+        Args:
+            values: 과거 값 (관측치 순서, NaN은 무시)
+            config: 롤링 설정
+
+        Returns:
+            RollingState
+        """
+        state = cls(config)
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        tail = max(state._values.maxlen, state._diffs.maxlen + 1)
+        state.count = max(len(values) - tail, 0)
+        for value in values[-tail:]:
+            state.append(float(value))
+        return state
+
+    def append(self, value: float) -> Dict[str, float]:
+        """
+        새 관측치 추가 (누적합 갱신, 단조 덱으로 최소/최대 갱신)
+
+        결측(NaN)은 상태를 바꾸지 않고 모든 지표가 NaN인 행을 반환한다
+        (compute_rolling이 결측 행을 건너뛰고 NaN으로 채우는 것과 같음).
+
+        Args:
+            value: 새 값
+
+        Returns:
+            추가 후 최신 지표 딕셔너리
+        """
+        if np.isnan(value):
+            return OrderedDict((name, np.nan) for name in indicator_names(self.config))
+
+        values = self._values
+        for window, sums in self._sums.items():
+            sums[0] += value
+            sums[1] += value * value
+            if len(values) >= window:
+                leaving = values[-window]
+                sums[0] -= leaving
+                sums[1] -= leaving * leaving
+
+        # 단조 덱: 창 안에서 최소(최대)가 될 수 있는 값만 유지
+        window = self.config['channel_window']
+        while self._lows and self._lows[-1][1] >= value:
+            self._lows.pop()
+        while self._highs and self._highs[-1][1] <= value:
+            self._highs.pop()
+        self._lows.append((self.count, value))
+        self._highs.append((self.count, value))
+        while self._lows[0][0] <= self.count - window:
+            self._lows.popleft()
+        while self._highs[0][0] <= self.count - window:
+            self._highs.popleft()
+
+        if values:
+            self._append_diff(value - values[-1])
+
+        values.append(value)
+        self.count += 1
+        return self.latest()
+
+    def _append_diff(self, diff: float) -> None:
+        """일간 변화량 추가 (변동성/RSI 누적합 갱신)"""
+        diffs = self._diffs
+        vol_window = self.config['volatility_window']
+        rsi_period = self.config['rsi_period']
+
+        self._diff_sums[0] += diff
+        self._diff_sums[1] += diff * diff
+        if len(diffs) >= vol_window:
+            leaving = diffs[-vol_window]
+            self._diff_sums[0] -= leaving
+            self._diff_sums[1] -= leaving * leaving
+
+        self._gain_loss[0] += max(diff, 0.0)
+        self._gain_loss[1] += max(-diff, 0.0)
+        self._moves[0] += diff > 0
+        self._moves[1] += diff < 0
+        if len(diffs) >= rsi_period:
+            leaving = diffs[-rsi_period]
+            self._gain_loss[0] -= max(leaving, 0.0)
+            self._gain_loss[1] -= max(-leaving, 0.0)
+            self._moves[0] -= leaving > 0
+            self._moves[1] -= leaving < 0
+
+        diffs.append(diff)
+
+    def latest(self) -> Dict[str, float]:
+        """
+        최신 지표 값 (창이 다 차지 않은 지표는 NaN)
+
+        Returns:
+            {지표 이름: 값}
+        """
+        config = self.config
+        n_values = len(self._values)
+        result = OrderedDict()
+
+        def mean_std(window):
+            if n_values < window:
+                return np.nan, np.nan
+            total, total_sq = self._sums[window]
+            var = max(total_sq - total * total / window, 0.0) / (window - 1)
+            return total / window, np.sqrt(var)
+
+        for window in config['ma_windows']:
+            result[f"ma{window}"] = mean_std(window)[0]
+
+        middle, std = mean_std(config['bollinger_window'])
+        result['bb_upper'] = middle + config['bollinger_std'] * std
+        result['bb_lower'] = middle - config['bollinger_std'] * std
+
+        full_channel = n_values >= config['channel_window']
+        result['channel_high'] = self._highs[0][1] if full_channel else np.nan
+        result['channel_low'] = self._lows[0][1] if full_channel else np.nan
+
+        n_diffs = len(self._diffs)
+        window = config['volatility_window']
+        if n_diffs >= window:
+            total, total_sq = self._diff_sums
+            var = max(total_sq - total * total / window, 0.0) / (window - 1)
+            result['volatility'] = np.sqrt(var) * ANNUALIZATION
+        else:
+            result['volatility'] = np.nan
+
+        if n_diffs >= config['rsi_period']:
+            result['rsi'] = float(rsi_values(*self._gain_loss, *self._moves))
+        else:
+            result['rsi'] = np.nan
+
+        return result
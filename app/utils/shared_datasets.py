@@ -0,0 +1,309 @@
+"""
+워커 간 공유 메모리 데이터셋 저장소
+
+멀티 프로세스(gunicorn 워커)로 실행하면 같은 데이터셋을 워커마다 따로 변환해 들고
+있게 된다. 데이터셋 키(날짜 + 시계열 해시)별로 날짜 인덱스와 값 행렬을
+multiprocessing.shared_memory 블록에 한 번만 저장하고, 어느 워커든 블록 이름을
+키에서 계산하여 복사 없이 NumPy 뷰로 붙는다.
+
+블록 구성 (키 해시 h 기준):
+- {prefix}{h}_m: 매니페스트 (참조 수 int64, JSON 길이 int64, JSON: 컬럼/행 수)
+- {prefix}{h}_d: 날짜 (datetime64[ns] → int64)
+- {prefix}{h}_v: 값 행렬 (float64, 행: 날짜, 열: 항목)
+
+참조 수는 붙어 있는 워커 수이며, 파일 잠금(fcntl)으로 워커 간 갱신을 직렬화한다.
+워커별로 최근 max_entries개만 붙여 두고, 밀려나거나 프로세스가 끝나면 참조를
+반납하며 마지막 참조가 반납되면 블록을 삭제한다.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional
+import numpy as np
+import pandas as pd
+from app.utils.data_utils import dataset_to_frame, dataset_items
+from config import SHARED_DATASET_CONFIG
+
+try:
+    import fcntl
+except ImportError:  # Windows: 공유 저장소 사용 안 함
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 매니페스트 헤더: 참조 수, JSON 길이
+HEADER = struct.Struct('<qq')
+
+
+class SharedEntry:
+    """워커에 붙어 있는 공유 데이터셋 (블록 핸들과 DataFrame 뷰)"""
+
+    def __init__(self, blocks: dict, frame: pd.DataFrame):
+        self.blocks = blocks
+        self.frame = frame
+
+
+class SharedDatasetRegistry:
+    """공유 메모리 데이터셋 저장소 (워커별 인스턴스, 블록은 전체 공유)"""
+
+    def __init__(self, prefix: str, max_entries: int, lock_path: str):
+        """
+        Args:
+            prefix: 공유 메모리 블록 이름 접두어
+            max_entries: 워커별로 붙여 둘 최대 데이터셋 수
+            lock_path: 워커 간 잠금 파일 경로
+        """
+        self.prefix = prefix
+        self.max_entries = max_entries
+        self.lock_path = lock_path
+        self._entries: 'OrderedDict[str, SharedEntry]' = OrderedDict()
+        self._thread_lock = threading.RLock()
+
+    def block_name(self, key: str, part: str) -> str:
+        """
+        데이터셋 키의 블록 이름 (모든 워커에서 같은 이름)
+
+        Args:
+            key: 데이터셋 키
+            part: 'm' (매니페스트), 'd' (날짜), 'v' (값)
+
+        Returns:
+            블록 이름
+        """
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+        return f"{self.prefix}{digest}_{part}"
+
+    @contextmanager
+    def _locked(self):
+        """스레드 및 워커 간 잠금"""
+        with self._thread_lock:
+            with open(self.lock_path, 'a+') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _open(name: str, size: int = 0) -> shared_memory.SharedMemory:
+        """
+        블록 생성 또는 붙기 (참조 수로 수명을 직접 관리하므로 resource_tracker 등록 해제)
+
+        Args:
+            name: 블록 이름
+            size: 생성할 크기 (0이면 기존 블록에 붙기)
+
+        Returns:
+            SharedMemory
+
+        Raises:
+            FileNotFoundError: 붙을 블록이 없음
+        """
+        block = shared_memory.SharedMemory(name=name, create=size > 0, size=max(size, 1))
+        resource_tracker.unregister(block._name, 'shared_memory')
+        return block
+
+    @staticmethod
+    def _add_refs(manifest: shared_memory.SharedMemory, delta: int) -> int:
+        """매니페스트 참조 수 변경 (잠금 안에서 호출)"""
+        refs, length = HEADER.unpack_from(manifest.buf, 0)
+        HEADER.pack_into(manifest.buf, 0, refs + delta, length)
+        return refs + delta
+
+    def _attach(self, key: str) -> Optional[SharedEntry]:
+        """기존 블록에 붙어 DataFrame 뷰 생성 (잠금 안에서 호출)"""
+        try:
+            manifest = self._open(self.block_name(key, 'm'))
+        except FileNotFoundError:
+            return None
+
+        _, length = HEADER.unpack_from(manifest.buf, 0)
+        meta = json.loads(bytes(manifest.buf[HEADER.size:HEADER.size + length]).decode('utf-8'))
+        dates = self._open(self.block_name(key, 'd'))
+        values = self._open(self.block_name(key, 'v'))
+        self._add_refs(manifest, 1)
+
+        n_rows, n_cols = meta['shape']
+        index = np.ndarray((n_rows,), dtype='datetime64[ns]', buffer=dates.buf)
+        matrix = np.ndarray((n_rows, n_cols), dtype=np.float64, buffer=values.buf)
+        matrix.flags.writeable = False
+
+        frame = pd.DataFrame(matrix, index=pd.DatetimeIndex(index), columns=meta['columns'], copy=False)
+        return SharedEntry({'m': manifest, 'd': dates, 'v': values}, frame)
+
+    def _create(self, key: str, df: pd.DataFrame) -> SharedEntry:
+        """새 블록 생성 및 데이터 복사 (잠금 안에서 호출)"""
+        values = df.to_numpy(dtype=np.float64)
+        dates = df.index.to_numpy(dtype='datetime64[ns]')
+        meta = json.dumps({'columns': list(df.columns), 'shape': list(values.shape)},
+                          ensure_ascii=False).encode('utf-8')
+
+        blocks = {
+            'd': self._open(self.block_name(key, 'd'), dates.nbytes),
+            'v': self._open(self.block_name(key, 'v'), values.nbytes),
+            'm': self._open(self.block_name(key, 'm'), HEADER.size + len(meta)),
+        }
+        np.ndarray(dates.shape, dtype=dates.dtype, buffer=blocks['d'].buf)[:] = dates
+        np.ndarray(values.shape, dtype=np.float64, buffer=blocks['v'].buf)[:] = values
+        blocks['m'].buf[HEADER.size:HEADER.size + len(meta)] = meta
+        HEADER.pack_into(blocks['m'].buf, 0, 0, len(meta))
+
+        for block in blocks.values():
+            block.close()
+        return self._attach(key)
+
+    def _remember(self, key: str, entry: SharedEntry) -> None:
+        """워커별 LRU에 추가 (넘치면 오래된 데이터셋 참조 반납)"""
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            old_key, old_entry = self._entries.popitem(last=False)
+            self._release(old_key, old_entry)
+
+    def _release(self, key: str, entry: SharedEntry) -> None:
+        """참조 반납 (마지막 참조면 블록 삭제, 잠금 안에서 호출)"""
+        refs = self._add_refs(entry.blocks['m'], -1)
+        entry.frame = None
+        for part, block in entry.blocks.items():
+            try:
+                block.close()
+            except BufferError:
+                # 아직 DataFrame 뷰를 쓰는 곳이 있으면 매핑은 GC 때 해제
+                pass
+            if refs <= 0:
+                try:
+                    # unlink가 resource_tracker 등록 해제를 다시 하므로 짝을 맞춤
+                    resource_tracker.register(block._name, 'shared_memory')
+                    block.unlink()
+                except FileNotFoundError:
+                    pass
+        logger.debug("shared dataset released: %s refs=%d", key, refs)
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        공유 데이터셋 조회 (다른 워커가 저장한 블록에도 복사 없이 붙음)
+
+        Args:
+            key: 데이터셋 키
+
+        Returns:
+            읽기 전용 DataFrame 뷰 (없으면 None)
+        """
+        with self._locked():
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry.frame
+
+            entry = self._attach(key)
+            if entry is None:
+                return None
+            self._remember(key, entry)
+            return entry.frame
+
+    def put(self, key: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        데이터셋 저장 (이미 있으면 기존 블록에 붙음)
+
+        Args:
+            key: 데이터셋 키
+            df: 데이터 DataFrame (인덱스: 날짜)
+
+        Returns:
+            공유 메모리 DataFrame 뷰
+        """
+        with self._locked():
+            entry = self._entries.get(key) or self._attach(key) or self._create(key, df)
+            self._remember(key, entry)
+            return entry.frame
+
+    def release_all(self) -> None:
+        """이 워커의 모든 참조 반납 (프로세스 종료 시)"""
+        with self._locked():
+            while self._entries:
+                key, entry = self._entries.popitem(last=False)
+                self._release(key, entry)
+
+
+_registry: Optional[SharedDatasetRegistry] = None
+_registry_pid: Optional[int] = None
+
+
+def get_dataset_registry() -> Optional[SharedDatasetRegistry]:
+    """
+    현재 프로세스의 공유 데이터셋 저장소 (fork 후 워커마다 새로 생성)
+
+    Returns:
+        SharedDatasetRegistry (비활성화되었거나 지원하지 않는 플랫폼이면 None)
+    """
+    global _registry, _registry_pid
+    if not SHARED_DATASET_CONFIG['enabled'] or fcntl is None:
+        return None
+
+    if _registry is None or _registry_pid != os.getpid():
+        _registry = SharedDatasetRegistry(
+            SHARED_DATASET_CONFIG['prefix'],
+            SHARED_DATASET_CONFIG['max_entries'],
+            SHARED_DATASET_CONFIG['lock_path']
+        )
+        _registry_pid = os.getpid()
+        atexit.register(_registry.release_all)
+    return _registry
+
+
+def load_dataset_frame(dataset: dict) -> pd.DataFrame:
+    """
+    data-store 데이터의 DataFrame (공유 메모리에 있으면 복사 없이 사용)
+
+    반환된 DataFrame은 읽기 전용일 수 있으므로 값을 바꿀 때는 복사한다.
+    데이터셋 키는 항목 순서와 무관하므로 공유 블록은 먼저 저장한 순서일 수 있고,
+    컬럼은 항상 데이터셋 항목 순서(dataset_items)로 맞춰 반환한다.
+
+    Args:
+        dataset: frame_to_dataset 형식의 딕셔너리
+
+    Returns:
+        DataFrame (인덱스: 날짜, 컬럼: 각 항목)
+    """
+    registry = get_dataset_registry()
+    key = dataset.get('key')
+    if registry is None or not key:
+        return dataset_to_frame(dataset)
+
+    try:
+        df = registry.get(key)
+        if df is None:
+            df = registry.put(key, dataset_to_frame(dataset))
+    except OSError as e:
+        # 공유 메모리 부족 등은 프로세스 내 변환으로 대체
+        logger.warning("shared dataset unavailable (%s), using local copy", e)
+        return dataset_to_frame(dataset)
+
+    columns = dataset_items(dataset)
+    if list(df.columns) != columns:
+        df = df[columns]
+    return df
+
+
+def share_frame(key: str, df: pd.DataFrame) -> None:
+    """
+    조회한 데이터셋을 공유 메모리에 미리 저장 (다른 워커의 첫 콜백도 바로 사용)
+
+    Args:
+        key: 데이터셋 키
+        df: 데이터 DataFrame
+    """
+    registry = get_dataset_registry()
+    if registry is None or not key:
+        return
+    try:
+        registry.put(key, df)
+    except OSError as e:
+        logger.warning("shared dataset store failed (%s)", e)
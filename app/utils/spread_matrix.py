@@ -0,0 +1,138 @@
+"""
+전체 항목 쌍 스프레드 계산 유틸리티 함수
+
+로드된 N개 항목의 모든 쌍(i < j) 스프레드를 (날짜 × 쌍) 배열 연산으로 한 번에
+계산하고, 쌍별 현재값/Z-점수/백분위 순위/변화량을 구한다.
+메모리 사용량을 제한하기 위해 쌍을 묶음 단위로 나누어 계산한다.
+"""
+
+import json
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+from app.utils.stats_utils import forward_valid_rows, horizon_changes
+from config import SPREAD_SCREENER_CONFIG, STAT_HORIZONS
+
+
+def pair_spreads(values: np.ndarray, first: np.ndarray, second: np.ndarray, operation: str) -> np.ndarray:
+    """
+    항목 쌍들의 스프레드 배열 계산
+
+    Args:
+        values: (행: 날짜, 열: 항목) 값 배열
+        first: 쌍별 기준 항목 열 위치
+        second: 쌍별 비교 항목 열 위치
+        operation: 'subtract' 또는 'divide'
+
+    Returns:
+        (날짜, 쌍) 스프레드 배열 (0으로 나눈 값은 NaN)
+    """
+    if operation == 'subtract':
+        return values[:, first] - values[:, second]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        spreads = values[:, first] / values[:, second]
+    return np.where(np.isfinite(spreads), spreads, np.nan)
+
+
+def spread_summary(spreads: np.ndarray, dates: np.ndarray, horizon: str) -> Dict[str, np.ndarray]:
+    """
+    쌍별 스프레드 요약 (현재값, 평균, 표준편차, Z-점수, 백분위 순위, 변화량)
+
+    Args:
+        spreads: (날짜, 쌍) 스프레드 배열
+        dates: 날짜 배열
+        horizon: 변화량 이름 (STAT_HORIZONS 키)
+
+    Returns:
+        통계 이름별 쌍 배열 딕셔너리
+    """
+    valid = ~np.isnan(spreads)
+    counts = valid.sum(axis=0)
+    has_data = counts > 0
+    cols = np.arange(spreads.shape[1])
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(valid, spreads, 0.0).sum(axis=0) / counts
+        deviation = np.where(valid, spreads - mean, 0.0)
+        std = np.sqrt((deviation ** 2).sum(axis=0) / (counts - 1))
+    std = np.where(counts > 1, std, np.nan)
+
+    prev_valid = forward_valid_rows(valid)
+    last_rows = np.maximum(prev_valid[-1], 0)
+    current = np.where(has_data, spreads[last_rows, cols], np.nan)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        zscore = np.where(std > 0, (current - mean) / std, np.nan)
+        pct_rank = np.where(has_data, (spreads <= current).sum(axis=0) / counts * 100, np.nan)
+
+    change = horizon_changes(spreads, dates, prev_valid, current, last_rows,
+                             {horizon: STAT_HORIZONS[horizon]})[horizon]
+
+    return {
+        'current': current,
+        'mean': mean,
+        'std': std,
+        'zscore': zscore,
+        'pct_rank': pct_rank,
+        'change': np.where(has_data, change, 0.0),
+    }
+
+
+def screen_spreads(df: pd.DataFrame, operation: str) -> pd.DataFrame:
+    """
+    전체 항목 쌍 스프레드 스크리닝
+
+    Args:
+        df: 데이터 DataFrame (인덱스: 날짜, 컬럼: 항목)
+        operation: 'subtract' 또는 'divide'
+
+    Returns:
+        쌍별 통계 DataFrame (item1, item2, current, mean, std, zscore, pct_rank, change),
+        |Z-점수| 내림차순 정렬
+    """
+    columns = list(df.columns)
+    values = df.to_numpy(dtype=float)
+    dates = df.index.to_numpy()
+    first, second = np.triu_indices(len(columns), k=1)
+
+    # 묶음당 (날짜 × 쌍) 원소 수 제한
+    chunk = max(SPREAD_SCREENER_CONFIG['chunk_elements'] // max(len(values), 1), 1)
+    parts = []
+    for start in range(0, len(first), chunk):
+        pair_slice = slice(start, start + chunk)
+        spreads = pair_spreads(values, first[pair_slice], second[pair_slice], operation)
+        parts.append(spread_summary(spreads, dates, SPREAD_SCREENER_CONFIG['change_horizon']))
+
+    names = np.array(columns, dtype=object)
+    result = pd.DataFrame({
+        'item1': names[first],
+        'item2': names[second],
+        **{key: np.concatenate([part[key] for part in parts]) if parts else np.array([])
+           for key in ('current', 'mean', 'std', 'zscore', 'pct_rank', 'change')}
+    })
+
+    order = np.argsort(-np.nan_to_num(np.abs(result['zscore'].to_numpy()), nan=-1.0), kind='stable')
+    return result.iloc[order].reset_index(drop=True)
+
+
+def screener_records(result: pd.DataFrame, operation: str) -> List[dict]:
+    """
+    스크리너 결과를 DataTable 행 목록으로 변환
+
+    행 id에 항목 쌍을 JSON으로 담아 클릭 시 별도 조회 없이 항목을 알 수 있게 한다.
+
+    Args:
+        result: screen_spreads 결과
+        operation: 'subtract' 또는 'divide'
+
+    Returns:
+        DataTable data 리스트
+    """
+    symbol = '-' if operation == 'subtract' else '/'
+    rounded = result.round(SPREAD_SCREENER_CONFIG['decimals'])
+    records = rounded.to_dict('records')
+    for row in records:
+        row['id'] = json.dumps([row['item1'], row['item2']], ensure_ascii=False)
+        row['label'] = f"{row['item1']} {symbol} {row['item2']}"
+    return records
@@ -0,0 +1,41 @@
+"""
+통계 계산 유틸리티 함수
+
+커널은 데이터 계층과 함께 쓰도록 src.stats_utils에 있으며 여기서 다시 내보낸다.
+"""
+
+from src.stats_utils import (
+    SUMMARY_FIELDS,
+    STAT_FIELDS,
+    HORIZON_PATTERN,
+    ROWS_PER_UNIT,
+    parse_horizon,
+    shift_months,
+    horizon_targets,
+    horizon_rows,
+    forward_valid_rows,
+    horizon_changes,
+    quantile_from_sorted,
+    summarize_columns,
+    box_statistics,
+    summary_to_records,
+    summarize_frame
+)
+
+__all__ = [
+    'SUMMARY_FIELDS',
+    'STAT_FIELDS',
+    'HORIZON_PATTERN',
+    'ROWS_PER_UNIT',
+    'parse_horizon',
+    'shift_months',
+    'horizon_targets',
+    'horizon_rows',
+    'forward_valid_rows',
+    'horizon_changes',
+    'quantile_from_sorted',
+    'summarize_columns',
+    'box_statistics',
+    'summary_to_records',
+    'summarize_frame'
+]
@@ -0,0 +1,78 @@
+/*
+ * 클라이언트 사이드 콜백 (서버 왕복이 필요 없는 순수 UI 상호작용)
+ *
+ * 카테고리 이름 목록과 기간 버튼 설정은 레이아웃의 dcc.Store에 한 번만 포함되며,
+ * 아래 함수들은 브라우저에서 바로 계산하여 Flask 워커를 점유하지 않는다.
+ * (항목 목록은 카탈로그가 커서 서버 검색 콜백으로 상위 k개만 받는다.)
+ */
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    ui: {
+        /*
+         * 기간 빠른 선택: 시작일과 버튼 상태(outline/color) 계산
+         *
+         * 인자: 버튼별 n_clicks(PERIOD_BUTTONS 수만큼), 시작일, 종료일, 기간 버튼 설정.
+         * 버튼 수는 설정에 따라 달라지므로 마지막 State(기간 버튼 설정)만 뒤에서 꺼낸다.
+         */
+        update_period: function(...args) {
+            const periods = args[args.length - 1];
+            const ctx = window.dash_clientside.callback_context;
+            const noUpdate = window.dash_clientside.no_update;
+            if (!ctx.triggered || ctx.triggered.length === 0) {
+                return noUpdate;
+            }
+
+            const buttonId = ctx.triggered[0].prop_id.split('.')[0];
+            const count = periods.length;
+            const outlines = new Array(count).fill(true);
+            const colors = new Array(count).fill('secondary');
+
+            // 날짜가 수동으로 변경된 경우 모든 버튼 비활성화
+            if (buttonId === 'start-date') {
+                return [noUpdate, ...outlines, ...colors];
+            }
+
+            let newStartDate = null;
+            for (let idx = 0; idx < count; idx++) {
+                if (buttonId === periods[idx].id) {
+                    const date = new Date();
+                    date.setDate(date.getDate() - periods[idx].days);
+                    newStartDate = formatDate(date);
+                    outlines[idx] = false;
+                    colors[idx] = 'primary';
+                    break;
+                }
+            }
+
+            return [newStartDate, ...outlines, ...colors];
+        },
+
+        /*
+         * 데이터 타입에 따른 카테고리 옵션 목록
+         */
+        update_category_dropdown: function(dataType, categories) {
+            return selectCategories(dataType, categories).map(
+                cat => ({label: cat, value: cat})
+            );
+        }
+    }
+});
+
+function selectCategories(dataType, categories) {
+    if (!categories) {
+        return [];
+    }
+    if (dataType === 'interest_rate') {
+        return categories['금리'] || [];
+    }
+    if (dataType === 'exchange_rate') {
+        return categories['환율'] || [];
+    }
+    return Array.from(new Set([...(categories['금리'] || []), ...(categories['환율'] || [])]));
+}
+
+function formatDate(date) {
+    const month = String(date.getMonth() + 1).padStart(2, '0');
+    const day = String(date.getDate()).padStart(2, '0');
+    return `${date.getFullYear()}-${month}-${day}`;
+}
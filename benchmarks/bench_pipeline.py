@@ -0,0 +1,335 @@
+"""
+데이터 → 통계 → Figure 파이프라인 벤치마크
+
+시드 고정 Mock 데이터로 조회 기간(1Y/5Y/10Y/30Y) × 항목 수(2/20/200) 조합마다
+각 단계의 실행 시간(반복 중 최솟값)과 최대 메모리(tracemalloc)를 측정한다.
+차트는 콜백이 쓰는 딕셔너리 빌더(build_*)로 기준선과 비교하고, graph_objects 검증
+빌더(create_*, VALIDATE_FIGURES)는 참고용으로만 측정한다.
+
+사용법:
+    python benchmarks/bench_pipeline.py                  # 측정 후 기준선과 비교 (회귀 시 종료 코드 1)
+    python benchmarks/bench_pipeline.py --save           # 측정 결과를 기준선으로 저장
+    python benchmarks/bench_pipeline.py --ranges 1Y,5Y --series 2,20 --repeat 5
+
+기준선은 측정한 머신에 종속되므로 같은 환경에서 저장/비교한다.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.api_client import MockAPIClient
+from app.callbacks.data_callbacks import fetch_data
+from app.components.charts import (
+    create_timeseries_chart,
+    create_spread_chart,
+    build_timeseries_figure,
+    build_spread_figure
+)
+from app.components.tables import create_statistics_table
+from app.utils.catalog import CatalogIndex
+from app.utils.chart_utils import should_use_secondary_axis
+from app.utils.data_utils import (
+    normalize_data,
+    calculate_spread,
+    calculate_spread_statistics,
+    frame_to_dataset
+)
+
+# 조회 기간 (이름: 년 수), 항목 수
+RANGES = {'1Y': 1, '5Y': 5, '10Y': 10, '30Y': 30}
+SERIES_COUNTS = [2, 20, 200]
+
+# 조회 종료일 (결과가 실행 날짜에 따라 달라지지 않도록 고정)
+END_DATE = '2024-12-31'
+SEED = 42
+
+# 회귀 판정: 기준선 대비 threshold 비율 이상 느리고, 차이가 min_seconds 이상일 때
+DEFAULT_THRESHOLD = 0.25
+MIN_SECONDS = 0.005
+MIN_BYTES = 256 * 1024
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+STAGES = [
+    'load_data',
+    'normalize_data',
+    'calculate_spread',
+    'calculate_spread_statistics',
+    'should_use_secondary_axis',
+    'build_timeseries_figure',
+    'build_spread_figure',
+    'create_statistics_table',
+    'create_timeseries_chart',
+    'create_spread_chart',
+]
+
+# graph_objects 검증 빌더 (운영 콜백은 사용하지 않으므로 합계/회귀 판정에서 제외)
+VALIDATION_STAGES = ('create_timeseries_chart', 'create_spread_chart')
+
+
+def bench_items(n_series: int) -> List[str]:
+    """
+    벤치마크 항목 (Mock 카탈로그 항목을 먼저 쓰고, 부족하면 합성 항목 추가)
+
+    Args:
+        n_series: 항목 수
+
+    Returns:
+        항목 리스트 (금리/환율 섞임)
+    """
+    categories = MockAPIClient().get_categories()
+    # 금리/환율을 번갈아 선택하여 보조 축 판단에 두 스케일이 모두 포함되도록
+    rates = [item for cat_items in categories['금리'].values() for item in cat_items]
+    fx = [item for cat_items in categories['환율'].values() for item in cat_items]
+    mixed = [item for pair in zip(rates, fx) for item in pair]
+    items = mixed[:n_series]
+    items += [f'BENCH_{idx:03d}' for idx in range(n_series - len(items))]
+    return items
+
+
+def bench_catalog(items: List[str]) -> CatalogIndex:
+    """Mock 카탈로그 + 합성 항목 카테고리 ('벤치마크', 금리로 분류)"""
+    categories = MockAPIClient().get_categories()
+    synthetic = [item for item in items if item.startswith('BENCH_')]
+    if synthetic:
+        categories['금리'] = dict(categories['금리'], 벤치마크=synthetic)
+    return CatalogIndex(categories)
+
+
+def pipeline_stages(client, catalog: CatalogIndex, items: List[str],
+                    start_date: str, end_date: str) -> List[Tuple[str, Callable[[dict], None]]]:
+    """
+    단계별 실행 함수 (앞 단계 결과는 state 딕셔너리로 전달)
+
+    Args:
+        client: Mock API 클라이언트
+        catalog: 항목 카탈로그
+        items: 조회 항목
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+
+    Returns:
+        [(단계 이름, 함수(state)), ...]
+    """
+    def load_data(state):
+        # load_data 콜백과 같은 경로: 분류 → 조회/통계 → 병합 → data-store 형식
+        np.random.seed(SEED)
+        df, stats = fetch_data(client, catalog, 'all', items, start_date, end_date)
+        state['dataset'] = frame_to_dataset(df, start_date, end_date)
+        state['df'], state['stats'] = df, stats
+
+    def normalize(state):
+        state['normalized'] = normalize_data(state['df'])
+
+    def spread(state):
+        state['spread'] = calculate_spread(state['df'], items[0], items[1], 'subtract')
+
+    def spread_statistics(state):
+        state['spread_stats'] = calculate_spread_statistics(state['spread'][0])
+
+    def secondary_axis(state):
+        state['secondary'] = should_use_secondary_axis(state['df'])
+
+    def timeseries_figure(state):
+        state['timeseries'] = build_timeseries_figure(state['df'])
+
+    def spread_figure(state):
+        state['spread_chart'] = build_spread_figure(*state['spread'])
+
+    def statistics_table(state):
+        state['table'] = create_statistics_table(state['stats'])
+
+    def timeseries_chart(state):
+        state['timeseries_go'] = create_timeseries_chart(state['df'])
+
+    def spread_chart(state):
+        state['spread_chart_go'] = create_spread_chart(*state['spread'])
+
+    funcs = [load_data, normalize, spread, spread_statistics, secondary_axis,
+             timeseries_figure, spread_figure, statistics_table,
+             timeseries_chart, spread_chart]
+    return list(zip(STAGES, funcs))
+
+
+def run_case(years: int, n_series: int, repeat: int) -> Dict[str, dict]:
+    """
+    한 조합의 단계별 시간(반복 중 최솟값)과 최대 메모리 측정
+
+    Args:
+        years: 조회 기간 (년)
+        n_series: 항목 수
+        repeat: 시간 측정 반복 횟수
+
+    Returns:
+        {단계: {'seconds': 초, 'peak_bytes': 바이트}}
+    """
+    end = pd.Timestamp(END_DATE)
+    start_date = (end - pd.DateOffset(years=years)).strftime('%Y-%m-%d')
+    items = bench_items(n_series)
+    stages = pipeline_stages(MockAPIClient(), bench_catalog(items), items, start_date, END_DATE)
+
+    seconds = {name: float('inf') for name in STAGES}
+    for _ in range(repeat):
+        state = {}
+        for name, func in stages:
+            gc.collect()
+            start = time.perf_counter()
+            func(state)
+            seconds[name] = min(seconds[name], time.perf_counter() - start)
+
+    # 메모리는 별도 실행 (tracemalloc이 시간 측정을 느리게 하므로)
+    peaks = {}
+    state = {}
+    tracemalloc.start()
+    try:
+        for name, func in stages:
+            gc.collect()
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            func(state)
+            peaks[name] = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+    return {name: {'seconds': seconds[name], 'peak_bytes': peaks[name]} for name in STAGES}
+
+
+def run_matrix(ranges: List[str], series_counts: List[int], repeat: int,
+               log: Optional[Callable[[str], None]] = print) -> dict:
+    """
+    조회 기간 × 항목 수 조합 전체 측정
+
+    Args:
+        ranges: 조회 기간 이름 (RANGES 키)
+        series_counts: 항목 수 목록
+        repeat: 시간 측정 반복 횟수
+        log: 진행 출력 함수 (None이면 출력 안 함)
+
+    Returns:
+        {'meta': {...}, 'results': {'1Y/2': {단계: {'seconds', 'peak_bytes'}}}}
+    """
+    # 첫 실행의 import/골격 캐시 생성 비용이 첫 조합에 섞이지 않도록 한 번 버림
+    run_case(RANGES['1Y'], 2, 1)
+
+    results = {}
+    for range_name in ranges:
+        for n_series in series_counts:
+            case = f'{range_name}/{n_series}'
+            results[case] = run_case(RANGES[range_name], n_series, repeat)
+            if log:
+                total = sum(stage['seconds'] for name, stage in results[case].items()
+                            if name not in VALIDATION_STAGES)
+                log(f'{case:>8}: {total * 1000:9.1f} ms')
+
+    return {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+            'repeat': repeat,
+        },
+        'results': results
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    기준선 대비 회귀 항목
+
+    시간은 (1 + threshold)배 이상이면서 MIN_SECONDS 이상 느려졌을 때,
+    메모리는 (1 + threshold)배 이상이면서 MIN_BYTES 이상 늘었을 때 회귀로 본다.
+    검증 빌더 단계(VALIDATION_STAGES)는 비교하지 않는다.
+
+    Args:
+        current: run_matrix 결과
+        baseline: 저장된 기준선 (run_matrix 결과 형식)
+        threshold: 허용 증가 비율
+
+    Returns:
+        회귀 설명 문자열 리스트 (없으면 빈 리스트)
+    """
+    regressions = []
+    for case, stages in current['results'].items():
+        for name, measured in stages.items():
+            base = baseline.get('results', {}).get(case, {}).get(name)
+            if base is None or name in VALIDATION_STAGES:
+                continue
+            for metric, floor, unit, scale in (('seconds', MIN_SECONDS, 'ms', 1000),
+                                               ('peak_bytes', MIN_BYTES, 'KB', 1 / 1024)):
+                now, before = measured[metric], base[metric]
+                if now > before * (1 + threshold) and now - before >= floor:
+                    regressions.append(
+                        f'{case} {name} {metric}: {before * scale:.1f} -> {now * scale:.1f} {unit} '
+                        f'(+{(now / before - 1) * 100 if before else float("inf"):.0f}%)')
+    return regressions
+
+
+def format_report(current: dict) -> str:
+    """단계별 시간(ms)/최대 메모리(KB) 표"""
+    lines = [f"{'case':>8} {'stage':<28} {'ms':>10} {'peak KB':>10}"]
+    for case, stages in current['results'].items():
+        for name, measured in stages.items():
+            lines.append(f"{case:>8} {name:<28} {measured['seconds'] * 1000:10.2f} "
+                         f"{measured['peak_bytes'] / 1024:10.1f}")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='data → stats → figure pipeline benchmark')
+    parser.add_argument('--ranges', default=','.join(RANGES), help='조회 기간 (예: 1Y,5Y)')
+    parser.add_argument('--series', default=','.join(map(str, SERIES_COUNTS)), help='항목 수 (예: 2,20)')
+    parser.add_argument('--repeat', type=int, default=3, help='시간 측정 반복 횟수')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='기준선 JSON 경로')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='허용 증가 비율')
+    parser.add_argument('--save', action='store_true', help='결과를 기준선으로 저장')
+    args = parser.parse_args(argv)
+
+    ranges = [name.strip() for name in args.ranges.split(',') if name.strip()]
+    series_counts = [int(count) for count in args.series.split(',') if count.strip()]
+    unknown = [name for name in ranges if name not in RANGES]
+    if unknown:
+        parser.error(f'unknown ranges: {unknown} (choose from {list(RANGES)})')
+
+    current = run_matrix(ranges, series_counts, args.repeat)
+    print(format_report(current))
+
+    if args.save:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f'\nbaseline saved: {args.baseline}')
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f'\nno baseline at {args.baseline} (run with --save first)')
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(current, baseline, args.threshold)
+    if regressions:
+        print(f'\n✗ {len(regressions)} regression(s) beyond {args.threshold:.0%}:')
+        for line in regressions:
+            print(f'  {line}')
+        return 1
+
+    print(f'\n✓ no regressions beyond {args.threshold:.0%}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
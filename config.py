@@ -2,15 +2,101 @@
 애플리케이션 설정 및 상수
 """
 
+import os
+import tempfile
 from datetime import datetime, timedelta
 
-# 애플리케이션 설정
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """환경 변수 참/거짓 값 ('1', 'true', 'yes', 'on'이면 참)"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# 애플리케이션 설정 (디버그 모드는 DASH_DEBUG=1일 때만)
 APP_CONFIG = {
     'title': '금리/환율 데이터 분석 대시보드',
     'subtitle': 'Oracle DB 기반 시계열 데이터 분석 및 시각화',
-    'host': '0.0.0.0',
-    'port': 8050,
-    'debug': True
+    'host': os.environ.get('DASH_HOST', '0.0.0.0'),
+    'port': int(os.environ.get('DASH_PORT', 8050)),
+    'debug': env_flag('DASH_DEBUG')
+}
+
+# API 클라이언트 설정 (DASH_API_URL이 없으면 Mock 클라이언트 사용)
+API_CONFIG = {
+    'base_url': os.environ.get('DASH_API_URL', '')
+}
+
+# 운영 서버 설정 (gunicorn.conf.py에서 사용)
+# workers: 프로세스 수 (기본: CPU 코어 수 × 2 + 1)
+# threads: 프로세스당 스레드 수 (I/O 대기 중 다른 요청 처리)
+# preload: 워커 fork 전에 앱을 한 번 생성하여 읽기 전용 메모리 공유
+SERVER_CONFIG = {
+    'workers': int(os.environ.get('DASH_WORKERS', (os.cpu_count() or 1) * 2 + 1)),
+    'threads': int(os.environ.get('DASH_THREADS', 4)),
+    'timeout': int(os.environ.get('DASH_TIMEOUT', 120)),
+    'preload': env_flag('DASH_PRELOAD', True)
+}
+
+# API 응답 캐시 설정 (메모리 LRU + SQLite 디스크)
+# memory_bytes / disk_bytes: 계층별 최대 크기 (컬럼 지향 블롭 바이트)
+# current_ttl: 오늘을 포함하는 조회의 만료 시간 (초, 당일 값이 갱신될 수 있음)
+# historical_ttl: 오늘 이전에 끝나는 조회의 만료 시간 (None: 만료 없음)
+# warm_bytes: 시작 시 디스크에서 메모리로 미리 올릴 최대 크기
+RESPONSE_CACHE_CONFIG = {
+    'enabled': env_flag('DASH_RESPONSE_CACHE', True),
+    'path': os.environ.get('DASH_CACHE_PATH',
+                           os.path.join(tempfile.gettempdir(), 'dashplot_responses.sqlite')),
+    'memory_bytes': 128 * 1024 * 1024,
+    'disk_bytes': 1024 * 1024 * 1024,
+    'current_ttl': 300,
+    'historical_ttl': None,
+    'warm_bytes': 32 * 1024 * 1024
+}
+
+# 콜백 성능 지표 설정 (Prometheus 텍스트 형식, 꺼져 있으면 계측 없음)
+# latency_buckets: 시간 히스토그램 버킷 (초), size_buckets: 페이로드 크기 버킷 (바이트)
+# multiprocess_dir: 워커별 스냅샷 폴더 (/metrics가 살아 있는 워커를 합산, 서버마다 따로 지정)
+# flush_interval: 기록 후 스냅샷 저장 간격 (초)
+METRICS_CONFIG = {
+    'enabled': env_flag('DASH_METRICS'),
+    'path': '/metrics',
+    'latency_buckets': (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    'size_buckets': tuple(1024 * 4 ** power for power in range(9)),
+    'multiprocess_dir': os.environ.get('DASH_METRICS_DIR',
+                                       os.path.join(tempfile.gettempdir(), 'dashplot_metrics')),
+    'flush_interval': 1.0
+}
+
+# 콜백 프로파일링 설정 (cProfile, 꺼져 있으면 훅 없음)
+# enabled: callbacks(비우면 전체) 콜백을 항상 프로파일, 최근 max_age초 중 가장 느린 slowest_size개 보관
+# allow_header: header가 있는 요청은 콜백과 관계없이 프로파일하고 저장 (최근 requested_size개 보관)
+# output_dir: .prof(프로파일) + .json(요청 본문, 재현용) 저장 폴더
+PROFILING_CONFIG = {
+    'enabled': env_flag('DASH_PROFILE'),
+    'allow_header': env_flag('DASH_PROFILE_HEADER'),
+    'header': 'X-Dash-Profile',
+    'callbacks': [name.strip() for name in os.environ.get('DASH_PROFILE_CALLBACKS', '').split(',')
+                  if name.strip()],
+    'output_dir': os.environ.get('DASH_PROFILE_DIR',
+                                 os.path.join(tempfile.gettempdir(), 'dashplot_profiles')),
+    'slowest_size': 20,
+    'requested_size': 20,
+    'max_age': 3600,
+    'path': '/_profiles'
+}
+
+# 워커 간 공유 메모리 데이터셋 설정
+# enabled: 데이터셋을 shared_memory 블록에 한 번만 저장하고 워커마다 복사 없이 사용
+# max_entries: 워커별로 붙여 둘 최대 데이터셋 수 (넘치면 오래된 것부터 참조 반납)
+# lock_path: 참조 수 갱신용 워커 간 잠금 파일
+SHARED_DATASET_CONFIG = {
+    'enabled': env_flag('DASH_SHARED_DATASETS', True),
+    'prefix': 'dashplot_',
+    'max_entries': 8,
+    'lock_path': os.path.join(tempfile.gettempdir(), 'dashplot_datasets.lock')
 }
 
 # 데이터 타입 옵션
@@ -26,6 +112,12 @@ SPREAD_OPERATIONS = [
     {'label': '비율 (A / B)', 'value': 'divide'},
 ]
 
+# 스프레드 수식 설정 (예: 2*KR_5Y - KR_3Y - KR_10Y)
+SPREAD_EXPRESSION_CONFIG = {
+    'max_length': 200,
+    'cache_size': 128
+}
+
 # 기간 선택 버튼
 PERIOD_BUTTONS = [
     {'id': 'period-1y', 'label': '1Y', 'days': 365},
@@ -39,23 +131,56 @@ DEFAULT_START_DATE = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
 DEFAULT_END_DATE = datetime.now().strftime('%Y-%m-%d')
 
 # 차트 설정
+# - max_points_per_trace: 라인 트레이스당 최대 포인트 수 (초과 시 다운샘플링)
+# - webgl_threshold: 예상 렌더링 포인트(트레이스 × 포인트)가 이 값을 넘으면 Scattergl 사용
+# - render_budget: 차트 전체 포인트 상한 (초과 시 트레이스당 예산을 더 줄임)
+# - histogram_bins: 히스토그램 구간 수 또는 np.histogram_bin_edges 규칙 이름 ('auto', 'fd' 등)
 CHART_CONFIG = {
     'timeseries': {
         'height': 500,
         'template': 'plotly_white',
         'hovermode': 'x unified',
         'column_widths': [0.85, 0.15],
-        'horizontal_spacing': 0.02
+        'horizontal_spacing': 0.02,
+        'max_points_per_trace': 2000,
+        'webgl_threshold': 20000,
+        'render_budget': 100000,
+        'histogram_bins': 50,
+        'indicator_panel': 0.25,
+        'indicator_gap': 0.06
     },
     'spread': {
         'height': 400,
         'template': 'plotly_white',
         'hovermode': 'x unified',
         'column_widths': [0.85, 0.15],
-        'horizontal_spacing': 0.02
+        'horizontal_spacing': 0.02,
+        'max_points_per_trace': 2000,
+        'webgl_threshold': 20000,
+        'render_budget': 100000,
+        'histogram_bins': 50
     }
 }
 
+# 렌더링 예산 축소 시 트레이스당 최소 포인트 수
+MIN_POINTS_PER_TRACE = 100
+
+# Figure 캐시 설정 (추정 직렬화 크기 기준 LRU)
+FIGURE_CACHE_CONFIG = {
+    'max_bytes': 64 * 1024 * 1024
+}
+
+# Figure 빌더 선택 (True면 트레이스마다 검증하는 graph_objects 빌더 사용, 디버그용)
+VALIDATE_FIGURES = False
+
+# Figure 배열 인코딩 설정
+# typed_arrays: 'auto'면 번들된 plotly.js 버전(2.28 이상)으로 판단, True/False로 강제 가능
+# json_decimals: typed array를 쓰지 않을 때 JSON 숫자의 소수 자릿수
+FIGURE_ENCODING_CONFIG = {
+    'typed_arrays': 'auto',
+    'json_decimals': 6
+}
+
 # 차트 색상
 CHART_COLORS = {
     'primary': '#1f77b4',
@@ -64,9 +189,117 @@ CHART_COLORS = {
     'mean_line': 'red'
 }
 
+# 확대 구간 통계 인덱스 설정
+# block_size: 분위수/백분위 순위 조회용 정렬 블록 크기
+# max_entries: 프로세스별로 유지할 인덱스 수 (데이터셋/스프레드별 LRU)
+RANGE_INDEX_CONFIG = {
+    'block_size': 64,
+    'max_entries': 16
+}
+
+# 스프레드 스크리너 설정 (전체 항목 쌍)
+# chunk_elements: 한 번에 계산할 (날짜 × 쌍) 원소 수 (메모리 제한)
+# change_horizon: 변화량 컬럼으로 사용할 STAT_HORIZONS 항목
+SPREAD_SCREENER_CONFIG = {
+    'chunk_elements': 2_000_000,
+    'change_horizon': 'change_1m',
+    'decimals': 4,
+    'page_size': 10
+}
+
+# 롤링 지표 설정 (관측치 개수 기준 창)
+# max_overlay_series: 오버레이를 그릴 최대 항목 수 (앞에서부터)
+ROLLING_CONFIG = {
+    'ma_windows': [20, 60],
+    'bollinger_window': 20,
+    'bollinger_std': 2.0,
+    'channel_window': 20,
+    'volatility_window': 20,
+    'rsi_period': 14,
+    'max_overlay_series': 5
+}
+
+# 시계열 차트 오버레이 옵션
+OVERLAY_OPTIONS = [
+    {'label': ' 이동평균', 'value': 'ma'},
+    {'label': ' 볼린저 밴드', 'value': 'bollinger'},
+    {'label': ' 고저 채널', 'value': 'channel'},
+    {'label': ' 변동성', 'value': 'volatility'},
+    {'label': ' RSI', 'value': 'rsi'},
+]
+
+# 롤링 지표 한글명
+ROLLING_INDICATOR_NAMES = {
+    **{f'ma{window}': f'MA{window}' for window in ROLLING_CONFIG['ma_windows']},
+    'bb_upper': 'BB 상단',
+    'bb_lower': 'BB 하단',
+    'channel_high': '채널 고가',
+    'channel_low': '채널 저가',
+    'volatility': '변동성',
+    'rsi': 'RSI',
+}
+
+# 상관관계 설정
+# min_periods: 쌍별 최소 관측치 수 (부족하면 NaN)
+# rolling_window: 롤링 상관계수 기본 창 크기 (관측치 수)
+# cell_height: 히트맵 항목당 높이 (px, min_height~max_height 범위)
+CORRELATION_CONFIG = {
+    'min_periods': 20,
+    'rolling_window': 60,
+    'decimals': 3,
+    'colorscale': 'RdBu',
+    'cell_height': 18,
+    'min_height': 450,
+    'max_height': 1400,
+    'rolling_height': 300,
+    'template': 'plotly_white'
+}
+
+# 상관계수 계산 대상
+CORRELATION_METHODS = [
+    {'label': ' 수준', 'value': 'level'},
+    {'label': ' 일간 변화', 'value': 'change'},
+]
+
+# 박스플롯 설정 (일간 변화량 분포)
+# whisker_iqr: 수염 범위 (IQR 배수, 벗어나면 이상치)
+# max_outliers: 항목별로 표시할 최대 이상치 수 (중앙값에서 먼 순)
+BOX_CONFIG = {
+    'whisker_iqr': 1.5,
+    'max_outliers': 200,
+    'height': 400
+}
+
+# 통계 테이블 설정
+# virtualize_rows: 행 수가 이 값을 넘으면 가상 스크롤(보이는 행만 렌더링)
+STATS_TABLE_CONFIG = {
+    'decimals': 4,
+    'virtualize_rows': 30,
+    'max_height': '480px'
+}
+
+# 항목 카탈로그 검색 설정
+# max_options: 항목 드롭다운에 보낼 최대 옵션 수 (검색 결과 상위 k개)
+# min_trigram_overlap: 부분 문자열이 아닐 때 유사 항목으로 볼 3-gram 겹침 비율
+CATALOG_CONFIG = {
+    'max_options': 50,
+    'min_trigram_overlap': 0.5
+}
+
 # 스케일 차이 임계값 (보조 축 사용 여부 결정)
 SCALE_DIFF_THRESHOLD = 5
 
+# 통계 변화량 기간 (항목명: 기간)
+# 'nD' 달력일, 'nB' 영업일, 'nW' 주, 'nM' 개월, 'nY' 년, 'YTD' 연초 대비(전년 마지막 값)
+# 각 항목의 마지막 유효 날짜 기준으로 해당 시점 이전의 마지막 값과 비교
+STAT_HORIZONS = {
+    'change_1d': '1B',
+    'change_1w': '1W',
+    'change_1m': '1M',
+    'change_3m': '3M',
+    'change_ytd': 'YTD',
+}
+
 # 통계 컬럼 한글명
 STATS_COLUMN_NAMES = {
     'current': '현재값',
@@ -77,10 +310,12 @@ STATS_COLUMN_NAMES = {
     'median': '중앙값',
     'q25': '25% 분위',
     'q75': '75% 분위',
+    'pct_rank': '백분위 순위',
     'change_1d': '1일 변화',
     'change_1w': '1주 변화',
     'change_1m': '1개월 변화',
     'change_3m': '3개월 변화',
+    'change_ytd': '연초 대비',
 }
 
 # 스프레드 통계 키 목록
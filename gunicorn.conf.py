@@ -0,0 +1,30 @@
+"""
+gunicorn 설정 (멀티 프로세스 운영 서버)
+
+    gunicorn -c gunicorn.conf.py wsgi:server
+
+워커/스레드 수 등은 환경 변수로 조정한다 (config.SERVER_CONFIG 참고).
+"""
+
+from config import APP_CONFIG, SERVER_CONFIG
+
+bind = f"{APP_CONFIG['host']}:{APP_CONFIG['port']}"
+
+# 프로세스당 여러 스레드로 I/O 대기(API 조회) 중에도 다른 요청 처리
+worker_class = 'gthread'
+workers = SERVER_CONFIG['workers']
+threads = SERVER_CONFIG['threads']
+timeout = SERVER_CONFIG['timeout']
+
+# fork 전에 앱(카탈로그 인덱스, 레이아웃)을 한 번만 생성
+preload_app = SERVER_CONFIG['preload']
+
+
+def post_fork(server, worker):
+    """preload 시 마스터의 HTTP 세션(커넥션 풀)과 캐시 연결을 워커마다 새로 생성"""
+    from app.factory import reset_after_fork
+    reset_after_fork()
+
+
+accesslog = '-'
+errorlog = '-'
@@ -4,20 +4,60 @@ FastAPI 서버 클라이언트
 
 import requests
 import pandas as pd
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 from datetime import datetime
+from urllib.parse import urlencode
+from src.response_cache import split_at_today
+from src.stats_utils import summarize_frame
 
 
 class APIClient:
     """FastAPI 서버와 통신하는 클라이언트"""
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", cache=None):
         """
         Args:
             base_url: FastAPI 서버 URL
+            cache: 응답 캐시 (src.response_cache.ResponseCache, 없으면 캐시 안 함)
         """
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
+        self.cache = cache
+
+    def reset_after_fork(self) -> None:
+        """
+        fork된 워커에서 부모와 공유하던 연결 교체
+
+        preload 시 마스터에서 카테고리를 조회한 세션의 커넥션 풀(소켓)을
+        워커들이 함께 쓰지 않도록 새 세션을 만들고 응답 캐시도 초기화한다.
+        """
+        self.session = requests.Session()
+        if self.cache is not None:
+            self.cache.reset_after_fork()
+
+    def _cache_key(self, endpoint: str, params: Optional[Dict] = None) -> str:
+        """엔드포인트와 조회 조건으로 캐시 키 생성 (서버별로 구분)"""
+        query = urlencode(sorted((params or {}).items()))
+        return f"{self.base_url}/api/{endpoint}?{query}"
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (캐시가 없으면 None)"""
+        if self.cache is None:
+            return None
+        return self.cache.get(key)
+
+    def _cache_put(self, key: str, value: Any, end_date: Optional[str] = None) -> None:
+        """
+        성공한 응답 캐시 저장 (빈 응답은 저장하지 않음)
+
+        Args:
+            key: 캐시 키
+            value: DataFrame 또는 딕셔너리
+            end_date: 조회 종료 날짜 (지난 구간이면 만료 없음, 오늘 포함이면 짧게)
+        """
+        if self.cache is None or len(value) == 0:
+            return
+        self.cache.put(key, value, self.cache.ttl_for(end_date))
 
     def get_categories(self) -> Dict:
         """
@@ -29,12 +69,18 @@ class APIClient:
                 "환율": {"주요통화": [...], ...}
             }
         """
+        key = self._cache_key('categories')
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
             response = self.session.get(f"{self.base_url}/api/categories")
             response.raise_for_status()
 
             result = response.json()
             if result['status'] == 'success':
+                self._cache_put(key, result['data'])
                 return result['data']
             else:
                 print(f"API Error: {result.get('message', 'Unknown error')}")
@@ -59,30 +105,8 @@ class APIClient:
         Returns:
             DataFrame (인덱스: 날짜, 컬럼: 각 금리 항목)
         """
-        try:
-            params = {
-                'items': ','.join(items),
-                'start_date': start_date,
-                'end_date': end_date
-            }
-
-            response = self.session.get(
-                f"{self.base_url}/api/interest-rates",
-                params=params
-            )
-            response.raise_for_status()
-
-            result = response.json()
-
-            if result['status'] == 'success':
-                return self._parse_timeseries_response(result['data'])
-            else:
-                print(f"API Error: {result.get('message', 'Unknown error')}")
-                return pd.DataFrame()
-
-        except requests.RequestException as e:
-            print(f"Request error: {e}")
-            return pd.DataFrame()
+        return self._get_timeseries('interest-rates', {'items': ','.join(items)},
+                                    start_date, end_date)
 
     def get_exchange_rates(self,
                           pairs: List[str],
@@ -99,30 +123,8 @@ class APIClient:
         Returns:
             DataFrame
         """
-        try:
-            params = {
-                'pairs': ','.join(pairs),
-                'start_date': start_date,
-                'end_date': end_date
-            }
-
-            response = self.session.get(
-                f"{self.base_url}/api/exchange-rates",
-                params=params
-            )
-            response.raise_for_status()
-
-            result = response.json()
-
-            if result['status'] == 'success':
-                return self._parse_timeseries_response(result['data'])
-            else:
-                print(f"API Error: {result.get('message', 'Unknown error')}")
-                return pd.DataFrame()
-
-        except requests.RequestException as e:
-            print(f"Request error: {e}")
-            return pd.DataFrame()
+        return self._get_timeseries('exchange-rates', {'pairs': ','.join(pairs)},
+                                    start_date, end_date)
 
     def get_statistics(self,
                       data_type: str,
@@ -149,6 +151,11 @@ class APIClient:
                 'end_date': end_date
             }
 
+            key = self._cache_key('statistics', params)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
             response = self.session.get(
                 f"{self.base_url}/api/statistics",
                 params=params
@@ -158,6 +165,7 @@ class APIClient:
             result = response.json()
 
             if result['status'] == 'success':
+                self._cache_put(key, result['data'], end_date)
                 return result['data']
             else:
                 print(f"API Error: {result.get('message', 'Unknown error')}")
@@ -167,6 +175,70 @@ class APIClient:
             print(f"Request error: {e}")
             return {}
 
+    def _get_timeseries(self, endpoint: str, params: Dict,
+                        start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        시계열 조회 (캐시가 있으면 어제까지/오늘 이후 구간을 따로 캐시)
+
+        지난 구간은 만료 없이 저장하고, 오늘을 포함하는 짧은 구간만 current_ttl마다
+        다시 조회한 뒤 이어 붙인다.
+
+        Args:
+            endpoint: API 경로 (예: 'interest-rates')
+            params: 항목 조회 조건 (날짜 제외)
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+
+        Returns:
+            DataFrame (인덱스: 날짜, 컬럼: 각 항목)
+        """
+        if self.cache is None:
+            return self._fetch_timeseries(endpoint, {**params, 'start_date': start_date,
+                                                     'end_date': end_date})
+
+        frames = []
+        for seg_start, seg_end in split_at_today(start_date, end_date):
+            seg_params = {**params, 'start_date': seg_start, 'end_date': seg_end}
+            key = self._cache_key(endpoint, seg_params)
+            df = self._cache_get(key)
+            if df is None:
+                df = self._fetch_timeseries(endpoint, seg_params)
+                self._cache_put(key, df, seg_end)
+            frames.append(df)
+
+        frames = [df for df in frames if len(df)]
+        if len(frames) <= 1:
+            return frames[0] if frames else pd.DataFrame()
+        df = pd.concat(frames)
+        return df[~df.index.duplicated(keep='last')]
+
+    def _fetch_timeseries(self, endpoint: str, params: Dict) -> pd.DataFrame:
+        """
+        시계열 API 요청 (실패하면 빈 DataFrame)
+
+        Args:
+            endpoint: API 경로 (예: 'interest-rates')
+            params: 조회 조건
+
+        Returns:
+            DataFrame (인덱스: 날짜, 컬럼: 각 항목)
+        """
+        try:
+            response = self.session.get(f"{self.base_url}/api/{endpoint}", params=params)
+            response.raise_for_status()
+
+            result = response.json()
+
+            if result['status'] == 'success':
+                return self._parse_timeseries_response(result['data'])
+            else:
+                print(f"API Error: {result.get('message', 'Unknown error')}")
+                return pd.DataFrame()
+
+        except requests.RequestException as e:
+            print(f"Request error: {e}")
+            return pd.DataFrame()
+
     def _parse_timeseries_response(self, data: Dict) -> pd.DataFrame:
         """
         API 응답을 DataFrame으로 변환
@@ -203,8 +275,12 @@ class MockAPIClient(APIClient):
     """테스트용 Mock 클라이언트"""
 
     def __init__(self):
-        # 부모 클래스의 __init__ 호출하지 않음
+        # 부모 클래스의 __init__ 호출하지 않음 (랜덤 데이터이므로 캐시 없음)
         self.base_url = "mock://localhost"
+        self.cache = None
+
+    def reset_after_fork(self) -> None:
+        """Mock은 네트워크 연결이 없으므로 교체할 것 없음"""
 
     def get_categories(self) -> Dict:
         """Mock 카테고리 데이터"""
@@ -291,25 +367,10 @@ class MockAPIClient(APIClient):
         else:
             df = self.get_exchange_rates(items, start_date, end_date)
 
-        stats = {}
-        for col in df.columns:
-            data = df[col].dropna()
-
-            stats[col] = {
-                'current': float(data.iloc[-1]),
-                'mean': float(data.mean()),
-                'std': float(data.std()),
-                'min': float(data.min()),
-                'max': float(data.max()),
-                'median': float(data.median()),
-                'q25': float(data.quantile(0.25)),
-                'q75': float(data.quantile(0.75)),
-                'change_1d': float(data.iloc[-1] - data.iloc[-2]) if len(data) > 1 else 0,
-                'change_1w': float(data.iloc[-1] - data.iloc[-5]) if len(data) > 5 else 0,
-                'change_1m': float(data.iloc[-1] - data.iloc[-20]) if len(data) > 20 else 0,
-                'change_3m': float(data.iloc[-1] - data.iloc[-60]) if len(data) > 60 else 0,
-                'unit': '%' if data_type == 'interest_rate' else 'KRW'
-            }
+        unit = '%' if data_type == 'interest_rate' else 'KRW'
+        stats = summarize_frame(df)
+        for item_stats in stats.values():
+            item_stats['unit'] = unit
 
         return stats
 
@@ -9,6 +9,7 @@ from typing import List, Dict, Tuple, Optional
 import cx_Oracle
 from sqlalchemy import create_engine, text
 from db_config import DB_CONFIG, get_connection_string, CATEGORIES
+from src.stats_utils import summarize_columns, summary_to_records
 
 
 class OracleDataLoader:
@@ -192,28 +193,17 @@ class OracleDataLoader:
         Returns:
             {column: {stat_name: value}} 딕셔너리
         """
-        stats = {}
-
-        for col in df.columns:
-            data = df[col].dropna()
-
-            if len(data) == 0:
-                continue
-
-            stats[col] = {
-                'current': data.iloc[-1] if len(data) > 0 else np.nan,
-                'mean': data.mean(),
-                'std': data.std(),
-                'min': data.min(),
-                'max': data.max(),
-                'median': data.median(),
-                'q25': data.quantile(0.25),
-                'q75': data.quantile(0.75),
-                'change_1d': data.iloc[-1] - data.iloc[-2] if len(data) > 1 else 0,
-                'change_1w': data.iloc[-1] - data.iloc[-5] if len(data) > 5 else 0,
-                'change_1m': data.iloc[-1] - data.iloc[-20] if len(data) > 20 else 0,
-                'pct_change_1d': ((data.iloc[-1] - data.iloc[-2]) / data.iloc[-2] * 100) if len(data) > 1 and data.iloc[-2] != 0 else 0,
-            }
+        summary = summarize_columns(df.to_numpy(dtype=float), df.index.to_numpy())
+
+        # 전일 대비 변화율 (전일 값이 0이면 0)
+        previous = summary['current'] - summary['change_1d']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pct_change = summary['change_1d'] / previous * 100
+        summary['pct_change_1d'] = np.where((summary['count'] > 1) & (previous != 0), pct_change, 0.0)
+
+        fields = ('current', 'mean', 'std', 'min', 'max', 'median', 'q25', 'q75',
+                  'change_1d', 'change_1w', 'change_1m', 'pct_change_1d')
+        stats = summary_to_records(summary, list(df.columns), fields)
 
         return stats
 
@@ -0,0 +1,360 @@
+"""
+API 응답 캐시 (메모리 LRU + SQLite 디스크 2단계)
+
+APIClient 응답을 컬럼 지향 바이트 블롭(날짜 int64 + 항목별 float64 값)이나 JSON으로
+저장한다. 메모리 계층은 블롭 바이트 기준 LRU이고, 디스크 계층(SQLite)은 프로세스를
+재시작해도 남아 있어 시작 시 최근 항목을 메모리로 미리 올린다(warm-up).
+
+만료 시간은 조회 종료일로 정한다. 오늘 이전에 끝나는 구간은 값이 바뀌지 않으므로
+historical_ttl(None이면 만료 없음), 오늘을 포함하는 구간은 current_ttl로 짧게 둔다.
+기본 종료일이 오늘이므로 시계열 조회는 split_at_today로 어제까지의 구간과 오늘 이후
+구간을 나눠 저장하고, 만료되면 짧은 오늘 구간만 다시 조회한다.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import struct
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Callable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 프레임 블롭 헤더: JSON 메타데이터 길이
+FRAME_HEADER = struct.Struct('<q')
+
+
+def encode_frame(df: pd.DataFrame) -> bytes:
+    """
+    DataFrame을 컬럼 지향 바이트 블롭으로 변환
+
+    구성: 헤더(JSON 길이) + JSON {'columns', 'rows'} + 날짜 int64[rows] + 값 float64[columns × rows]
+
+    Args:
+        df: 데이터 DataFrame (인덱스: 날짜)
+
+    Returns:
+        바이트 블롭
+    """
+    meta = json.dumps({'columns': [str(col) for col in df.columns], 'rows': len(df)},
+                      ensure_ascii=False).encode('utf-8')
+    dates = pd.DatetimeIndex(df.index).asi8.astype('<i8')
+    values = np.ascontiguousarray(df.to_numpy(dtype=np.float64).T, dtype='<f8')
+    return FRAME_HEADER.pack(len(meta)) + meta + dates.tobytes() + values.tobytes()
+
+
+def decode_frame(blob: bytes) -> pd.DataFrame:
+    """
+    encode_frame 블롭을 DataFrame으로 복원
+
+    Args:
+        blob: 바이트 블롭
+
+    Returns:
+        DataFrame (인덱스: 날짜, 컬럼: 각 항목)
+    """
+    (length,) = FRAME_HEADER.unpack_from(blob, 0)
+    offset = FRAME_HEADER.size
+    meta = json.loads(blob[offset:offset + length].decode('utf-8'))
+    offset += length
+
+    rows, columns = meta['rows'], meta['columns']
+    dates = np.frombuffer(blob, dtype='<i8', count=rows, offset=offset)
+    offset += dates.nbytes
+    values = np.frombuffer(blob, dtype='<f8', count=rows * len(columns), offset=offset)
+    values = values.reshape(len(columns), rows)
+
+    index = pd.DatetimeIndex(dates.astype('datetime64[ns]'))
+    return pd.DataFrame({col: values[idx].copy() for idx, col in enumerate(columns)}, index=index)
+
+
+def entry_ttl(end_date: Optional[str], current_ttl: float, historical_ttl: Optional[float],
+              today: Optional[date] = None) -> Optional[float]:
+    """
+    조회 종료일 기준 만료 시간
+
+    Args:
+        end_date: 조회 종료 날짜 (YYYY-MM-DD, 없으면 오늘로 간주)
+        current_ttl: 오늘을 포함하는 구간의 만료 시간 (초)
+        historical_ttl: 지난 구간의 만료 시간 (초, None이면 만료 없음)
+        today: 기준 날짜 (기본: 오늘)
+
+    Returns:
+        만료 시간 (초) 또는 None
+    """
+    today = today or date.today()
+    if end_date and pd.Timestamp(end_date).date() < today:
+        return historical_ttl
+    return current_ttl
+
+
+def split_at_today(start_date: str, end_date: Optional[str],
+                   today: Optional[date] = None) -> List[Tuple[str, Optional[str]]]:
+    """
+    조회 구간을 지난 구간(어제까지)과 오늘을 포함하는 구간으로 분할
+
+    Args:
+        start_date: 시작 날짜 (YYYY-MM-DD)
+        end_date: 종료 날짜 (YYYY-MM-DD, 없으면 오늘 이후 전체)
+        today: 기준 날짜 (기본: 오늘)
+
+    Returns:
+        [(start_date, end_date), ...] (한쪽에만 속하면 원래 구간 하나)
+    """
+    today = today or date.today()
+    start = pd.Timestamp(start_date).date()
+    if start >= today or (end_date and pd.Timestamp(end_date).date() < today):
+        return [(start_date, end_date)]
+    return [(start_date, (today - timedelta(days=1)).isoformat()),
+            (today.isoformat(), end_date)]
+
+
+class ResponseCache:
+    """메모리 LRU + SQLite 디스크 2단계 응답 캐시"""
+
+    def __init__(self, path: str, memory_bytes: int, disk_bytes: int,
+                 current_ttl: float, historical_ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            path: SQLite 파일 경로
+            memory_bytes: 메모리 계층 최대 크기 (블롭 바이트)
+            disk_bytes: 디스크 계층 최대 크기 (블롭 바이트)
+            current_ttl: 오늘을 포함하는 응답의 만료 시간 (초)
+            historical_ttl: 지난 구간 응답의 만료 시간 (초, None이면 만료 없음)
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self.path = path
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.current_ttl = current_ttl
+        self.historical_ttl = historical_ttl
+        self.clock = clock
+        self._entries: 'OrderedDict[str, Tuple[str, bytes, Optional[float]]]' = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self.total_bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.warmed = 0
+
+    def _db(self) -> sqlite3.Connection:
+        """SQLite 연결 (fork 후 워커마다 새로 연결)"""
+        if self._conn is None or self._conn_pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, kind TEXT, blob BLOB, size INTEGER, '
+                'expires REAL, created REAL)'
+            )
+            self._conn, self._conn_pid = conn, os.getpid()
+        return self._conn
+
+    def reset_after_fork(self) -> None:
+        """
+        fork된 워커에서 마스터의 연결/잠금/통계 초기화
+
+        마스터가 warm-up한 메모리 항목은 그대로 두고, 상속된 SQLite 연결은 닫지 않고
+        버린다 (부모 프로세스의 연결이므로 자식에서 닫으면 안 됨).
+        """
+        self._lock = threading.RLock()
+        self._conn, self._conn_pid = None, None
+        self.memory_hits = self.disk_hits = self.misses = 0
+        self.evictions = self.expirations = 0
+
+    @staticmethod
+    def _encode(value: Any) -> Tuple[str, bytes]:
+        """값을 (종류, 블롭)으로 변환 ('frame': DataFrame, 'json': 딕셔너리 등)"""
+        if isinstance(value, pd.DataFrame):
+            return 'frame', encode_frame(value)
+        return 'json', json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+    @staticmethod
+    def _decode(kind: str, blob: bytes) -> Any:
+        """_encode 결과 복원 (조회할 때마다 새 객체)"""
+        if kind == 'frame':
+            return decode_frame(blob)
+        return json.loads(blob.decode('utf-8'))
+
+    def _remember(self, key: str, kind: str, blob: bytes, expires: Optional[float]) -> None:
+        """메모리 계층에 추가 (넘치면 오래된 항목 제거, 잠금 안에서 호출)"""
+        if len(blob) > self.memory_bytes:
+            return
+        if key in self._entries:
+            self.total_bytes -= len(self._entries.pop(key)[1])
+        self._entries[key] = (kind, blob, expires)
+        self.total_bytes += len(blob)
+
+        while self.total_bytes > self.memory_bytes:
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self.total_bytes -= len(evicted)
+            self.evictions += 1
+
+    def ttl_for(self, end_date: Optional[str]) -> Optional[float]:
+        """
+        조회 종료일 기준 만료 시간 (entry_ttl 참고)
+
+        Args:
+            end_date: 조회 종료 날짜 (없으면 오늘로 간주)
+
+        Returns:
+            만료 시간 (초) 또는 None
+        """
+        return entry_ttl(end_date, self.current_ttl, self.historical_ttl)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 조회 (메모리 → 디스크 순, 디스크에서 찾으면 메모리로 올림)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 (없거나 만료되면 None)
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[2] is None or entry[2] > now):
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                kind, blob, _ = entry
+            else:
+                if entry is not None:
+                    self.total_bytes -= len(self._entries.pop(key)[1])
+                    self.expirations += 1
+
+                try:
+                    row = self._db().execute(
+                        'SELECT kind, blob, expires FROM responses WHERE key = ?', (key,)).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning("response cache read failed: %s", e)
+                    row = None
+
+                if row is None or (row[2] is not None and row[2] <= now):
+                    self.misses += 1
+                    return None
+
+                kind, blob = row[0], bytes(row[1])
+                self._remember(key, kind, blob, row[2])
+                self.disk_hits += 1
+
+        # 복원은 잠금 밖에서 (큰 프레임 복원 중에도 다른 스레드 조회 가능)
+        return self._decode(kind, blob)
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        캐시 저장 (메모리와 디스크 모두)
+
+        Args:
+            key: 캐시 키
+            value: DataFrame 또는 JSON 직렬화 가능한 값
+            ttl: 만료 시간 (초, None이면 만료 없음)
+        """
+        now = self.clock()
+        expires = None if ttl is None else now + ttl
+        kind, blob = self._encode(value)
+
+        with self._lock:
+            self._remember(key, kind, blob, expires)
+            try:
+                with self._db() as conn:
+                    conn.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                                 (key, kind, blob, len(blob), expires, now))
+                    self._prune_disk(conn, now)
+            except sqlite3.Error as e:
+                logger.warning("response cache write failed: %s", e)
+
+    def _prune_disk(self, conn: sqlite3.Connection, now: float) -> None:
+        """만료 항목 삭제 후 최대 크기를 넘으면 오래된 항목부터 삭제"""
+        conn.execute('DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?', (now,))
+        (total,) = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()
+        if total <= self.disk_bytes:
+            return
+
+        excess = total - self.disk_bytes
+        stale = []
+        for key, size in conn.execute('SELECT key, size FROM responses ORDER BY created'):
+            if excess <= 0:
+                break
+            stale.append((key,))
+            excess -= size
+        conn.executemany('DELETE FROM responses WHERE key = ?', stale)
+
+    def warm(self, max_bytes: int) -> int:
+        """
+        디스크의 최근 항목을 메모리로 미리 로드 (시작 시 호출)
+
+        Args:
+            max_bytes: 로드할 최대 크기 (블롭 바이트)
+
+        Returns:
+            로드한 항목 수
+        """
+        now = self.clock()
+        budget = min(max_bytes, self.memory_bytes)
+        loaded, used = 0, 0
+        with self._lock:
+            try:
+                conn = self._db()
+                # 크기만 먼저 훑어 예산 안의 키를 고르고, 블롭은 고른 키만 읽음
+                selected = []
+                for key, size in conn.execute(
+                        'SELECT key, size FROM responses '
+                        'WHERE expires IS NULL OR expires > ? ORDER BY created DESC', (now,)):
+                    if used + size > budget:
+                        break
+                    selected.append(key)
+                    used += size
+
+                rows = [(key,) + conn.execute(
+                            'SELECT kind, blob, expires FROM responses WHERE key = ?', (key,)).fetchone()
+                        for key in selected]
+            except sqlite3.Error as e:
+                logger.warning("response cache warm-up failed: %s", e)
+                return 0
+
+            # 최근 항목이 LRU 끝에 오도록 오래된 것부터 추가
+            for key, kind, blob, expires in reversed(rows):
+                self._remember(key, kind, bytes(blob), expires)
+                loaded += 1
+
+            self.warmed += loaded
+        logger.info("response cache warmed: %d entries, %d bytes", loaded, used)
+        return loaded
+
+    def stats(self) -> dict:
+        """
+        캐시 통계
+
+        Returns:
+            {'entries', 'bytes', 'memory_hits', 'disk_hits', 'misses', 'evictions',
+             'expirations', 'warmed', 'hit_rate'} 딕셔너리
+        """
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'warmed': self.warmed,
+                'hit_rate': (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+            }
@@ -0,0 +1,352 @@
+"""
+통계 계산 유틸리티 함수
+
+모든 컬럼의 요약 통계를 2차원 배열 하나로 한 번에 계산하는 NumPy 커널.
+통계 테이블, 스프레드 통계, 보조 축 판단과 데이터 계층(MockAPIClient, OracleDataLoader)이
+같은 커널을 사용한다. 앱 쪽에서는 app.utils.stats_utils로 가져온다.
+"""
+
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from config import STAT_HORIZONS
+
+# 요약 통계 항목 순서
+SUMMARY_FIELDS = ('current', 'mean', 'std', 'min', 'max', 'median', 'q25', 'q75', 'pct_rank')
+
+# 통계 테이블 항목 순서 (요약 통계 + 변화량)
+STAT_FIELDS = SUMMARY_FIELDS + tuple(STAT_HORIZONS)
+
+HORIZON_PATTERN = re.compile(r'^(\d+)([DBWMY])$')
+
+# 날짜가 없을 때 단위별 관측치 수 (영업일 기준, YTD는 계산 불가)
+ROWS_PER_UNIT = {'D': 1, 'B': 1, 'W': 5, 'M': 21, 'Y': 252}
+
+
+@lru_cache(maxsize=None)
+def parse_horizon(spec: str) -> Tuple[int, str]:
+    """
+    변화량 기간 문자열 해석
+
+    Args:
+        spec: 'nD', 'nB', 'nW', 'nM', 'nY' 또는 'YTD'
+
+    Returns:
+        (n, 단위) 튜플 ('YTD'는 (0, 'YTD'))
+
+    Raises:
+        ValueError: 지원하지 않는 형식
+    """
+    spec = spec.strip().upper()
+    if spec == 'YTD':
+        return 0, 'YTD'
+
+    match = HORIZON_PATTERN.match(spec)
+    if not match:
+        raise ValueError(f"지원하지 않는 기간 형식: {spec}")
+    return int(match.group(1)), match.group(2)
+
+
+def shift_months(days: np.ndarray, months: int) -> np.ndarray:
+    """
+    날짜를 n개월 전으로 이동 (말일은 해당 월 말일로 조정)
+
+    Args:
+        days: datetime64[D] 배열
+        months: 이동할 개월 수
+
+    Returns:
+        datetime64[D] 배열
+    """
+    month_start = days.astype('datetime64[M]')
+    day_of_month = days - month_start.astype('datetime64[D]')
+    target_month = month_start - months
+    month_length = (target_month + 1).astype('datetime64[D]') - target_month.astype('datetime64[D]')
+    return target_month.astype('datetime64[D]') + np.minimum(day_of_month, month_length - 1)
+
+
+def horizon_targets(last_dates: np.ndarray, spec: str) -> np.ndarray:
+    """
+    기준일별 비교 시점 계산 (비교 시점 이전의 마지막 값과 비교)
+
+    Args:
+        last_dates: 항목별 기준일 (datetime64[D] 배열)
+        spec: 기간 문자열
+
+    Returns:
+        비교 시점 datetime64[D] 배열
+    """
+    n, unit = parse_horizon(spec)
+    if unit == 'D':
+        return last_dates - n
+    if unit == 'W':
+        return last_dates - 7 * n
+    if unit == 'B':
+        # 주말 기준일은 다음 영업일로 보고 n영업일 전 (토요일의 1영업일 전 = 금요일)
+        return np.busday_offset(last_dates, -n, roll='forward')
+    if unit == 'M':
+        return shift_months(last_dates, n)
+    if unit == 'Y':
+        return shift_months(last_dates, 12 * n)
+    # YTD: 전년도 마지막 날
+    return last_dates.astype('datetime64[Y]').astype('datetime64[D]') - 1
+
+
+def horizon_rows(last_rows: np.ndarray, spec: str) -> np.ndarray:
+    """
+    날짜가 없을 때의 기간 이전 행 위치 (ROWS_PER_UNIT 관측치 수 기준)
+
+    Args:
+        last_rows: 항목별 마지막 유효 행 위치
+        spec: 기간 문자열 (parse_horizon 형식)
+
+    Returns:
+        항목별 비교 행 위치 (없으면 음수)
+    """
+    n, unit = parse_horizon(spec)
+    if unit == 'YTD':
+        return np.full(len(last_rows), -1)
+    return last_rows - n * ROWS_PER_UNIT[unit]
+
+
+def forward_valid_rows(valid: np.ndarray) -> np.ndarray:
+    """
+    행별로 해당 행 이전(포함)의 마지막 유효 행 위치 계산
+
+    Args:
+        valid: (행, 열) 유효값 마스크
+
+    Returns:
+        (행, 열) 정수 배열 (유효값이 없으면 -1)
+    """
+    row_ids = np.where(valid, np.arange(len(valid))[:, None], -1)
+    return np.maximum.accumulate(row_ids, axis=0)
+
+
+def horizon_changes(values: np.ndarray,
+                    dates: np.ndarray,
+                    prev_valid: np.ndarray,
+                    current: np.ndarray,
+                    last_rows: np.ndarray,
+                    horizons: Dict[str, str]) -> Dict[str, np.ndarray]:
+    """
+    날짜 기준 변화량 계산 (모든 항목과 기간을 searchsorted 한 번으로 조회)
+
+    각 항목의 마지막 유효 날짜에서 기간만큼 이전 시점을 구하고,
+    그 시점 이전(포함)의 마지막 유효값과 비교한다. 휴일이 다른 항목도
+    각자의 마지막 날짜 기준으로 계산된다. 날짜가 datetime64가 아니면
+    (예: RangeIndex) 행 위치 기준(horizon_rows)으로 대체한다.
+
+    Args:
+        values: (행: 날짜, 열: 항목) 2차원 배열
+        dates: 정렬된 날짜 배열 (datetime64, 아니면 행 위치 기준)
+        prev_valid: 행별 직전(포함) 유효 행 위치 (forward_valid_rows 결과)
+        current: 항목별 마지막 유효값
+        last_rows: 항목별 마지막 유효 행 위치
+        horizons: {변화량 이름: 기간 문자열} 딕셔너리
+
+    Returns:
+        {변화량 이름: 항목별 변화량 배열} (비교 값이 없으면 0)
+    """
+    n_cols = values.shape[1]
+    cols = np.arange(n_cols)
+    names = list(horizons)
+    if np.issubdtype(dates.dtype, np.datetime64):
+        days = dates.astype('datetime64[D]')
+        last_dates = days[last_rows]
+        targets = np.concatenate([horizon_targets(last_dates, horizons[name]) for name in names])
+        positions = np.searchsorted(days, targets, side='right') - 1
+    else:
+        positions = np.concatenate([horizon_rows(last_rows, horizons[name]) for name in names])
+
+    tiled_cols = np.tile(cols, len(names))
+    rows = np.where(positions >= 0, prev_valid[np.maximum(positions, 0), tiled_cols], -1)
+    past = values[np.maximum(rows, 0), tiled_cols]
+    changes = np.where(rows >= 0, np.tile(current, len(names)) - past, 0.0).reshape(len(names), n_cols)
+
+    return OrderedDict(zip(names, changes))
+
+
+def quantile_from_sorted(sorted_values: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+    """
+    정렬된 컬럼에서 분위수 계산 (선형 보간, pandas quantile과 동일)
+
+    Args:
+        sorted_values: 컬럼별로 정렬된 2차원 배열 (NaN은 뒤쪽)
+        counts: 컬럼별 유효값 개수
+        q: 분위 (0~1)
+
+    Returns:
+        컬럼별 분위수 배열 (유효값이 없으면 NaN)
+    """
+    pos = q * np.maximum(counts - 1, 0)
+    lower = np.floor(pos).astype(np.intp)
+    upper = np.minimum(lower + 1, np.maximum(counts - 1, 0))
+    cols = np.arange(sorted_values.shape[1])
+
+    low_val = sorted_values[lower, cols]
+    high_val = sorted_values[upper, cols]
+    result = low_val + (high_val - low_val) * (pos - lower)
+    return np.where(counts > 0, result, np.nan)
+
+
+def summarize_columns(values: np.ndarray,
+                      dates: Optional[np.ndarray] = None,
+                      horizons: Optional[Dict[str, str]] = None) -> Dict[str, np.ndarray]:
+    """
+    2차원 배열의 컬럼별 요약 통계를 한 번에 계산 (NaN 무시)
+
+    정렬된 배열에서 최소/최대/분위수를 꺼내고, 날짜가 주어지면 변화량을
+    searchsorted로 조회하므로 컬럼 수와 무관하게 벡터 연산 몇 번으로 끝난다.
+
+    Args:
+        values: (행: 날짜, 열: 항목) 2차원 배열
+        dates: 정렬된 날짜 배열 (없으면 변화량 생략)
+        horizons: {변화량 이름: 기간 문자열} 딕셔너리 (기본: STAT_HORIZONS)
+
+    Returns:
+        {'count', 'current', 'mean', 'std', 'min', 'max', 'median', 'q25', 'q75',
+         'pct_rank', 변화량 이름...} 컬럼별 배열 딕셔너리
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    if len(values) == 0:
+        values = np.full((1, values.shape[1]), np.nan)
+    cols = np.arange(values.shape[1])
+
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    has_data = counts > 0
+
+    # 평균/표준편차 (표본 표준편차, ddof=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(valid, values, 0.0).sum(axis=0) / counts
+        deviation = np.where(valid, values - mean, 0.0)
+        std = np.sqrt((deviation ** 2).sum(axis=0) / (counts - 1))
+    std = np.where(counts > 1, std, np.nan)
+
+    # 최소/최대/분위수 (NaN은 정렬 시 뒤로 감)
+    sorted_values = np.sort(values, axis=0)
+    last_valid = np.maximum(counts - 1, 0)
+
+    summary = {
+        'count': counts,
+        'mean': np.where(has_data, mean, np.nan),
+        'std': std,
+        'min': np.where(has_data, sorted_values[0], np.nan),
+        'max': np.where(has_data, sorted_values[last_valid, cols], np.nan),
+        'median': quantile_from_sorted(sorted_values, counts, 0.5),
+        'q25': quantile_from_sorted(sorted_values, counts, 0.25),
+        'q75': quantile_from_sorted(sorted_values, counts, 0.75),
+    }
+
+    # 항목별 마지막 유효 행 (현재값)
+    prev_valid = forward_valid_rows(valid)
+    last_rows = np.maximum(prev_valid[-1], 0)
+    current = values[last_rows, cols]
+    summary['current'] = np.where(has_data, current, np.nan)
+
+    # 현재값의 백분위 순위 (현재값 이하인 값의 비율)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        summary['pct_rank'] = np.where(has_data, (values <= current).sum(axis=0) / counts * 100, np.nan)
+
+    if dates is not None:
+        horizons = STAT_HORIZONS if horizons is None else horizons
+        if len(dates) == len(values):
+            changes = horizon_changes(values, np.asarray(dates), prev_valid, current, last_rows, horizons)
+        else:
+            changes = {name: np.zeros(len(cols)) for name in horizons}
+        for name, change in changes.items():
+            summary[name] = np.where(has_data, change, 0.0)
+
+    return summary
+
+
+def box_statistics(values: np.ndarray, whisker_iqr: float = 1.5) -> Dict[str, np.ndarray]:
+    """
+    컬럼별 박스플롯 요약 (사분위수, 수염 끝, 이상치 마스크)
+
+    수염은 Tukey 방식으로 [q1 - k·IQR, q3 + k·IQR] 안의 가장 먼 관측치까지이며,
+    범위를 벗어난 값은 이상치로 표시한다.
+
+    Args:
+        values: (행: 날짜, 열: 항목) 2차원 배열
+        whisker_iqr: 수염 범위 배수 k
+
+    Returns:
+        {'count', 'q1', 'median', 'q3', 'mean', 'lowerfence', 'upperfence'} 컬럼별 배열과
+        'outliers' (values와 같은 모양의 이상치 마스크) 딕셔너리
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    sorted_values = np.sort(values, axis=0)
+
+    q1 = quantile_from_sorted(sorted_values, counts, 0.25)
+    q3 = quantile_from_sorted(sorted_values, counts, 0.75)
+    iqr = q3 - q1
+    low_limit = q1 - whisker_iqr * iqr
+    high_limit = q3 + whisker_iqr * iqr
+
+    with np.errstate(invalid='ignore'):
+        inside = valid & (values >= low_limit) & (values <= high_limit)
+        outliers = valid & ~inside
+        mean = np.where(valid, values, 0.0).sum(axis=0) / np.maximum(counts, 1)
+
+    has_data = counts > 0
+    return {
+        'count': counts,
+        'q1': q1,
+        'median': quantile_from_sorted(sorted_values, counts, 0.5),
+        'q3': q3,
+        'mean': np.where(has_data, mean, np.nan),
+        'lowerfence': np.where(has_data, np.where(inside, values, np.inf).min(axis=0), np.nan),
+        'upperfence': np.where(has_data, np.where(inside, values, -np.inf).max(axis=0), np.nan),
+        'outliers': outliers,
+    }
+
+
+def summary_to_records(summary: Dict[str, np.ndarray],
+                       columns: List[str],
+                       fields: Tuple[str, ...] = STAT_FIELDS) -> Dict[str, OrderedDict]:
+    """
+    요약 통계 배열을 항목별 통계 딕셔너리로 변환
+
+    유효값이 없는 항목은 제외한다.
+
+    Args:
+        summary: summarize_columns 결과
+        columns: 컬럼 이름 리스트
+        fields: 포함할 통계 항목 (순서 유지)
+
+    Returns:
+        {항목: {통계명: 값}} 딕셔너리
+    """
+    table = np.column_stack([summary[field] for field in fields]).tolist()
+    return OrderedDict(
+        (col, OrderedDict(zip(fields, row)))
+        for col, row, count in zip(columns, table, summary['count'])
+        if count > 0
+    )
+
+
+def summarize_frame(df: pd.DataFrame, fields: Tuple[str, ...] = STAT_FIELDS) -> Dict[str, OrderedDict]:
+    """
+    DataFrame 전체 컬럼의 통계 딕셔너리 계산
+
+    Args:
+        df: 데이터 DataFrame
+        fields: 포함할 통계 항목
+
+    Returns:
+        {항목: {통계명: 값}} 딕셔너리
+    """
+    summary = summarize_columns(df.to_numpy(dtype=float), df.index.to_numpy())
+    return summary_to_records(summary, list(df.columns), fields)
@@ -0,0 +1,255 @@
+"""
+차트 컴포넌트 테스트
+"""
+
+import sys
+import os
+import json
+import pandas as pd
+import numpy as np
+import plotly.io as pio
+from plotly.utils import PlotlyJSONEncoder
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.components.charts import (
+    create_timeseries_chart,
+    create_spread_chart,
+    build_timeseries_figure,
+    build_spread_figure,
+    build_box_figure,
+    get_figure_skeleton
+)
+from app.components.tables import create_statistics_table, create_spread_statistics_table
+from app.utils.figure_encoding import encode_traces, decode_typed_array
+from app.utils.rolling import compute_rolling, overlay_indicators
+
+
+def make_frame(columns: dict, periods: int = 100) -> pd.DataFrame:
+    """테스트용 랜덤 워크 DataFrame 생성"""
+    rng = np.random.default_rng(0)
+    index = pd.date_range('2024-01-01', periods=periods, freq='D')
+    return pd.DataFrame({
+        col: base + np.cumsum(rng.standard_normal(periods) * base * 0.01)
+        for col, base in columns.items()
+    }, index=index)
+
+
+def test_figure_skeleton_cached():
+    """레이아웃 골격 캐시 테스트"""
+    print("Testing get_figure_skeleton...")
+
+    skeleton = get_figure_skeleton('single')
+    assert get_figure_skeleton('single') is skeleton, "Skeleton should be built once"
+
+    df = make_frame({'US_10Y': 4.0, 'KR_10Y': 3.5})
+    fig = create_timeseries_chart(df, x_range=('2024-02-01', '2024-03-01'))
+    assert fig.layout.yaxis.title.text == "값"
+    assert list(fig.layout.xaxis.range) == ['2024-02-01', '2024-03-01']
+
+    # 골격은 차트 생성 후에도 변하지 않아야 함
+    assert 'range' not in skeleton['xaxis'], "Skeleton should not be mutated"
+    assert skeleton['yaxis'].get('title', {}).get('text') is None
+
+    print("✓ get_figure_skeleton passed")
+
+
+def test_timeseries_secondary_axis():
+    """이중 축 트레이스 배치 테스트"""
+    print("Testing create_timeseries_chart secondary axis...")
+
+    df = make_frame({'USD/KRW': 1350.0, 'US_10Y': 4.0})
+    fig = create_timeseries_chart(df)
+
+    axes = [(trace.type, trace.xaxis, trace.yaxis) for trace in fig.data]
+    assert axes == [('scatter', 'x', 'y'), ('scatter', 'x', 'y3'),
+                    ('bar', 'x2', 'y2'), ('bar', 'x2', 'y2')], f"Unexpected axes: {axes}"
+    assert fig.layout.yaxis3.overlaying == 'y'
+
+    print("✓ create_timeseries_chart secondary axis passed")
+
+
+def test_indicator_panel():
+    """오버레이 지표 배치 테스트 (가격 축 지표는 메인 축, 변동성/RSI는 아래 패널)"""
+    print("Testing indicator panel...")
+
+    df = make_frame({'US_10Y': 4.0, 'KR_10Y': 3.5})
+    overlays = compute_rolling(df, overlay_indicators(['ma', 'volatility', 'rsi']))
+    fig = create_timeseries_chart(df, overlays=overlays)
+
+    axes = {trace.name: trace.yaxis for trace in fig.data if trace.type == 'scatter'}
+    assert axes['US_10Y MA20'] == 'y' and axes['US_10Y MA60'] == 'y', "MA labels follow ma_windows"
+    assert axes['US_10Y RSI'] == 'y4' and axes['US_10Y 변동성'] == 'y5'
+    assert fig.layout.xaxis.anchor == 'y4', "Date axis should sit under the panel"
+    assert fig.layout.yaxis4.domain[1] < fig.layout.yaxis.domain[0]
+    assert fig.layout.yaxis5.overlaying == 'y4'
+
+    # 빠른 빌더도 같은 레이아웃, 패널 지표가 없으면 패널 없음
+    fast = build_timeseries_figure(df, overlays=overlays)
+    assert fast['layout']['yaxis4']['domain'] == list(fig.layout.yaxis4.domain)
+    plain = build_timeseries_figure(df, overlays=compute_rolling(df, overlay_indicators(['ma'])))
+    assert 'yaxis4' not in plain['layout']
+
+    print("✓ indicator panel passed")
+
+
+def test_spread_chart_mean_line():
+    """스프레드 차트 평균선 테스트"""
+    print("Testing create_spread_chart...")
+
+    spread = make_frame({'A': 1.0})['A']
+    fig = create_spread_chart(spread, 'A - B', '차이')
+
+    assert fig.layout.yaxis.title.text == '차이'
+    assert abs(fig.layout.shapes[0].y0 - spread.mean()) < 1e-12
+    assert fig.layout.annotations[0].text == f"평균: {spread.mean():.4f}"
+
+    print("✓ create_spread_chart passed")
+
+
+def assert_same_figure(fig, fig_dict):
+    """graph_objects Figure와 딕셔너리 Figure의 직렬화 결과 비교"""
+    expected = json.loads(pio.to_json(fig))
+    actual = json.loads(json.dumps(fig_dict, cls=PlotlyJSONEncoder))
+    assert actual == expected, "Fast builder output differs from graph_objects builder"
+
+
+def test_fast_builder_equivalence():
+    """빠른 딕셔너리 빌더와 graph_objects 빌더 동등성 테스트"""
+    print("Testing build_timeseries_figure / build_spread_figure...")
+
+    single = make_frame({'US_10Y': 4.0, 'KR_10Y': 3.5, 'KR_3Y': 3.2})
+    dual = make_frame({'USD/KRW': 1350.0, 'US_10Y': 4.0})
+    large = make_frame({f'S{i}': 3.0 + i for i in range(12)}, periods=5000)
+    large.iloc[10:20, 0] = np.nan
+
+    for df, is_normalized in [(single, False), (single, True), (dual, False), (large, False)]:
+        assert_same_figure(
+            create_timeseries_chart(df, is_normalized),
+            build_timeseries_figure(df, is_normalized)
+        )
+
+    x_range = ('2024-02-01', '2024-03-01')
+    assert_same_figure(
+        create_timeseries_chart(single, x_range=x_range),
+        build_timeseries_figure(single, x_range=x_range)
+    )
+
+    spread = single['US_10Y'] - single['KR_10Y']
+    assert_same_figure(
+        create_spread_chart(spread, 'US_10Y - KR_10Y', '차이'),
+        build_spread_figure(spread, 'US_10Y - KR_10Y', '차이')
+    )
+
+    print("✓ fast builder equivalence passed")
+
+
+def test_typed_array_encoding():
+    """typed array 인코딩 및 날짜 x0/dx 압축 테스트"""
+    print("Testing encode_traces...")
+
+    index = pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-05'])
+    values = np.array([1.5, np.nan, 2.25])
+    traces = [('scatter', dict(x=index.to_numpy(), y=values)),
+              ('bar', dict(x=np.array([3, 0, 7]), y=values))]
+
+    (_, line), (_, bar) = encode_traces(traces, typed=True)
+    assert line['y']['dtype'] == 'f8'
+    np.testing.assert_array_equal(decode_typed_array(line['y']), values)
+    dates = decode_typed_array(line['x']).astype('datetime64[ms]')
+    np.testing.assert_array_equal(dates, index.to_numpy().astype('datetime64[ms]'))
+    assert bar['x']['dtype'] == 'i4'
+    assert list(decode_typed_array(bar['x'])) == [3, 0, 7]
+
+    # JSON 대체 경로: 날짜 문자열과 소수 자릿수 축소
+    (_, line), _ = encode_traces(traces, typed=False)
+    assert list(line['x']) == ['2024-01-01', '2024-01-02', '2024-01-05']
+    assert 'x0' not in line
+
+    # 간격이 일정한 날짜는 x0/dx로 압축
+    daily = pd.date_range('2024-01-01', periods=5, freq='D')
+    (_, line), = encode_traces([('scatter', dict(x=daily.to_numpy(), y=np.arange(5.0)))], typed=False)
+    assert 'x' not in line
+    assert line['x0'] == '2024-01-01' and line['dx'] == 86400000
+
+    print("✓ encode_traces passed")
+
+
+def test_box_figure_precomputed():
+    """사분위수를 서버에서 계산한 박스플롯 테스트"""
+    print("Testing build_box_figure...")
+
+    changes = make_frame({'USD/KRW': 1300.0, 'KR_3Y': 3.5}, periods=500).diff()
+    changes.iloc[10, 1] = 5.0  # 명확한 이상치
+
+    fig = build_box_figure(changes)
+    box, outliers = fig['data']
+    assert box['type'] == 'box' and 'y' not in box, "Raw values should not be sent"
+    assert box['x'] == ['USD/KRW', 'KR_3Y']
+
+    for idx, col in enumerate(changes.columns):
+        values = changes[col].dropna().to_numpy()
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        assert abs(box['q1'][idx] - q1) < 1e-6 and abs(box['q3'][idx] - q3) < 1e-6
+        assert abs(box['median'][idx] - median) < 1e-6
+        low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        inside = values[(values >= low) & (values <= high)]
+        assert abs(box['upperfence'][idx] - inside.max()) < 1e-6
+        n_outliers = int(((values < low) | (values > high)).sum())
+        assert outliers['x'].count(col) == n_outliers
+
+    assert '2024-01-11' in outliers['customdata']
+
+    # plotly 스키마 검증 통과
+    pio.from_json(json.dumps(fig, cls=PlotlyJSONEncoder))
+
+    print("✓ build_box_figure passed")
+
+
+def test_statistics_datatable():
+    """통계 DataTable 테스트 (컬럼 순서, 빈 값, 가상 스크롤)"""
+    print("Testing create_statistics_table...")
+
+    # 저장소 JSON처럼 키가 정렬된 통계
+    stats = {f"S{idx}": {'change_1d': 0.1, 'current': 1.23456, 'mean': 1.0,
+                         'std': float('nan'), 'unit': '%'} for idx in range(300)}
+    table = create_statistics_table(stats).children
+    assert [col['id'] for col in table.columns] == ['item', 'current', 'mean', 'std', 'change_1d']
+    assert table.data[0] == {'item': 'S0', 'current': 1.2346, 'mean': 1.0, 'std': None, 'change_1d': 0.1}
+    assert table.virtualization is True, "Large tables should be virtualized"
+    assert table.sort_action == 'native'
+
+    small = create_statistics_table(dict(list(stats.items())[:3])).children
+    assert not getattr(small, 'virtualization', False)
+
+    spread = create_spread_statistics_table({'mean': 0.5, 'current': 0.7}, spread_label='A - B').children
+    assert [col['id'] for col in spread.columns] == ['item', 'current', 'mean']
+    assert spread.data == [{'item': 'A - B', 'current': 0.7, 'mean': 0.5}]
+
+    print("✓ create_statistics_table passed")
+
+
+if __name__ == '__main__':
+    print("\n" + "="*50)
+    print("Running chart component tests...")
+    print("="*50 + "\n")
+
+    try:
+        test_figure_skeleton_cached()
+        test_timeseries_secondary_axis()
+        test_indicator_panel()
+        test_spread_chart_mean_line()
+        test_fast_builder_equivalence()
+        test_typed_array_encoding()
+        test_box_figure_precomputed()
+        test_statistics_datatable()
+
+        print("\n" + "="*50)
+        print("All tests passed! ✓")
+        print("="*50 + "\n")
+
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}\n")
+    except Exception as e:
+        print(f"\n✗ Error: {e}\n")
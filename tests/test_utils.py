@@ -6,6 +6,7 @@ import sys
 import os
 import pandas as pd
 import numpy as np
+import requests
 from datetime import datetime
 
 # Add parent directory to path
@@ -15,9 +16,37 @@ from app.utils.data_utils import (
     normalize_data,
     calculate_spread,
     calculate_spread_statistics,
-    classify_items_by_type
+    calculate_daily_changes,
+    classify_items_by_type,
+    frame_to_dataset,
+    order_items,
+    dataset_to_frame,
+    diff_selection
+)
+from app.utils.chart_utils import (
+    should_use_secondary_axis,
+    parse_relayout_range,
+    plan_rendering,
+    histogram_bin_edges,
+    compute_histogram
+)
+from app.utils.downsampling import minmax_indices, downsample_series
+from app.utils.figure_cache import FigureCache, estimate_serialized_size
+from app.utils.stats_utils import summarize_columns, summarize_frame, summary_to_records, SUMMARY_FIELDS
+from app.utils.range_index import RangeIndex, get_range_index
+from app.utils.spread_matrix import screen_spreads, screener_records
+from app.utils.expression import compile_expression, calculate_expression_spread
+from app.utils.rolling import compute_rolling, indicator_names, RollingState
+from app.utils.catalog import CatalogIndex
+from app.utils.shared_datasets import SharedDatasetRegistry, get_dataset_registry, load_dataset_frame
+from src.api_client import APIClient
+from src.response_cache import ResponseCache, encode_frame, entry_ttl, split_at_today
+from app.utils.metrics import MetricsRegistry, instrument_client
+from app.utils.profiling import ProfiledCall, RecentCalls, SlowestCalls, dump_call
+from benchmarks.bench_pipeline import compare as compare_benchmarks
+from app.utils.correlation import (
+    correlation_matrix, correlation_frame, rolling_correlation, RollingCorrelation
 )
-from app.utils.chart_utils import should_use_secondary_axis
 
 
 def test_normalize_data():
@@ -142,6 +171,829 @@ def test_should_use_secondary_axis():
     print("✓ should_use_secondary_axis passed")
 
 
+def test_dataset_roundtrip():
+    """데이터셋 변환 테스트"""
+    print("Testing frame_to_dataset / dataset_to_frame...")
+
+    df = pd.DataFrame({
+        'US_10Y': [4.0, np.nan, 4.2],
+        'USD/KRW': [1350.0, 1351.0, 1352.0]
+    }, index=pd.date_range('2024-01-01', periods=3, freq='D'))
+
+    dataset = frame_to_dataset(df, '2024-01-01', '2024-01-03')
+    assert dataset['dates'] == ['2024-01-01', '2024-01-02', '2024-01-03']
+    assert dataset['series']['US_10Y'][1] is None, "NaN should be serialized as None"
+
+    restored = dataset_to_frame(dataset)
+    pd.testing.assert_frame_equal(restored, df, check_freq=False)
+
+    # Patch로 추가한 항목은 series 끝에 붙지만 컬럼은 항목 선택 순서(items)를 따름
+    dataset['series']['KR_3Y'] = [3.0, 3.1, 3.2]
+    dataset['items'] = order_items(['US_10Y', 'USD/KRW', 'KR_3Y'], ['KR_3Y', 'US_10Y', 'USD/KRW'])
+    assert dataset['items'] == ['KR_3Y', 'US_10Y', 'USD/KRW']
+    assert list(dataset_to_frame(dataset).columns) == dataset['items']
+    assert order_items(['US_10Y', 'EXTRA', 'USD/KRW'], ['USD/KRW', 'US_10Y']) == \
+        ['USD/KRW', 'US_10Y', 'EXTRA'], "Unselected columns keep their place at the end"
+
+    print("✓ dataset roundtrip passed")
+
+
+def test_dataset_key():
+    """데이터셋 키 테스트"""
+    print("Testing dataset key...")
+
+    df = pd.DataFrame({
+        'US_10Y': [4.0, 4.1, 4.2],
+        'KR_10Y': [3.5, 3.6, 3.7]
+    }, index=pd.date_range('2024-01-01', periods=3, freq='D'))
+
+    key = frame_to_dataset(df, '2024-01-01', '2024-01-03')['key']
+    assert frame_to_dataset(df[['KR_10Y', 'US_10Y']], '2024-01-01', '2024-01-03')['key'] == key, \
+        "Key should not depend on column order"
+
+    changed = df.copy()
+    changed.iloc[-1, 0] = 4.3
+    assert frame_to_dataset(changed, '2024-01-01', '2024-01-03')['key'] != key, \
+        "Key should change with content"
+
+    print("✓ dataset key passed")
+
+
+def test_diff_selection():
+    """데이터셋 증분 비교 테스트"""
+    print("Testing diff_selection...")
+
+    dataset = {
+        'start_date': '2024-01-01',
+        'end_date': '2024-03-01',
+        'dates': [],
+        'series': {'US_10Y': [], 'KR_3Y': []}
+    }
+
+    added, removed = diff_selection(dataset, ['US_10Y', 'USD/KRW'], '2024-01-01', '2024-03-01')
+    assert added == ['USD/KRW'], f"Added should be ['USD/KRW'], got {added}"
+    assert removed == ['KR_3Y'], f"Removed should be ['KR_3Y'], got {removed}"
+
+    # 기간이 바뀌면 전체 재조회
+    assert diff_selection(dataset, ['US_10Y'], '2023-01-01', '2024-03-01') is None
+    assert diff_selection(None, ['US_10Y'], '2024-01-01', '2024-03-01') is None
+
+    print("✓ diff_selection passed")
+
+
+def test_downsample_series():
+    """다운샘플링 테스트"""
+    print("Testing downsample_series...")
+
+    values = np.sin(np.linspace(0, 20, 10000))
+    values[1234] = 5.0  # 급등 포인트
+    series = pd.Series(values, index=pd.date_range('2000-01-01', periods=10000, freq='D'))
+
+    indices = minmax_indices(values, 500)
+    assert len(indices) <= 500, f"Should keep at most 500 points, got {len(indices)}"
+    assert indices[0] == 0 and indices[-1] == 9999, "First and last points should be kept"
+    assert 1234 in indices, "Extreme point should be kept"
+
+    sampled = downsample_series(series, 500)
+    assert sampled.max() == 5.0, "Max should be preserved"
+    assert downsample_series(series, 20000) is series, "Small series should be returned as is"
+
+    # 결측 구간은 다운샘플링 여부와 관계없이 끊어서 그림 (gap marker 유지)
+    gapped = series.copy()
+    gapped.iloc[3000:3100] = np.nan
+    gapped.iloc[7000] = np.nan
+    sampled = downsample_series(gapped, 500)
+    assert len(sampled) <= 500
+    assert np.isnan(sampled.iloc[sampled.index.get_loc(gapped.index[3000])]), "Gap start marker kept"
+    assert sampled.isna().sum() == 2, "One marker per gap"
+    for pos in (2999, 3100, 6999, 7001):
+        assert gapped.index[pos] in sampled.index, "Values around a gap should be kept"
+    assert downsample_series(gapped, 20000).isna().sum() == 101
+
+    print("✓ downsample_series passed")
+
+
+def test_parse_relayout_range():
+    """relayoutData 범위 파싱 테스트"""
+    print("Testing parse_relayout_range...")
+
+    assert parse_relayout_range({'xaxis.range[0]': '2024-01-01', 'xaxis.range[1]': '2024-02-01'}) == \
+        (True, ('2024-01-01', '2024-02-01'))
+    assert parse_relayout_range({'xaxis.autorange': True}) == (True, None)
+    assert parse_relayout_range({'dragmode': 'pan'}) == (False, None)
+    assert parse_relayout_range(None) == (False, None)
+
+    print("✓ parse_relayout_range passed")
+
+
+def test_plan_rendering():
+    """렌더링 방식 결정 테스트"""
+    print("Testing plan_rendering...")
+
+    config = {'max_points_per_trace': 2000, 'webgl_threshold': 20000, 'render_budget': 100000}
+
+    # 작은 차트는 SVG
+    use_webgl, max_points, cost = plan_rendering(2, 365, config)
+    assert not use_webgl and max_points == 2000 and cost == 730
+
+    # 비용이 임계값을 넘으면 WebGL
+    use_webgl, max_points, cost = plan_rendering(20, 3650, config)
+    assert use_webgl and max_points == 2000 and cost == 40000
+
+    # 전체 예산을 넘으면 트레이스당 예산 축소
+    use_webgl, max_points, cost = plan_rendering(200, 3650, config)
+    assert use_webgl and max_points == 500 and cost == 100000
+
+    print("✓ plan_rendering passed")
+
+
+def test_compute_histogram():
+    """히스토그램 구간 계산 테스트"""
+    print("Testing compute_histogram...")
+
+    values = np.array([1.0, 1.5, 2.0, np.nan, 3.0])
+    centers, counts, widths = compute_histogram(values, 2)
+    assert counts.sum() == 4, "NaN should be excluded"
+    assert list(counts) == [2, 2], f"Counts should be [2, 2], got {list(counts)}"
+    assert np.allclose(centers, [1.5, 2.5]) and np.allclose(widths, [1.0, 1.0])
+
+    # 공유 구간
+    edges = histogram_bin_edges(np.array([[0.0, 10.0], [5.0, np.nan]]), 10)
+    assert edges[0] == 0.0 and edges[-1] == 10.0 and len(edges) == 11
+    centers, counts, _ = compute_histogram(np.array([0.5, 9.5]), edges)
+    assert len(centers) == 10 and counts[0] == 1 and counts[-1] == 1
+
+    print("✓ compute_histogram passed")
+
+
+def test_figure_cache():
+    """Figure 캐시 테스트"""
+    print("Testing FigureCache...")
+
+    figure = {'data': [{'type': 'scatter', 'y': np.zeros(1000)}], 'layout': {}}
+    size = estimate_serialized_size(figure)
+    assert size > 1000 * 10, f"Array size should dominate estimate, got {size}"
+
+    cache = FigureCache(max_bytes=size * 2)
+    cache.put('a', figure)
+    cache.put('b', figure)
+    assert cache.get('a') is figure, "Cached figure should be returned"
+
+    # 용량 초과 시 가장 오래 사용하지 않은 항목 제거
+    cache.put('c', figure)
+    assert cache.get('b') is None, "Least recently used entry should be evicted"
+    assert cache.get('a') is figure and cache.get('c') is figure
+
+    stats = cache.stats()
+    assert stats['entries'] == 2 and stats['evictions'] == 1
+    assert stats['hits'] == 3 and stats['misses'] == 1
+    assert abs(stats['hit_rate'] - 0.75) < 1e-9
+
+    print("✓ FigureCache passed")
+
+
+def test_summarize_columns():
+    """벡터화 요약 통계 커널 테스트 (pandas 계산과 비교)"""
+    print("Testing summarize_columns...")
+
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.standard_normal((120, 4)).cumsum(axis=0),
+                      columns=['A', 'B', 'C', 'D'],
+                      index=pd.date_range('2024-01-01', periods=120, freq='D'))
+    df.iloc[::7, 1] = np.nan
+    df.iloc[-3:, 2] = np.nan
+    df['D'] = np.nan
+
+    stats = summarize_frame(df)
+    assert list(stats) == ['A', 'B', 'C'], "Columns without data should be skipped"
+
+    for col in ['A', 'B', 'C']:
+        data = df[col].dropna()
+        expected = {
+            'current': data.iloc[-1], 'mean': data.mean(), 'std': data.std(),
+            'min': data.min(), 'max': data.max(), 'median': data.median(),
+            'q25': data.quantile(0.25), 'q75': data.quantile(0.75),
+        }
+        for name, value in expected.items():
+            assert abs(stats[col][name] - value) < 1e-9, f"{col} {name} mismatch"
+
+    # 변화량이 없는 요약 (날짜 미지정)
+    short = summarize_columns(np.array([1.0, 2.0, 4.0]))
+    assert 'change_1d' not in short
+    assert short['count'][0] == 3 and short['median'][0] == 2.0
+
+    # 날짜 인덱스가 아닌 스프레드는 summarize_frame과 같이 행 위치 기준 변화량
+    positional = calculate_spread_statistics(pd.Series([0.5, 0.6, 0.7, 0.8, 0.9]))
+    assert positional['current'] == 0.9 and abs(positional['change_1d'] - 0.1) < 1e-12
+    assert positional['change_ytd'] == 0.0, "YTD needs dates"
+    assert 'change_1m' in calculate_spread_statistics(df['A'])
+
+    print("✓ summarize_columns passed")
+
+
+def test_horizon_changes():
+    """날짜 기준 변화량 테스트"""
+    print("Testing date-aware horizons...")
+
+    index = pd.date_range('2023-12-20', '2024-03-31', freq='D')
+    values = np.arange(len(index), dtype=float)
+    df = pd.DataFrame({'A': values, 'B': values}, index=index)
+    df.loc['2024-03-30':, 'B'] = np.nan       # B는 3/29(금)이 마지막
+    df.loc['2024-03-24':'2024-03-25', 'A'] = np.nan  # A는 비교 시점 값이 없어 직전 값 사용
+
+    series = df['A'].dropna()
+    stats = summarize_columns(df.to_numpy(dtype=float), df.index.to_numpy(),
+                              {'d7': '7D', 'b1': '1B', 'm1': '1M', 'ytd': 'YTD', 'y1': '1Y'})
+
+    # A: 3/31(일) 기준
+    a_last = series.loc['2024-03-31']
+    assert stats['d7'][0] == a_last - series.loc['2024-03-23']   # 3/24는 NaN → 3/23
+    assert stats['b1'][0] == a_last - series.loc['2024-03-29']   # 일요일의 1영업일 전 = 금요일
+    assert stats['m1'][0] == a_last - series.loc['2024-02-29']   # 말일 조정
+    assert stats['ytd'][0] == a_last - series.loc['2023-12-31']
+    assert stats['y1'][0] == 0.0, "No data a year back"
+
+    # B: 자체 마지막 날짜(3/29) 기준
+    b = df['B'].dropna()
+    assert stats['b1'][1] == b.iloc[-1] - b.loc['2024-03-28']
+    assert stats['d7'][1] == b.iloc[-1] - b.loc['2024-03-22']
+
+    # 통계 딕셔너리에는 설정된 기간 포함
+    records = summarize_frame(df)
+    assert 'change_ytd' in records['A'] and 'change_3m' in records['A']
+
+    # 날짜가 아닌 인덱스(RangeIndex)는 행 위치 기준으로 대체
+    positional = summarize_frame(df.reset_index(drop=True))
+    a_values = df['A'].to_numpy()
+    assert positional['A']['change_1d'] == a_values[-1] - a_values[-2]
+    assert positional['A']['change_1w'] == a_values[-1] - a_values[-6]
+    assert positional['A']['change_1m'] == a_values[-1] - a_values[-22]
+    assert positional['A']['change_ytd'] == 0.0, "YTD needs dates"
+    assert positional['B']['change_1d'] == b.iloc[-1] - b.iloc[-2]
+
+    print("✓ date-aware horizons passed")
+
+
+def test_range_index():
+    """확대 구간 통계 인덱스 테스트 (직접 계산과 비교)"""
+    print("Testing RangeIndex...")
+
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame(rng.standard_normal((500, 3)).cumsum(axis=0) + 100,
+                      index=pd.date_range('2023-01-01', periods=500, freq='D'))
+    df = df.mask(rng.random(df.shape) < 0.1)
+    df[2] = df[2].round()  # 동일값 포함
+
+    index = RangeIndex.from_frame(df, block_size=16)
+    for _ in range(200):
+        lo = int(rng.integers(0, len(df)))
+        hi = int(rng.integers(lo, len(df) + 1))
+        actual = index.summary(lo, hi)
+        expected = summarize_columns(df.to_numpy()[lo:hi])
+        for name in SUMMARY_FIELDS + ('count',):
+            assert np.allclose(actual[name], expected[name], equal_nan=True, atol=1e-6), \
+                f"{name} mismatch for rows {lo}:{hi}"
+
+    # 날짜 구간 변환 (양 끝 포함)
+    lo, hi = index.locate('2023-02-01', '2023-02-28 12:00')
+    assert (lo, hi) == (31, 59)
+
+    # 백분위 순위: 최대값은 100, 최소값은 1/n
+    series = pd.Series([3.0, 1.0, 2.0, 5.0, 4.0], index=pd.date_range('2024-01-01', periods=5))
+    single = RangeIndex(series.index, series.to_numpy())
+    assert single.percentile_rank(0, 5, np.array([5.0]))[0] == 100.0
+    assert single.percentile_rank(0, 5, np.array([1.0]))[0] == 20.0
+    assert abs(single.summary(0, 3)['pct_rank'][0] - 200 / 3) < 1e-9
+
+    # 같은 데이터를 다른 항목 순서로 로드: 키가 같아 캐시된 인덱스를 공유해도 항목별 통계 유지
+    frame = pd.DataFrame({'A': np.arange(10.0), 'B': np.arange(10.0) + 100},
+                         index=pd.date_range('2024-01-01', periods=10))
+    first = frame_to_dataset(frame[['A', 'B']], '2024-01-01', '2024-01-10')
+    second = frame_to_dataset(frame[['B', 'A']], '2024-01-01', '2024-01-10')
+    assert first['key'] == second['key']
+    for dataset in (first, second):
+        cached = get_range_index(('test-order', dataset['key']),
+                                 lambda: RangeIndex.from_frame(dataset_to_frame(dataset)))
+        records = summary_to_records(cached.summary(*cached.locate('2024-01-03', '2024-01-05')),
+                                     cached.columns)
+        assert records['A']['mean'] == 3.0 and records['B']['mean'] == 103.0, \
+            "Zoomed stats should stay with their item regardless of column order"
+
+    print("✓ RangeIndex passed")
+
+
+def test_screen_spreads():
+    """전체 쌍 스프레드 스크리너 테스트 (개별 스프레드 계산과 비교)"""
+    print("Testing screen_spreads...")
+
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame(rng.standard_normal((200, 4)).cumsum(axis=0) + 50,
+                      columns=['A', 'B', 'C', 'D'],
+                      index=pd.date_range('2024-01-01', periods=200, freq='D'))
+    df.iloc[::9, 2] = np.nan
+
+    for operation in ['subtract', 'divide']:
+        result = screen_spreads(df, operation)
+        assert len(result) == 6, "4 items should give 6 pairs"
+
+        zscores = result['zscore'].abs().to_numpy()
+        assert np.all(zscores[:-1] >= zscores[1:]), "Should be sorted by |z-score|"
+
+        for _, row in result.iterrows():
+            spread, _, _ = calculate_spread(df, row['item1'], row['item2'], operation)
+            stats = calculate_spread_statistics(spread)
+            assert abs(row['current'] - stats['current']) < 1e-9
+            assert abs(row['mean'] - stats['mean']) < 1e-9
+            assert abs(row['pct_rank'] - stats['pct_rank']) < 1e-9
+            assert abs(row['change'] - stats['change_1m']) < 1e-9
+            assert abs(row['zscore'] - (stats['current'] - stats['mean']) / stats['std']) < 1e-9
+
+    records = screener_records(screen_spreads(df, 'divide'), 'divide')
+    first = records[0]
+    assert first['label'] == f"{first['item1']} / {first['item2']}"
+    assert first['id'] == f'["{first["item1"]}", "{first["item2"]}"]'
+
+    print("✓ screen_spreads passed")
+
+
+def test_expression_spread():
+    """스프레드 수식 컴파일 테스트"""
+    print("Testing calculate_expression_spread...")
+
+    df = pd.DataFrame({
+        'KR_3Y': [3.0, 3.1, 3.2],
+        'KR_5Y': [3.3, 3.5, 3.4],
+        'KR_10Y': [3.5, 3.6, 3.8],
+        'USD/KRW': [1300.0, 1310.0, 1320.0],
+        'EUR/KRW': [1400.0, 1420.0, 0.0],
+    }, index=pd.date_range('2024-01-01', periods=3))
+
+    # 버터플라이
+    spread, label, _ = calculate_expression_spread(df, '2*KR_5Y -  KR_3Y - KR_10Y')
+    expected = 2 * df['KR_5Y'] - df['KR_3Y'] - df['KR_10Y']
+    assert np.allclose(spread, expected)
+    assert label == '2*KR_5Y - KR_3Y - KR_10Y', "Whitespace should be normalized"
+
+    # '/'가 포함된 항목명, 0으로 나누면 NaN
+    spread, _, _ = calculate_expression_spread(df, '(USD/KRW) / (EUR/KRW)')
+    assert np.allclose(spread[:2], df['USD/KRW'][:2] / df['EUR/KRW'][:2])
+    assert np.isnan(spread.iloc[2])
+
+    # 같은 수식은 캐시된 컴파일 결과 사용
+    assert compile_expression('KR_3Y - KR_5Y', tuple(df.columns)) is \
+        compile_expression('KR_3Y - KR_5Y', tuple(df.columns))
+
+    # 허용되지 않는 구문 거부
+    for text in ['__import__("os")', 'KR_3Y.real', 'KR_3Y + unknown', 'KR_3Y +', '1 + 1', 'KR_3Y if 1 else 2']:
+        try:
+            calculate_expression_spread(df, text)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expression should be rejected: {text}")
+
+    print("✓ calculate_expression_spread passed")
+
+
+def test_rolling_indicators():
+    """롤링 지표 테스트 (pandas rolling 및 증분 계산과 비교)"""
+    print("Testing compute_rolling...")
+
+    rng = np.random.default_rng(11)
+    df = pd.DataFrame(rng.standard_normal((300, 2)).cumsum(axis=0) + 1300,
+                      columns=['USD/KRW', 'KR_3Y'],
+                      index=pd.date_range('2024-01-01', periods=300, freq='D'))
+    df.iloc[::7, 1] = np.nan
+
+    names = indicator_names()
+    result = compute_rolling(df, names)
+    assert set(result) == set(names)
+
+    series = df['KR_3Y'].dropna()
+    diffs = series.diff()
+    gains = diffs.clip(lower=0).rolling(14).mean()
+    losses = (-diffs.clip(upper=0)).rolling(14).mean()
+    expected = {
+        'ma20': series.rolling(20).mean(),
+        'ma60': series.rolling(60).mean(),
+        'bb_upper': series.rolling(20).mean() + 2 * series.rolling(20).std(),
+        'channel_high': series.rolling(20).max(),
+        'channel_low': series.rolling(20).min(),
+        'volatility': diffs.rolling(20).std() * np.sqrt(252),
+        'rsi': 100 - 100 / (1 + gains / losses),
+    }
+    for name, values in expected.items():
+        actual = result[name]['KR_3Y'].dropna()
+        values = values.dropna()
+        assert actual.index.equals(values.index), f"{name} warm-up mismatch"
+        assert np.allclose(actual, values, atol=1e-8), f"{name} mismatch"
+    assert result['ma20']['KR_3Y'].isna().iloc[::7].all(), "Missing rows should stay NaN"
+
+    # 증분 계산: 한 점씩 추가한 값이 전체 계산과 같아야 함 (결측 행, 평평한 구간 포함)
+    flat = df[['KR_3Y']].copy()
+    flat.iloc[100:140, 0] = 1300.0
+    flat.iloc[150:170, 0] = np.nan
+    batch = compute_rolling(flat, names)
+    assert batch['rsi']['KR_3Y'].iloc[130:140].isna().all(), "Flat window RSI should be NaN"
+
+    state = RollingState.from_history(flat['KR_3Y'].to_numpy()[:50])
+    for idx, value in enumerate(flat['KR_3Y'].to_numpy()[50:], start=50):
+        latest = state.append(value)
+        for name in names:
+            expected_value = batch[name]['KR_3Y'].iloc[idx]
+            assert (np.isnan(latest[name]) and np.isnan(expected_value)) or \
+                abs(latest[name] - expected_value) < 1e-6, f"Incremental {name} mismatch at {idx}"
+
+    print("✓ compute_rolling passed")
+
+
+def test_correlation():
+    """상관계수 행렬/롤링 상관계수 테스트 (pandas와 비교)"""
+    print("Testing correlation...")
+
+    rng = np.random.default_rng(21)
+    base = rng.standard_normal((400, 1))
+    df = pd.DataFrame(base + 0.5 * rng.standard_normal((400, 6)),
+                      columns=[f"S{idx}" for idx in range(6)],
+                      index=pd.date_range('2024-01-01', periods=400, freq='D')).cumsum()
+    df.iloc[::5, 1] = np.nan
+    df.iloc[:150, 4] = np.nan
+    df['S5'] = 1.0
+
+    for method in ['level', 'change']:
+        values = df.diff() if method == 'change' else df
+        expected = values.corr(min_periods=20).to_numpy()
+        actual = correlation_matrix(values.to_numpy())
+        assert np.allclose(actual, expected, atol=1e-10, equal_nan=True), f"{method} corr mismatch"
+
+    corr, labels = correlation_frame(df, 'change')
+    assert sorted(labels) == sorted(df.columns), "Cluster order should be a permutation"
+    # 변화량은 일간 변화량 차트와 같은 값 (휴일 다음 날도 직전 유효값 대비로 남음)
+    changes = calculate_daily_changes(df)
+    assert changes['S1'].count() > df['S1'].diff().count()
+    expected = changes[labels].corr(min_periods=20).to_numpy()
+    assert np.allclose(corr, expected, atol=1e-10, equal_nan=True)
+
+    # 롤링 상관계수: 두 항목이 모두 유효한 관측치 기준
+    pair = df[['S0', 'S1']].dropna()
+    expected = pair['S0'].rolling(30).corr(pair['S1'])
+    actual = pd.Series(rolling_correlation(df['S0'].to_numpy(), df['S1'].to_numpy(), 30),
+                       index=df.index).loc[pair.index]
+    assert np.allclose(actual, expected, atol=1e-8, equal_nan=True), "Rolling corr mismatch"
+
+    # 증분 계산: 한 쌍씩 추가한 값이 전체 계산과 같아야 함 (결측 쌍, 평평한 구간, min_periods)
+    x, y = df['S0'].to_numpy().copy(), df['S1'].to_numpy().copy()
+    x[190:250] = 1.5
+    for min_periods in (None, 10):
+        batch = rolling_correlation(x, y, 30, min_periods)
+        state = RollingCorrelation(30, min_periods)
+        incremental = np.array([state.append(a, b) for a, b in zip(x, y)])
+        assert np.allclose(incremental, batch, atol=1e-8, equal_nan=True), "Incremental corr mismatch"
+        assert np.isnan(incremental[np.isnan(y)]).all(), "Missing pairs should be NaN"
+    assert np.isnan(batch[240:250]).all(), "Flat window should be NaN"
+    assert not np.isnan(batch[15:29][~np.isnan(y[15:29])]).any(), "min_periods should fill the warm-up"
+
+    print("✓ correlation passed")
+
+
+def test_calculate_daily_changes():
+    """일간 변화량 테스트 (직전 유효 관측치 대비)"""
+    print("Testing calculate_daily_changes...")
+
+    df = pd.DataFrame({
+        'USD/KRW': [1300.0, 1305.0, np.nan, 1302.0, 1310.0],
+        'KR_3Y': [np.nan, 3.50, 3.55, np.nan, 3.40],
+    }, index=pd.date_range('2024-01-01', periods=5, freq='D'))
+
+    changes = calculate_daily_changes(df)
+    expected = {col: df[col].dropna().diff() for col in df.columns}
+    for col in df.columns:
+        assert changes[col].dropna().index.equals(expected[col].dropna().index)
+        assert np.allclose(changes[col].dropna(), expected[col].dropna())
+
+    assert np.isnan(changes.loc['2024-01-03', 'USD/KRW']), "Missing rows stay NaN"
+    assert abs(changes.loc['2024-01-04', 'USD/KRW'] - (-3.0)) < 1e-9, "Compare with last valid value"
+
+    print("✓ calculate_daily_changes passed")
+
+
+def test_catalog_index():
+    """항목 카탈로그 인덱스 테스트 (분류, 검색, 드롭다운 옵션)"""
+    print("Testing CatalogIndex...")
+
+    categories = {
+        '금리': {
+            '국고채': ['KR_3Y', 'KR_5Y', 'KR_10Y'],
+            '미국채': ['US_2Y', 'US_10Y'],
+        },
+        '환율': {
+            '주요 통화': ['USD/KRW', 'EUR/KRW', 'JPY/KRW'],
+            '크로스': ['EUR/USD', 'USD/JPY'],
+        }
+    }
+    catalog = CatalogIndex(categories)
+
+    assert catalog.lookup['EUR/USD'] == ('exchange_rate', '크로스')
+    assert catalog.classify(['USD/KRW', 'KR_3Y', 'UNKNOWN', 'US_10Y']) == (['KR_3Y', 'US_10Y'], ['USD/KRW'])
+    assert catalog.category_lists() == {'금리': ['국고채', '미국채'], '환율': ['주요 통화', '크로스']}
+
+    assert catalog.search('usd')[:2] == ['USD/KRW', 'USD/JPY'], "Name prefix should rank first"
+    assert set(catalog.search('usd')) == {'USD/KRW', 'USD/JPY', 'EUR/USD'}
+    assert catalog.search('10y') == ['KR_10Y', 'US_10Y'], "Token prefix matches in catalog order"
+    assert catalog.search('krw', data_type='exchange_rate', categories=['주요 통화']) == \
+        ['USD/KRW', 'EUR/KRW', 'JPY/KRW']
+    assert catalog.search('usd', data_type='interest_rate') == []
+    assert 'USD/KRW' in catalog.search('usd-krw'), "Trigram overlap should find near matches"
+    assert len(catalog.search('', limit=3)) == 3
+
+    options = catalog.options('jpy', selected=['KR_3Y'])
+    assert [opt['value'] for opt in options] == ['KR_3Y', 'JPY/KRW', 'USD/JPY'], \
+        "Selected items should stay in options"
+
+    print("✓ CatalogIndex passed")
+
+
+def test_shared_dataset_registry():
+    """공유 메모리 데이터셋 테스트 (다른 저장소 인스턴스에서 복사 없이 조회, 참조 수 정리)"""
+    print("Testing SharedDatasetRegistry...")
+    import tempfile
+    from multiprocessing import shared_memory
+
+    dates = pd.date_range('2024-01-01', periods=5, freq='D')
+    df = pd.DataFrame({'KR_3Y': [3.0, 3.1, np.nan, 3.3, 3.4],
+                       'USD/KRW': [1300.0, 1301.0, 1302.0, 1303.0, 1304.0]}, index=dates)
+
+    lock_path = os.path.join(tempfile.gettempdir(), f'dashplot_test_{os.getpid()}.lock')
+    prefix = f'dashplot_test_{os.getpid()}_'
+    owner = SharedDatasetRegistry(prefix, 2, lock_path)
+    worker = SharedDatasetRegistry(prefix, 2, lock_path)
+
+    try:
+        assert worker.get('k1') is None
+        owner.put('k1', df)
+        shared = worker.get('k1')
+        pd.testing.assert_frame_equal(shared, df, check_freq=False)
+        assert not shared.to_numpy().flags.writeable, "Shared view should be read-only"
+
+        # 밀려난 데이터셋은 참조를 반납하고, 마지막 참조가 사라지면 블록 삭제
+        owner.put('k2', df)
+        owner.put('k3', df)
+        worker.release_all()
+        try:
+            shared_memory.SharedMemory(name=owner.block_name('k1', 'v'))
+            assert False, "Block should be unlinked after last release"
+        except FileNotFoundError:
+            pass
+        assert owner.get('k3') is not None
+    finally:
+        owner.release_all()
+        worker.release_all()
+        os.remove(lock_path)
+
+    # 항목 순서만 다른 데이터셋은 키가 같아 공유 블록을 재사용하지만 컬럼은 요청 순서대로
+    registry = get_dataset_registry()
+    if registry is not None:
+        first = frame_to_dataset(df[['KR_3Y', 'USD/KRW']], '2024-01-01', '2024-01-05')
+        second = frame_to_dataset(df[['USD/KRW', 'KR_3Y']], '2024-01-01', '2024-01-05')
+        try:
+            assert list(load_dataset_frame(first).columns) == ['KR_3Y', 'USD/KRW']
+            permuted = load_dataset_frame(second)
+            assert list(permuted.columns) == ['USD/KRW', 'KR_3Y'], "Columns should follow dataset['series']"
+            pd.testing.assert_frame_equal(permuted, df[['USD/KRW', 'KR_3Y']], check_freq=False)
+        finally:
+            registry.release_all()
+
+    print("✓ SharedDatasetRegistry passed")
+
+
+def test_response_cache():
+    """API 응답 캐시 테스트 (메모리/디스크 계층, 종료일 기준 만료, 클라이언트 연동)"""
+    print("Testing ResponseCache...")
+    import tempfile
+    from datetime import date
+
+    today = date(2024, 6, 10)
+    assert entry_ttl('2024-06-07', 300, None, today) is None, "Closed dates never expire"
+    assert entry_ttl('2024-06-10', 300, None, today) == 300, "Current day is short-lived"
+
+    now = [1000.0]
+    dates = pd.date_range('2024-01-01', periods=4, freq='D')
+    df = pd.DataFrame({'KR_3Y': [3.0, np.nan, 3.2, 3.3], 'US_10Y': [4.0, 4.1, 4.2, 4.3]}, index=dates)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite')
+        cache = ResponseCache(path, 10_000, 1_000_000, 300, clock=lambda: now[0])
+        cache.put('frame', df, ttl=None)
+        cache.put('today', {'KR_3Y': {'current': 3.3}}, ttl=300)
+        pd.testing.assert_frame_equal(cache.get('frame'), df, check_freq=False)
+
+        # 재시작: 디스크에서 warm-up, 당일 항목은 만료
+        restarted = ResponseCache(path, 10_000, 1_000_000, 300, clock=lambda: now[0])
+        assert restarted.warm(1_000_000) == 2
+        now[0] += 301
+        assert restarted.get('today') is None
+        pd.testing.assert_frame_equal(restarted.get('frame'), df, check_freq=False)
+        stats = restarted.stats()
+        assert stats['memory_hits'] == 1 and stats['expirations'] == 1 and stats['misses'] == 1
+
+        # 메모리 한도를 넘으면 오래된 항목 제거, 디스크 계층에서 다시 조회
+        small = ResponseCache(path, 200, 1_000_000, 300, clock=lambda: now[0])
+        small.put('a', df)
+        small.put('b', df)
+        assert small.stats()['evictions'] == 1
+        assert small.get('a') is not None and small.stats()['disk_hits'] == 1
+
+        # warm-up 예산: 가장 최근 항목부터 예산 안에 드는 것만 로드
+        now[0] += 1
+        small.put('c', df)
+        budgeted = ResponseCache(path, 10_000, 1_000_000, 300, clock=lambda: now[0])
+        assert budgeted.warm(len(encode_frame(df))) == 1
+        assert budgeted.stats()['bytes'] == len(encode_frame(df))
+        assert budgeted.get('c') is not None and budgeted.stats()['memory_hits'] == 1
+
+        class FakeSession:
+            calls = 0
+
+            def get(self, url, params=None):
+                FakeSession.calls += 1
+                payload = {'status': 'success', 'data': {
+                    'dates': ['2024-01-01', '2024-01-02'],
+                    'series': {'KR_3Y': {'values': [3.0, 3.1]}}}}
+                return type('Response', (), {'raise_for_status': lambda self: None,
+                                             'json': lambda self: payload})()
+
+        client = APIClient('http://api', cache=ResponseCache(
+            os.path.join(tmp, 'client.sqlite'), 1_000_000, 1_000_000, 300))
+        client.session = FakeSession()
+        first = client.get_interest_rates(['KR_3Y'], '2024-01-01', '2024-01-02')
+        second = client.get_interest_rates(['KR_3Y'], '2024-01-01', '2024-01-02')
+        assert FakeSession.calls == 1, "Second request should be served from cache"
+        pd.testing.assert_frame_equal(first, second)
+
+        # fork 후 워커: 마스터의 세션/SQLite 연결을 공유하지 않고 새로 생성, warm-up 항목은 유지
+        inherited = client.cache._db()
+        client.reset_after_fork()
+        assert isinstance(client.session, requests.Session)
+        assert client.cache.stats()['memory_hits'] == 0 and client.cache._conn is None
+        pd.testing.assert_frame_equal(
+            client.get_interest_rates(['KR_3Y'], '2024-01-01', '2024-01-02'), first)
+        assert client.cache._db() is not inherited
+
+        # 오늘까지의 조회: 어제까지는 만료 없이 저장하고 만료 후에는 오늘 구간만 다시 조회
+        class RangeSession:
+            requests = []
+
+            def get(self, url, params=None):
+                RangeSession.requests.append((params['start_date'], params['end_date']))
+                days = pd.date_range(params['start_date'], params['end_date'] or date.today())
+                payload = {'status': 'success', 'data': {
+                    'dates': [d.strftime('%Y-%m-%d') for d in days],
+                    'series': {'KR_3Y': {'values': [float(d.day) for d in days]}}}}
+                return type('Response', (), {'raise_for_status': lambda self: None,
+                                             'json': lambda self: payload})()
+
+        now[0] = 1000.0
+        client = APIClient('http://api', cache=ResponseCache(
+            os.path.join(tmp, 'split.sqlite'), 1_000_000, 1_000_000, 300, clock=lambda: now[0]))
+        client.session = RangeSession()
+        start, end = (date.today() - pd.Timedelta(days=5)).isoformat(), date.today().isoformat()
+        merged = client.get_interest_rates(['KR_3Y'], start, end)
+        assert len(merged) == 6 and merged.index.is_monotonic_increasing
+        assert RangeSession.requests == [
+            (start, (date.today() - pd.Timedelta(days=1)).isoformat()), (end, end)]
+        now[0] += 301
+        pd.testing.assert_frame_equal(client.get_interest_rates(['KR_3Y'], start, end), merged)
+        assert RangeSession.requests[2:] == [(end, end)], "Only the open tail is re-fetched"
+        assert split_at_today('2024-01-01', '2024-01-31', date(2024, 6, 10)) == [
+            ('2024-01-01', '2024-01-31')]
+
+    print("✓ ResponseCache passed")
+
+
+def test_metrics_registry():
+    """성능 지표 테스트 (누적 버킷, 라벨, 클라이언트 엔드포인트 지연 시간)"""
+    print("Testing MetricsRegistry...")
+
+    registry = MetricsRegistry(latency_buckets=(0.1, 1.0), size_buckets=(1024,))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        registry.callback_seconds.observe(('update_spread_chart',), value)
+    registry.callback_requests.inc(('update_spread_chart', '200'))
+
+    class Client:
+        def get_interest_rates(self, items, start_date, end_date):
+            return {}
+
+        def get_statistics(self, data_type, items, start_date, end_date):
+            # Mock 클라이언트처럼 내부에서 다른 계측 메서드 호출
+            return self.get_interest_rates(items, start_date, end_date)
+
+    client = Client()
+    instrument_client(client, registry)
+    client.get_statistics('interest_rate', ['KR_3Y'], '2024-01-01', '2024-01-31')
+    registry.add_gauges('dash_figure_cache', 'Figure cache statistics.', lambda: {'hits': 3})
+
+    lines = registry.render().splitlines()
+    assert 'dash_callback_duration_seconds_bucket{callback="update_spread_chart",le="0.1"} 2' in lines, \
+        "Upper bounds are inclusive"
+    assert 'dash_callback_duration_seconds_bucket{callback="update_spread_chart",le="1"} 3' in lines
+    assert 'dash_callback_duration_seconds_bucket{callback="update_spread_chart",le="+Inf"} 4' in lines
+    assert 'dash_callback_duration_seconds_count{callback="update_spread_chart"} 4' in lines
+    assert 'dash_callback_requests_total{callback="update_spread_chart",status="200"} 1' in lines
+    assert 'dash_upstream_request_duration_seconds_count{endpoint="statistics"} 1' in lines
+    assert not any('endpoint="interest-rates"' in line for line in lines), "Nested calls should not be timed"
+    assert f'dash_figure_cache{{worker="{os.getpid()}",stat="hits"}} 3' in lines
+
+    # 멀티 워커: 살아 있는 워커의 스냅샷을 합산, 종료된 워커의 파일은 삭제
+    import json
+    import subprocess
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        shared = MetricsRegistry((0.1, 1.0), (1024,), directory=tmp)
+        shared.callback_requests.inc(('update_spread_chart', '200'), 2)
+        shared.add_gauges('dash_figure_cache', 'Figure cache statistics.', lambda: {'hits': 3})
+
+        other = MetricsRegistry((0.1, 1.0), (1024,)).snapshot()
+        other['metrics']['dash_callback_requests_total'] = [[['update_spread_chart', '200'], 5]]
+        dead = subprocess.Popen([sys.executable, '-c', 'pass'])
+        dead.wait()
+        for pid in (os.getppid(), dead.pid):
+            with open(os.path.join(tmp, f'{pid}.json'), 'w', encoding='utf-8') as f:
+                json.dump(dict(other, pid=pid), f)
+
+        lines = shared.render().splitlines()
+        assert 'dash_callback_requests_total{callback="update_spread_chart",status="200"} 7' in lines, \
+            "Counters should be summed over live workers only"
+        assert 'dash_metrics_workers 2' in lines
+        assert f'dash_figure_cache{{worker="{os.getpid()}",stat="hits"}} 3' in lines
+        assert not os.path.exists(os.path.join(tmp, f'{dead.pid}.json')), "Dead worker file should be removed"
+
+    print("✓ MetricsRegistry passed")
+
+
+def test_slowest_calls():
+    """프로파일 보관 테스트 (가장 느린 k개만 유지, 밀려난 파일 삭제, 요청 본문 저장)"""
+    print("Testing SlowestCalls...")
+    import cProfile
+    import json
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        slowest = SlowestCalls(size=2, max_age=3600)
+        body = {'output': 'spread-chart.figure', 'inputs': [{'id': 'spread-item1', 'value': 'KR_3Y'}]}
+        paths = {}
+        for elapsed in (0.3, 0.1, 0.5):
+            profiler = cProfile.Profile()
+            profiler.enable()
+            sum(range(1000))
+            profiler.disable()
+            path = dump_call(tmp, 'update_spread_chart', elapsed, time.time(), profiler, body)
+            paths[elapsed] = path
+            slowest.add(ProfiledCall('update_spread_chart', elapsed, time.time(), path))
+
+        assert [call['elapsed_ms'] for call in slowest.snapshot()] == [500.0, 300.0]
+        assert not slowest.admits(0.2), "Faster calls should not be dumped once full"
+        assert not os.path.exists(paths[0.1] + '.prof'), "Evicted profile should be deleted"
+        with open(paths[0.5] + '.json', encoding='utf-8') as f:
+            assert json.load(f)['body'] == body, "Triggering inputs should be saved for replay"
+
+        # 헤더로 요청한 프로파일은 최근 k개만 보관, 목록에는 파일 이름만
+        recent = RecentCalls(size=1, max_age=3600)
+        recent.add(ProfiledCall('update_spread_chart', 0.3, time.time(), paths[0.3]))
+        recent.add(ProfiledCall('update_spread_chart', 0.5, time.time(), paths[0.5]))
+        assert not os.path.exists(paths[0.3] + '.prof'), "Older requested profile should be deleted"
+        assert os.path.exists(paths[0.5] + '.prof')
+        assert slowest.snapshot()[0]['profile'] == os.path.basename(paths[0.5]) + '.prof'
+
+    print("✓ SlowestCalls passed")
+
+
+def test_benchmark_compare():
+    """벤치마크 기준선 비교 테스트 (비율과 최소 차이를 모두 넘을 때만 회귀)"""
+    print("Testing benchmark compare...")
+
+    def result(seconds, peak_bytes):
+        return {'results': {'5Y/20': {'normalize_data': {'seconds': seconds, 'peak_bytes': peak_bytes}}}}
+
+    baseline = result(0.100, 10 * 1024 * 1024)
+    assert compare_benchmarks(result(0.120, 10 * 1024 * 1024), baseline, 0.25) == []
+    assert len(compare_benchmarks(result(0.200, 10 * 1024 * 1024), baseline, 0.25)) == 1
+    assert len(compare_benchmarks(result(0.100, 20 * 1024 * 1024), baseline, 0.25)) == 1
+    assert compare_benchmarks(result(0.002, 1024), result(0.001, 512), 0.25) == [], \
+        "Tiny absolute changes should be ignored as noise"
+    assert compare_benchmarks(result(1.0, 0), {'results': {}}, 0.25) == [], "New cases have no baseline"
+
+    # 운영 콜백은 build_* 빌더를 사용하므로 검증 빌더(create_*)는 회귀 판정에서 제외
+    def stage(name, seconds):
+        return {'results': {'5Y/20': {name: {'seconds': seconds, 'peak_bytes': 0}}}}
+
+    assert compare_benchmarks(stage('create_timeseries_chart', 1.0),
+                              stage('create_timeseries_chart', 0.1), 0.25) == []
+    assert len(compare_benchmarks(stage('build_timeseries_figure', 1.0),
+                                  stage('build_timeseries_figure', 0.1), 0.25)) == 1
+
+    print("✓ benchmark compare passed")
+
+
 if __name__ == '__main__':
     print("\n" + "="*50)
     print("Running utility function tests...")
@@ -153,6 +1005,28 @@ if __name__ == '__main__':
         test_calculate_spread_statistics()
         test_classify_items_by_type()
         test_should_use_secondary_axis()
+        test_dataset_roundtrip()
+        test_dataset_key()
+        test_diff_selection()
+        test_downsample_series()
+        test_parse_relayout_range()
+        test_plan_rendering()
+        test_compute_histogram()
+        test_figure_cache()
+        test_summarize_columns()
+        test_horizon_changes()
+        test_range_index()
+        test_screen_spreads()
+        test_expression_spread()
+        test_rolling_indicators()
+        test_correlation()
+        test_calculate_daily_changes()
+        test_catalog_index()
+        test_shared_dataset_registry()
+        test_response_cache()
+        test_metrics_registry()
+        test_slowest_calls()
+        test_benchmark_compare()
 
         print("\n" + "="*50)
         print("All tests passed! ✓")
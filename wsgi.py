@@ -0,0 +1,13 @@
+"""
+운영 서버용 WSGI 엔트리포인트
+
+    gunicorn -c gunicorn.conf.py wsgi:server
+"""
+
+import logging
+from app.factory import create_app
+
+logging.basicConfig(level=logging.INFO)
+
+app = create_app()
+server = app.server